@@ -0,0 +1,273 @@
+import argparse
+import concurrent.futures
+import functools
+import glob
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+
+class FileResult(NamedTuple):
+    """
+    Result of the processing of a .data file.
+
+    path: str
+        The processed file.
+
+    output: str or None
+        The written file, None if the dataset was not exported.
+
+    error: str or None
+        The error which stopped the processing, None if it succeeded.
+
+    size: int
+        Size of the processed file in bytes.
+
+    timings: dict
+        Duration in seconds of each step: read, parse, transform, validate and export.
+    """
+
+    path: str
+    output: str | None
+    error: str | None
+    size: int
+    timings: dict
+
+
+def collect_files(inputs):
+    """
+    Returns the .data files designated by `inputs`, sorted and without duplicates.
+
+    Each input is a file, a directory (whose .data files are searched recursively) or a glob
+    pattern, e.g. "cases/**/*.data".
+    """
+    files = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files.update(path.rglob("*.data"))
+        elif path.is_file():
+            files.add(path)
+        else:
+            files.update(Path(match) for match in glob.glob(item, recursive=True))
+    return sorted(file.resolve() for file in files if file.is_file())
+
+
+@functools.cache
+def load_transform(spec):
+    """
+    Returns the function designated by `spec`, "module:function" or "file.py:function".
+
+    The function is called with each parsed dataset. It modifies it in place, e.g. with
+    `ta.change_read_object`, or returns a new dataset.
+    """
+    target, _, name = spec.rpartition(":")
+    if not target or not name:
+        raise ValueError(f"invalid transform {spec!r}, expected module:function")
+    if target.endswith(".py"):
+        module_spec = importlib.util.spec_from_file_location(Path(target).stem, target)
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(target)
+    return getattr(module, name)
+
+
+def validate(dataset):
+    """
+    Checks that the export of `dataset` can be read again and is exported identically.
+
+    Raises
+    ------
+    ValueError:
+        If the dataset is not stable through an export and a new parsing.
+    """
+    from .dataset_io import dataset_text, parse_dataset
+
+    text, _ = dataset_text(dataset)
+    text_again, _ = dataset_text(parse_dataset(text))
+    if text != text_again:
+        raise ValueError("the exported dataset is not read back identically")
+
+
+def process_file(path, output=None, transform=None, check=True):
+    """
+    Parses a .data file, applies a transform, validates and exports the dataset.
+
+    ----------
+    Parameters
+
+    path: str
+        The processed file.
+
+    output: str, optional
+        Destination of the exported dataset, not exported if None.
+
+    transform: str, optional
+        Transform applied to the dataset, see `load_transform`.
+
+    check: bool
+        If True, the dataset is validated with `validate` before being exported.
+
+    Returns
+    -------
+    FileResult:
+        The timings of each step, and the error if a step failed.
+    """
+    from .dataset_io import parse_dataset, write_dataset
+
+    timings = {}
+    size = 0
+    step = "read"
+    try:
+        start = time.perf_counter()
+        text = Path(path).read_text()
+        size = len(text.encode("utf-8"))
+        timings[step] = time.perf_counter() - start
+
+        step = "parse"
+        start = time.perf_counter()
+        dataset = parse_dataset(text)
+        timings[step] = time.perf_counter() - start
+
+        if transform is not None:
+            step = "transform"
+            start = time.perf_counter()
+            result = load_transform(transform)(dataset)
+            if result is not None:
+                dataset = result
+            timings[step] = time.perf_counter() - start
+
+        if check:
+            step = "validate"
+            start = time.perf_counter()
+            validate(dataset)
+            timings[step] = time.perf_counter() - start
+
+        if output is not None:
+            step = "export"
+            start = time.perf_counter()
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+            write_dataset(dataset, output)
+            timings[step] = time.perf_counter() - start
+    except Exception as error:
+        return FileResult(str(path), None, f"{step}: {error}", size, timings)
+    return FileResult(str(path), output, None, size, timings)
+
+
+def output_path(path, root, output_dir, in_place):
+    # The files keep their path relative to the common root of the inputs
+    if in_place:
+        return str(path)
+    if output_dir is None:
+        return None
+    return str(Path(output_dir) / path.relative_to(root))
+
+
+def format_result(result):
+    """Returns the line printed for a processed file."""
+    total = sum(result.timings.values())
+    steps = " ".join(
+        f"{step}={duration:.3f}s" for step, duration in result.timings.items()
+    )
+    status = "ok" if result.error is None else f"FAILED ({result.error})"
+    return f"{result.path}: {status} in {total:.3f}s [{steps}]"
+
+
+def positive_int(text):
+    """Argument type of the options expecting a number of at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(
+            f"expected a number of at least 1, got {value}"
+        )
+    return value
+
+
+def main(argv=None):
+    """
+    Validates, transforms and exports many .data files in parallel, without the GUI.
+    """
+    parser = argparse.ArgumentParser(
+        prog="triogui-batch",
+        description="Parse, validate, transform and export .data files in parallel.",
+    )
+    parser.add_argument("inputs", nargs="+", help=".data files, directories or globs")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("-o", "--output", help="directory of the exported datasets")
+    target.add_argument(
+        "--in-place", action="store_true", help="overwrite the input files"
+    )
+    parser.add_argument(
+        "--transform", help="function applied to each dataset, module:function"
+    )
+    parser.add_argument(
+        "--no-validate", action="store_true", help="skip the round trip validation"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=os.cpu_count() or 1,
+        help="number of processes",
+    )
+    parser.add_argument("--json", help="file where the results are written")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.inputs)
+    if not files:
+        print("No .data file found", file=sys.stderr)
+        return 1
+    root = Path(os.path.commonpath([file.parent for file in files]))
+    if args.transform is not None:
+        # Fail early, before spawning the workers
+        load_transform(args.transform)
+
+    start = time.perf_counter()
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [
+            executor.submit(
+                process_file,
+                str(file),
+                output_path(file, root, args.output, args.in_place),
+                args.transform,
+                not args.no_validate,
+            )
+            for file in files
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(format_result(result))
+    elapsed = time.perf_counter() - start
+
+    failures = [result for result in results if result.error is not None]
+    size = sum(result.size for result in results)
+    print(
+        f"{len(results)} files ({size / 1e6:.1f} MB) in {elapsed:.2f}s with {args.jobs} "
+        f"processes: {len(results) / elapsed:.1f} files/s, {size / 1e6 / elapsed:.2f} MB/s, "
+        f"{len(failures)} failed"
+    )
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(
+                {
+                    "elapsed": elapsed,
+                    "jobs": args.jobs,
+                    "files": [result._asdict() for result in results],
+                },
+                file,
+                indent=2,
+            )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
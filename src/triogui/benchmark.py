@@ -0,0 +1,568 @@
+import argparse
+import concurrent.futures
+import gc
+import json
+import multiprocessing
+import resource
+import sys
+import time
+import tracemalloc
+from typing import NamedTuple
+
+# Datasets measured by default, in addition to a few examples of trioapi.data
+DEFAULT_DATASETS = ("synthetic:10,20,3",)
+
+# Relative increase of the time or memory above the baseline reported as a regression
+DEFAULT_TOLERANCE = 0.25
+
+
+class Measurement(NamedTuple):
+    """
+    Cost of a benchmark scenario on a dataset.
+
+    scenario: str
+        Name of the scenario, a key of SCENARIOS.
+
+    dataset: str
+        The dataset, as given to `make_dataset`.
+
+    seconds: float
+        Wall time of the scenario.
+
+    peak_rss_kb: int
+        Peak resident memory of the process running the scenario, in kB.
+
+    widgets: int
+        Number of widget models created by the scenario.
+    """
+
+    scenario: str
+    dataset: str
+    seconds: float
+    peak_rss_kb: int
+    widgets: int
+
+
+def widget_count():
+    """Returns the number of widget models created in the process and not closed."""
+    from ipywidgets.widgets import widget
+
+    instances = getattr(widget, "_instances", None)
+    if instances is None:
+        instances = widget.Widget.widgets
+    return len(instances)
+
+
+def synthetic_object(model_class, depth, items):
+    """
+    Returns an instance of `model_class` whose nested objects are filled down to `depth`.
+
+    The lists of the first level get `items` items, deeper lists a single one. The first
+    proposed type is used for polymorphic attributes. Attributes which cannot be set are
+    left empty.
+    """
+    from .ui.widgets import schema
+
+    try:
+        obj = model_class()
+    except Exception:
+        return None
+    if depth <= 0:
+        return obj
+    for field in schema.get_fields(model_class):
+        if not hasattr(field.true_type, "model_fields"):
+            continue
+        classes = (
+            schema.get_select_index(field.true_type).classes
+            if schema.has_subclasses(field.true_type)
+            else (field.true_type,)
+        )
+        if not classes:
+            continue
+        if field.is_list:
+            value = [synthetic_object(classes[0], depth - 1, 1) for _ in range(items)]
+            value = [item for item in value if item is not None]
+        else:
+            value = synthetic_object(classes[0], depth - 1, 1)
+        if value is None or value == []:
+            continue
+        try:
+            setattr(obj, field.name, value)
+        except Exception:
+            pass
+    return obj
+
+
+def synthetic_dataset(problems, items, depth):
+    """
+    Returns a dataset of `problems` problems, each filled by `synthetic_object`.
+    """
+    import trioapi as ta
+
+    from .ui.widgets import schema
+
+    problem_class = next(
+        cls
+        for cls in schema.get_subclass_index("Pb_base").classes
+        if synthetic_object(cls, 0, 0) is not None
+    )
+    dataset = ta.trustify_gen_pyd.Dataset()
+    dataset.entries.append(ta.trustify_gen_pyd.Dimension(dim=2))
+    dataset.entries.append(ta.trustify_gen_pyd.Fin())
+    for index in range(problems):
+        problem = synthetic_object(problem_class, depth, items)
+        ta.add_object(dataset, problem, f"pb_{index}")
+    return dataset
+
+
+def make_dataset(spec):
+    """
+    Returns the dataset designated by `spec`: the name of an example of trioapi.data, or
+    "synthetic:N,M,D" for `synthetic_dataset(N, M, D)`.
+    """
+    from .dataset_io import load_example
+
+    if spec.startswith("synthetic:"):
+        problems, items, depth = (int(value) for value in spec[10:].split(","))
+        return synthetic_dataset(problems, items, depth)
+    return load_example(spec)
+
+
+def edited_objects(dataset):
+    """Returns the problems and schemes of a dataset, as displayed in the tabs."""
+    import trioapi as ta
+
+    return [obj for _, obj in ta.get_read_pb(dataset) + ta.get_read_sch(dataset)]
+
+
+def inline_field(obj):
+    # First displayed primitive attribute of obj which is set, None if there is none
+    from .ui.widgets import schema
+
+    for field in schema.get_fields(type(obj)):
+        if field.inline and getattr(obj, field.name) is not None:
+            return field
+    return None
+
+
+def find_text_field(widget):
+    # First text field of a widget tree holding a value, depth first
+    import ipyvuetify as v
+
+    if isinstance(widget, v.TextField) and widget.v_model not in (None, ""):
+        return widget
+    for child in getattr(widget, "children", None) or []:
+        found = find_text_field(child)
+        if found is not None:
+            return found
+    return None
+
+
+def scenario_main_app(dataset):
+    from .ui.widgets.main_app import MainApp
+
+    # The modules are imported beforehand, only the construction of the app is measured
+    def run():
+        return MainApp()
+
+    return run
+
+
+def scenario_load_dataset(dataset):
+    from .ui.widgets.main_app import MainApp
+
+    app = MainApp()
+
+    def run():
+        app.hw.dataset = dataset
+        app.hw.update_dataset()
+
+    return run
+
+
+def scenario_open_sections(dataset):
+    from .ui.widgets.main_app import MainApp
+
+    app = MainApp()
+    app.hw.dataset = dataset
+    app.hw.update_dataset()
+
+    def run():
+        app.hw.sections_panels.v_model = list(range(len(app.hw.sections)))
+
+    return run
+
+
+def scenario_object_widget(dataset):
+    from .ui.widgets.object import ObjectWidget
+
+    objects = edited_objects(dataset)
+    return lambda: [ObjectWidget(obj) for obj in objects]
+
+
+def scenario_object_widget_full(dataset):
+    from .ui.widgets.object import ObjectWidget
+
+    objects = edited_objects(dataset)
+
+    def run():
+        # Every nested panel is rendered, as if the user expanded all of them
+        ObjectWidget.lazy = False
+        try:
+            return [ObjectWidget(obj) for obj in objects]
+        finally:
+            ObjectWidget.lazy = True
+
+    return run
+
+
+def scenario_list_widget(dataset):
+    from .ui.widgets import schema
+    from .ui.widgets.history import ChangeHistory
+    from .ui.widgets.list_widget import ListWidget
+
+    lists = [
+        (obj, field)
+        for obj in edited_objects(dataset)
+        for field in schema.get_fields(type(obj))
+        if field.is_list
+        and hasattr(field.true_type, "model_fields")
+        and getattr(obj, field.name)
+    ]
+    if not lists:
+        return None
+    return lambda: [
+        ListWidget(
+            getattr(obj, field.name),
+            field.true_type,
+            obj,
+            [field.name],
+            ChangeHistory(obj),
+        )
+        for obj, field in lists
+    ]
+
+
+def scenario_edit(dataset):
+    from .ui.widgets.object import ObjectWidget
+
+    for obj in edited_objects(dataset):
+        text_field = find_text_field(ObjectWidget(obj).layout)
+        if text_field is not None:
+            break
+    else:
+        return None
+    # The value keeps its kind, numeric fields are converted when committed
+    value = text_field.v_model
+    try:
+        new_value = type(value)(float(value) + 1)
+    except ValueError:
+        new_value = f"{value}_"
+
+    def run():
+        # The fields commit their value to the object when they lose the focus
+        text_field.v_model = new_value
+        text_field.fire_event("blur", None)
+
+    return run
+
+
+def scenario_undo(dataset):
+    from .ui.widgets.history import Change
+    from .ui.widgets.object import ObjectWidget
+
+    for obj in edited_objects(dataset):
+        field = inline_field(obj)
+        if field is not None:
+            break
+    else:
+        return None
+    obj_widget = ObjectWidget(obj)
+    value = getattr(obj, field.name)
+    obj_widget.history.record(Change([field.name], value, value))
+    return obj_widget.undo
+
+
+# Scenarios by name: each prepares its state from a dataset and returns the measured function,
+# or None if the dataset does not allow it
+SCENARIOS = {
+    "main_app": scenario_main_app,
+    "load_dataset": scenario_load_dataset,
+    "open_sections": scenario_open_sections,
+    "object_widget": scenario_object_widget,
+    "object_widget_full": scenario_object_widget_full,
+    "list_widget": scenario_list_widget,
+    "edit": scenario_edit,
+    "undo": scenario_undo,
+}
+
+
+def measure(scenario, spec):
+    """
+    Runs a scenario on a dataset and returns its `Measurement`, None if it does not apply.
+
+    The dataset is built and the scenario prepared before the measurement starts.
+    """
+    dataset = make_dataset(spec)
+    run = SCENARIOS[scenario](dataset)
+    if run is None:
+        return None
+    gc.collect()
+    widgets = widget_count()
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+    return Measurement(
+        scenario,
+        spec,
+        seconds,
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        widget_count() - widgets,
+    )
+
+
+def measure_isolated(scenario, spec, repeat=3):
+    """
+    Measures a scenario `repeat` times, each time in a new process.
+
+    Returns
+    -------
+    Measurement or None:
+        The best time and the largest peak memory of the runs.
+    """
+    results = []
+    for _ in range(repeat):
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            result = executor.submit(measure, scenario, spec).result()
+        if result is None:
+            return None
+        results.append(result)
+    return results[0]._replace(
+        seconds=min(result.seconds for result in results),
+        peak_rss_kb=max(result.peak_rss_kb for result in results),
+    )
+
+
+def default_datasets(count):
+    """Returns DEFAULT_DATASETS and `count` examples of trioapi.data of increasing size."""
+    from .examples import get_index
+
+    examples = sorted(get_index(), key=lambda info: info.size)
+    if count <= 0 or not examples:
+        return list(DEFAULT_DATASETS)
+    step = max(1, (len(examples) - 1) // max(1, count - 1))
+    chosen = [info.name for info in examples[::step][:count]]
+    return list(DEFAULT_DATASETS) + chosen
+
+
+def compare(results, baseline, tolerance, widget_tolerance):
+    """
+    Returns the regressions of `results` compared to the measurements of `baseline`.
+
+    ----------
+    Parameters
+
+    results: list
+        The new measurements.
+
+    baseline: list
+        The reference measurements, matched by scenario and dataset.
+
+    tolerance: float
+        Relative increase of the time and the peak memory which is tolerated.
+
+    widget_tolerance: float
+        Relative increase of the number of widget models which is tolerated.
+
+    Returns
+    -------
+    list:
+        A message for each metric exceeding its tolerance.
+    """
+    reference = {(item.scenario, item.dataset): item for item in baseline}
+    regressions = []
+    for result in results:
+        base = reference.get((result.scenario, result.dataset))
+        if base is None:
+            continue
+        for metric, allowed in (
+            ("seconds", tolerance),
+            ("peak_rss_kb", tolerance),
+            ("widgets", widget_tolerance),
+        ):
+            old, new = getattr(base, metric), getattr(result, metric)
+            if new > old * (1 + allowed):
+                regressions.append(
+                    f"{result.scenario} on {result.dataset}: {metric} {old} -> {new}"
+                )
+    return regressions
+
+
+def read_measurements(path):
+    with open(path) as file:
+        return [Measurement(**item) for item in json.load(file)["measurements"]]
+
+
+def write_measurements(results, path):
+    with open(path, "w") as file:
+        json.dump(
+            {"measurements": [item._asdict() for item in results]}, file, indent=2
+        )
+
+
+def undo_latency(tab, repeat=10):
+    """
+    Returns the mean time in seconds of a click on the Cancel button of a tab.
+
+    A change leaving the first inline field of the object unchanged is recorded before each
+    click, so that the undo goes through the whole patching path without modifying the object.
+    """
+    from .ui.widgets.history import Change
+
+    obj_widget = tab.get()
+    field = inline_field(tab.read_object)
+    if field is None:
+        return None
+    value = getattr(tab.read_object, field.name)
+
+    elapsed = 0.0
+    for _ in range(repeat):
+        obj_widget.history.record(Change([field.name], value, value))
+        start = time.perf_counter()
+        obj_widget.cancel_button.fire_event("click", None)
+        elapsed += time.perf_counter() - start
+    return elapsed / repeat
+
+
+def session(spec, updates=500, checkpoint=100):
+    """
+    Simulates a long session: repeated menu updates of a MainApp, with the undo latency and
+    the memory allocated since the start measured every `checkpoint` updates.
+
+    ----------
+    Parameters
+
+    spec: str
+        The loaded dataset, as given to `make_dataset`.
+
+    updates: int
+        Number of menu updates.
+
+    checkpoint: int
+        Number of updates between two measurements.
+
+    Returns
+    -------
+    list:
+        The (number of updates, undo latency in seconds, allocated bytes) measurements.
+    """
+    from .ui.widgets.main_app import MainApp
+
+    app = MainApp()
+    dataset = make_dataset(spec)
+    app.update_menu_dataset(dataset)
+    if len(app.tab_widgets) < 2:
+        raise ValueError(f"{spec} has no problem or scheme to edit")
+    app.tab.v_model = 1
+
+    tracemalloc.start()
+    try:
+        results = []
+        for count in range(updates + 1):
+            if count % checkpoint == 0:
+                latency = undo_latency(app.tab_widgets[1])
+                results.append((count, latency, tracemalloc.get_traced_memory()[0]))
+            app.update_menu_dataset(dataset)
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def run_command(args):
+    datasets = args.dataset or default_datasets(args.examples)
+    scenarios = args.scenario or list(SCENARIOS)
+
+    print(
+        f"{'scenario':<20} {'dataset':<24} {'time (ms)':>10} {'rss (MB)':>9} {'widgets':>8}"
+    )
+    results = []
+    for spec in datasets:
+        for scenario in scenarios:
+            result = measure_isolated(scenario, spec, args.repeat)
+            if result is None:
+                continue
+            results.append(result)
+            print(
+                f"{scenario:<20} {spec:<24} {result.seconds * 1000:>10.1f} "
+                f"{result.peak_rss_kb / 1024:>9.1f} {result.widgets:>8}"
+            )
+
+    if args.output:
+        write_measurements(results, args.output)
+    if args.baseline:
+        regressions = compare(
+            results,
+            read_measurements(args.baseline),
+            args.tolerance,
+            args.widget_tolerance,
+        )
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+def session_command(args):
+    print(f"{'updates':>8} {'undo (ms)':>10} {'memory (kB)':>12}")
+    for count, latency, memory in session(args.dataset, args.updates, args.checkpoint):
+        latency = "-" if latency is None else f"{latency * 1000:.2f}"
+        print(f"{count:>8} {latency:>10} {memory / 1024:>12.0f}")
+    return 0
+
+
+def main(argv=None):
+    """Runs the benchmarks of the GUI without a browser."""
+    parser = argparse.ArgumentParser(description="Benchmarks of triogui.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser(
+        "run", help="time, memory and widget count of the scenarios"
+    )
+    run.add_argument(
+        "--dataset",
+        action="append",
+        help="example name or synthetic:PROBLEMS,ITEMS,DEPTH (repeatable)",
+    )
+    run.add_argument(
+        "--examples",
+        type=int,
+        default=3,
+        help="number of examples measured when no dataset is given",
+    )
+    run.add_argument(
+        "--scenario", action="append", choices=list(SCENARIOS), help="(repeatable)"
+    )
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--output", help="file where the measurements are written")
+    run.add_argument("--baseline", help="measurements to compare with")
+    run.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    run.add_argument("--widget-tolerance", type=float, default=0.0)
+    run.set_defaults(handler=run_command)
+
+    long_session = commands.add_parser(
+        "session", help="undo latency and memory along many menu updates"
+    )
+    long_session.add_argument("dataset", help="example name or synthetic:N,M,D")
+    long_session.add_argument("--updates", type=int, default=500)
+    long_session.add_argument("--checkpoint", type=int, default=100)
+    long_session.set_defaults(handler=session_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
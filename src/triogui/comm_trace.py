@@ -0,0 +1,248 @@
+import collections
+import contextlib
+import functools
+import json
+import os
+import time
+
+# Set TRIOGUI_COMM_TRACE=1 to account the messages sent to the browser and show the debug tab
+ENABLED = os.environ.get("TRIOGUI_COMM_TRACE", "") not in ("", "0")
+
+# File written by the export of the debug tab
+EXPORT_FILE = os.environ.get("TRIOGUI_COMM_TRACE_FILE", "comm_trace.json")
+
+# Action to which the messages sent outside of a traced action are attributed
+OTHER = "other"
+
+
+def message_size(data, buffers=None):
+    """
+    Returns the size in bytes of a comm message: its JSON content and its binary buffers.
+
+    The size of the JSON content is the one of a compact serialization, the websocket frame
+    and the Jupyter message header are not counted.
+    """
+    text = json.dumps(data, default=str, separators=(",", ":"))
+    size = len(text.encode("utf-8"))
+    for buffer in buffers or ():
+        size += memoryview(buffer).nbytes
+    return size
+
+
+class CommTrace:
+    def __init__(self):
+        """
+        Accounting of the widget messages sent by the kernel, by user action.
+
+        Once installed, the messages updating a model and the messages creating a new model
+        are counted, with their size, for the innermost running `action` and the class of the
+        widget. Messages sent outside of an action are attributed to OTHER.
+        """
+        # [messages, bytes, models] by (action, widget class name)
+        self.stats = collections.defaultdict(lambda: [0, 0, 0])
+        # [runs, seconds] by action
+        self.runs = collections.defaultdict(lambda: [0, 0.0])
+        self.actions = []
+        self.paused = 0
+        self.opening = None
+        self.originals = None
+
+    @property
+    def installed(self):
+        return self.originals is not None
+
+    def install(self):
+        """
+        Hooks the sending of the widget messages, does nothing if it is already hooked.
+        """
+        if self.installed:
+            return
+        from ipywidgets.widgets import widget as widget_module
+
+        widget_class = widget_module.Widget
+        self.originals = (widget_class._send, widget_class.open, widget_module.comm)
+        send, open_, comm_module = self.originals
+        trace = self
+
+        def traced_send(widget, msg, buffers=None):
+            if widget.comm is not None:
+                trace.record(widget, message_size(msg, buffers))
+            return send(widget, msg, buffers)
+
+        def traced_open(widget):
+            # The comm is created with the full state of the widget, see TracedComm
+            previous, trace.opening = trace.opening, widget
+            try:
+                return open_(widget)
+            finally:
+                trace.opening = previous
+
+        class TracedComm:
+            def __getattr__(self, name):
+                return getattr(comm_module, name)
+
+            def create_comm(self, *args, **kwargs):
+                size = message_size(kwargs.get("data"), kwargs.get("buffers"))
+                trace.record(trace.opening, size, new_model=True)
+                return comm_module.create_comm(*args, **kwargs)
+
+        widget_class._send = traced_send
+        widget_class.open = traced_open
+        widget_module.comm = TracedComm()
+
+    def uninstall(self):
+        """
+        Restores the sending of the widget messages, the collected statistics are kept.
+        """
+        if not self.installed:
+            return
+        from ipywidgets.widgets import widget as widget_module
+
+        send, open_, comm_module = self.originals
+        widget_module.Widget._send = send
+        widget_module.Widget.open = open_
+        widget_module.comm = comm_module
+        self.originals = None
+
+    def record(self, widget, size, new_model=False):
+        if self.paused:
+            return
+        action = self.actions[-1] if self.actions else OTHER
+        stats = self.stats[action, type(widget).__name__]
+        stats[0] += 1
+        stats[1] += size
+        if new_model:
+            stats[2] += 1
+
+    @contextlib.contextmanager
+    def action(self, name):
+        """
+        Attributes the messages sent inside the block to the action `name`.
+
+        Nested actions are accounted to the innermost one.
+        """
+        self.actions.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.actions.pop()
+            runs = self.runs[name]
+            runs[0] += 1
+            runs[1] += time.perf_counter() - start
+
+    @contextlib.contextmanager
+    def pause(self):
+        """Ignores the messages sent inside the block, e.g. by the display of the trace."""
+        self.paused += 1
+        try:
+            yield
+        finally:
+            self.paused -= 1
+
+    def reset(self):
+        """Discards the collected statistics."""
+        self.stats.clear()
+        self.runs.clear()
+
+    def rows(self):
+        """
+        Returns the statistics by action and widget class, the most expensive first.
+
+        Returns
+        -------
+        list:
+            A dict per (action, widget class) with the keys action, widget, messages, bytes
+            and models.
+        """
+        rows = [
+            {
+                "action": action,
+                "widget": widget,
+                "messages": messages,
+                "bytes": size,
+                "models": models,
+            }
+            for (action, widget), (messages, size, models) in self.stats.items()
+        ]
+        rows.sort(key=lambda row: row["bytes"], reverse=True)
+        return rows
+
+    def totals(self):
+        """
+        Returns the statistics summed by action, the most expensive first.
+
+        Returns
+        -------
+        list:
+            A dict per action with the keys action, runs, seconds, messages, bytes and models.
+        """
+        totals = {}
+        for row in self.rows():
+            total = totals.setdefault(
+                row["action"],
+                {
+                    "action": row["action"],
+                    "runs": self.runs[row["action"]][0],
+                    "seconds": self.runs[row["action"]][1],
+                    "messages": 0,
+                    "bytes": 0,
+                    "models": 0,
+                },
+            )
+            for key in ("messages", "bytes", "models"):
+                total[key] += row[key]
+        return sorted(totals.values(), key=lambda total: total["bytes"], reverse=True)
+
+    def to_json(self):
+        """Returns the statistics as a JSON document."""
+        return json.dumps({"actions": self.totals(), "widgets": self.rows()}, indent=2)
+
+    def export(self, path=None):
+        """
+        Writes the statistics as JSON to `path`, EXPORT_FILE by default.
+
+        Returns
+        -------
+        str:
+            The written file.
+        """
+        path = EXPORT_FILE if path is None else path
+        with open(path, "w") as file:
+            file.write(self.to_json())
+        return path
+
+
+# Trace shared by the widgets of the kernel
+trace = CommTrace()
+
+
+def action(name):
+    """
+    Context manager attributing the messages sent inside the block to the action `name`.
+
+    Does nothing unless the trace is installed, so that the actions cost nothing by default.
+    """
+    if not trace.installed:
+        return contextlib.nullcontext()
+    return trace.action(name)
+
+
+def traced(name):
+    """Decorator running the decorated function inside `action(name)`."""
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with action(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def install():
+    """Installs the trace and returns it."""
+    trace.install()
+    return trace
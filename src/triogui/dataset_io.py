@@ -0,0 +1,347 @@
+import asyncio
+import collections
+import hashlib
+import importlib.metadata
+import io
+import os
+import pickle
+import stat
+import tempfile
+import threading
+import time
+from importlib import resources
+from pathlib import Path
+from typing import NamedTuple
+
+import trioapi as ta
+
+
+def parse_dataset(text, progress=None):
+    """
+    Parses the content of a .data file into a dataset.
+
+    ----------
+    Parameters
+
+    text: str
+        The content of the file.
+
+    progress: Callable, optional
+        Function called with the name of each parsing step when it starts.
+
+    Returns
+    -------
+    Dataset:
+        The parsed dataset.
+    """
+    from trustify.trust_parser import TRUSTParser, TRUSTStream
+
+    if progress is not None:
+        progress("Tokenizing")
+    tp = TRUSTParser()
+    tp.tokenize(text)
+    stream = TRUSTStream(tp)
+    if progress is not None:
+        progress("Reading the dataset")
+    return ta.trustify_gen.Dataset_Parser.ReadFromTokens(stream)
+
+
+# Size in characters of the chunks written by `write_dataset`
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+class ExportReport(NamedTuple):
+    """
+    Result of the export of a dataset.
+
+    path: Path or None
+        The written file, None for an export in memory.
+
+    size: int
+        Number of bytes written.
+
+    duration: float
+        Elapsed time in seconds.
+    """
+
+    path: Path | None
+    size: int
+    duration: float
+
+    def __str__(self):
+        target = f" to {self.path}" if self.path is not None else ""
+        return f"{self.size} bytes written{target} in {self.duration:.2f} s"
+
+
+def iter_chunks(dataset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yields the text of a dataset in chunks of about `chunk_size` characters.
+
+    The tokens are consumed as they are generated, the whole text is never held in memory.
+    """
+    buffer = []
+    length = 0
+    for token in dataset.toDatasetTokens():
+        buffer.append(token)
+        length += len(token)
+        if length >= chunk_size:
+            yield "".join(buffer)
+            buffer.clear()
+            length = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def _file_mode(path):
+    # The temporary file is private, the export gets the mode of the file it replaces or the
+    # default mode of a new file
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_dataset(dataset, path, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Writes a dataset to a .data file, chunk by chunk.
+
+    The file is written next to its destination and moved in place at the end, an existing
+    file is never left half written, and keeps its permissions.
+
+    ----------
+    Parameters
+
+    dataset: Dataset
+        The exported dataset.
+
+    path: str or Path
+        The destination file.
+
+    chunk_size: int
+        Number of characters written at a time.
+
+    Returns
+    -------
+    ExportReport:
+        The number of bytes written and the elapsed time.
+    """
+    start = time.perf_counter()
+    path = Path(path)
+    size = 0
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+    ) as file:
+        try:
+            for chunk in iter_chunks(dataset, chunk_size):
+                file.write(chunk)
+                size += len(chunk.encode("utf-8"))
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+    os.chmod(file.name, _file_mode(path))
+    os.replace(file.name, path)
+    return ExportReport(path, size, time.perf_counter() - start)
+
+
+def dataset_text(dataset):
+    """
+    Returns the text of a dataset with its export report.
+
+    The chunks are accumulated in a single buffer, without the intermediate list of tokens.
+    """
+    start = time.perf_counter()
+    buffer = io.StringIO()
+    for chunk in iter_chunks(dataset):
+        buffer.write(chunk)
+    text = buffer.getvalue()
+    return text, ExportReport(
+        None, len(text.encode("utf-8")), time.perf_counter() - start
+    )
+
+
+# Number of parsed datasets kept in memory by `load_example`
+MEMORY_CACHE_SIZE = 16
+
+# Pickled datasets by cache key, the most recently used last
+_memory_cache: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+
+
+def cache_dir(kind="datasets"):
+    """
+    Returns the directory of the on-disk cache of triogui holding the files of `kind`.
+
+    The cache root can be set with the TRIOGUI_CACHE_DIR environment variable.
+    """
+    root = os.environ.get("TRIOGUI_CACHE_DIR")
+    if root is None:
+        root = Path.home() / ".cache" / "triogui"
+    return Path(root) / kind
+
+
+def _trioapi_version():
+    # Pickles refer to the classes of trioapi, they are not reused across its versions
+    try:
+        return importlib.metadata.version("trioapi")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _cache_key(path, content):
+    stat = path.stat()
+    return hashlib.sha256(
+        "\0".join(
+            [
+                str(path.resolve()),
+                str(stat.st_mtime_ns),
+                hashlib.sha256(content).hexdigest(),
+                _trioapi_version(),
+            ]
+        ).encode()
+    ).hexdigest()
+
+
+def _remember(key, data):
+    _memory_cache[key] = data
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _read_cache(key):
+    if key in _memory_cache:
+        _memory_cache.move_to_end(key)
+        return _memory_cache[key]
+    try:
+        data = (cache_dir() / f"{key}.pickle").read_bytes()
+    except OSError:
+        return None
+    _remember(key, data)
+    return data
+
+
+def _write_cache(key, dataset):
+    try:
+        data = pickle.dumps(dataset, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return
+    _remember(key, data)
+    # Written in a temporary file first, so that a concurrent reader never sees a partial file
+    try:
+        directory = cache_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as file:
+            file.write(data)
+        os.replace(file.name, directory / f"{key}.pickle")
+    except OSError:
+        pass
+
+
+def load_example(name):
+    """
+    Returns the example dataset `name` of trioapi.data, parsing it only if it is not cached.
+
+    Parsed datasets are pickled on disk, keyed by the path, modification time and content hash
+    of the file, and the most recent ones are also kept in memory.
+
+    ----------
+    Parameters
+
+    name: str
+        Name of the example, without the .data extension.
+
+    Returns
+    -------
+    Dataset:
+        A new copy of the dataset, which can be modified without altering the cache.
+    """
+    path = Path(resources.files("trioapi.data") / f"{name}.data")
+    try:
+        key = _cache_key(path, path.read_bytes())
+    except OSError:
+        return ta.get_jdd(name)
+
+    data = _read_cache(key)
+    if data is not None:
+        try:
+            return pickle.loads(data)
+        except Exception:
+            # Corrupted or outdated entry, parsed again below
+            _memory_cache.pop(key, None)
+
+    dataset = ta.get_jdd(name)
+    _write_cache(key, dataset)
+    return dataset
+
+
+class ParseJob:
+    def __init__(self, text, on_done, on_error=None, on_progress=None):
+        """
+        Parsing of a dataset on a worker thread.
+
+        ----------
+        Parameters
+
+        text: str
+            The content of the .data file.
+
+        on_done: Callable
+            Called with the parsed dataset.
+
+        on_error: Callable, optional
+            Called with the exception raised by the parser.
+
+        on_progress: Callable, optional
+            Called with the name of each parsing step.
+
+        The callbacks are run on the event loop of the kernel when there is one, so that they
+        can safely update the widgets. None of them is called once the job is cancelled.
+        """
+        self.text = text
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.cancelled = False
+
+        try:
+            self.loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.loop = None
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def cancel(self):
+        """
+        Discards the result of the job.
+
+        The parser cannot be interrupted, the thread ends on its own.
+        """
+        self.cancelled = True
+
+    def notify(self, callback, *args):
+        # Callbacks are dispatched to the kernel loop, and dropped after a cancellation
+        def call():
+            if not self.cancelled and callback is not None:
+                callback(*args)
+
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(call)
+        else:
+            call()
+
+    def run(self):
+        try:
+            dataset = parse_dataset(
+                self.text,
+                progress=lambda step: self.notify(self.on_progress, step),
+            )
+        except Exception as error:
+            self.notify(self.on_error, error)
+        else:
+            self.notify(self.on_done, dataset)
@@ -0,0 +1,91 @@
+import collections
+from typing import Any
+
+import trioapi as ta
+
+# Number of datasets whose view is kept, the least recently used is dropped first
+MAX_VIEWS = 8
+
+# (dataset, DatasetView) by id of the dataset, the dataset is kept so that its id is not reused
+_views: collections.OrderedDict[int, tuple[Any, "DatasetView"]] = (
+    collections.OrderedDict()
+)
+
+# trioapi function extracting the data of each role from a dataset
+ROLES = {
+    "dimension": ta.get_dimension,
+    "domain": ta.get_domain,
+    "mesh": ta.get_mesh,
+    "partition": ta.get_partition,
+    "scatter": ta.get_scatter,
+    "maillage": ta.get_maillage,
+    "dis": ta.get_dis,
+    "read_pb": ta.get_read_pb,
+    "read_sch": ta.get_read_sch,
+    "associations": ta.get_associations,
+    "discretize": ta.get_discretize,
+    "solved_problems": ta.get_solved_problems,
+    "coupled_problems": ta.get_coupled_problems,
+}
+
+
+def copy_result(value):
+    # Lists are copied, so that the callers may modify the returned data
+    if isinstance(value, list):
+        return [copy_result(item) for item in value]
+    return value
+
+
+class DatasetView:
+    def __init__(self, dataset):
+        """
+        Data of each role of a dataset (problems, schemes, meshes...), extracted once per load.
+
+        ----------
+        Parameters
+
+        dataset: Dataset
+            The dataset whose data is extracted.
+
+        The trioapi function of a role is run the first time the role is read, its result is
+        then shared by the home sections and MainApp until `invalidate` is called. The view does
+        not watch the dataset, the code changing the entries of a role must invalidate it.
+        The roles are not assigned in a walk of the view itself: the rules deciding the role of
+        an entry are private to trioapi, so its extraction functions are memoized instead.
+        """
+        self.dataset = dataset
+        self.results = {}
+
+    def invalidate(self):
+        """Drops the extracted data, the next reads run the trioapi functions again."""
+        self.results = {}
+
+    def get(self, role):
+        """
+        Returns the data of `role`, one of the keys of ROLES, as the trioapi function would.
+        """
+        if role not in self.results:
+            self.results[role] = ROLES[role](self.dataset)
+        return copy_result(self.results[role])
+
+
+def get_view(dataset):
+    """Returns the `DatasetView` of a dataset, creating it the first time."""
+    key = id(dataset)
+    if key in _views and _views[key][0] is dataset:
+        _views.move_to_end(key)
+        return _views[key][1]
+    view = DatasetView(dataset)
+    _views[key] = (dataset, view)
+    while len(_views) > MAX_VIEWS:
+        _views.popitem(last=False)
+    return view
+
+
+def extractor(role):
+    """Returns a function extracting the data of `role` from the view of a dataset."""
+
+    def extract(dataset):
+        return get_view(dataset).get(role)
+
+    return extract
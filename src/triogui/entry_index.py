@@ -0,0 +1,203 @@
+import collections
+from typing import Any
+
+import trioapi as ta
+
+# Number of datasets whose index is kept, the least recently used is dropped first
+MAX_INDEXED_DATASETS = 8
+
+# Number of insertions and removals after which an index is rebuilt rather than searched
+MAX_DRIFT = 64
+
+# (dataset, EntryIndex) by id of the dataset, the dataset is kept so that its id is not reused
+_indexes: collections.OrderedDict[int, tuple[Any, "EntryIndex"]] = (
+    collections.OrderedDict()
+)
+
+
+def entry_key(entry):
+    """
+    Returns a hashable summary of an entry: its type and the values of its primitive fields.
+
+    Equal entries have the same key. Entries with the same key are not necessarily equal,
+    nested objects being ignored, the candidates are compared before being returned.
+    """
+    values = []
+    for name in getattr(type(entry), "model_fields", ()):
+        value = getattr(entry, name, None)
+        if value is None or isinstance(value, (str, int, float, bool)):
+            values.append(value)
+    return (type(entry), tuple(values))
+
+
+class EntryIndex:
+    def __init__(self, dataset):
+        """
+        Positions of the entries of a dataset, by identity and by `entry_key`.
+
+        ----------
+        Parameters
+
+        dataset: Dataset
+            The indexed dataset.
+
+        The positions are hints, they are not shifted when an entry is inserted or removed,
+        which would cost a pass over the index. The entries are looked up at most `drift` places
+        around their hint instead, `drift` being the number of insertions and removals done
+        through the index since it was built. The entries may also be modified by trioapi
+        functions which do not update the index: the index is rebuilt, in a single walk, when
+        an entry is not found around its hints or when the drift exceeds MAX_DRIFT.
+        """
+        self.dataset = dataset
+        self.by_id = {}
+        self.by_key = {}
+        self.drift = 0
+        self.rebuild()
+
+    def rebuild(self):
+        self.drift = 0
+        self.by_id = {}
+        self.by_key = collections.defaultdict(list)
+        for position, entry in enumerate(self.dataset.entries):
+            self.by_id[id(entry)] = position
+            self.by_key[entry_key(entry)].append(position)
+
+    def near(self, hint, match):
+        # Position of the entry around hint for which match is true, None if there is none
+        entries = self.dataset.entries
+        for position in range(
+            max(hint - self.drift, 0), min(hint + self.drift + 1, len(entries))
+        ):
+            if match(entries[position]):
+                return position
+        return None
+
+    def find(self, obj):
+        # Position of the entry which is obj or equal to it, None if the hints are outdated
+        hint = self.by_id.get(id(obj))
+        if hint is not None:
+            position = self.near(hint, lambda entry: entry is obj)
+            if position is not None:
+                self.by_id[id(obj)] = position
+                return position
+        for hint in self.by_key.get(entry_key(obj), ()):
+            position = self.near(hint, lambda entry: entry == obj)
+            if position is not None:
+                return position
+        return None
+
+    def get(self, obj):
+        """
+        Returns the position of the entry which is `obj` or equal to it.
+
+        Returns
+        -------
+        int or None:
+            The position, None if there is no such entry.
+        """
+        if self.drift > MAX_DRIFT:
+            self.rebuild()
+        position = self.find(obj)
+        if position is None:
+            self.rebuild()
+            position = self.find(obj)
+        return position
+
+    def add(self, position):
+        """Records the entry inserted at `position`."""
+        entry = self.dataset.entries[position]
+        self.drift += 1
+        self.by_id[id(entry)] = position
+        self.by_key[entry_key(entry)].append(position)
+
+    def replace(self, position, new_entry):
+        """Replaces the entry at `position`."""
+        old_entry = self.dataset.entries[position]
+        self.dataset.entries[position] = new_entry
+        self.by_id.pop(id(old_entry), None)
+        self.by_id[id(new_entry)] = position
+        old_positions = self.by_key.get(entry_key(old_entry), [])
+        if position in old_positions:
+            old_positions.remove(position)
+        self.by_key[entry_key(new_entry)].append(position)
+
+    def delete(self, position):
+        """
+        Removes the entry at `position`.
+
+        The positions of the read objects in `dataset._declarations` are updated too.
+        """
+        entry = self.dataset.entries.pop(position)
+        self.drift += 1
+        self.by_id.pop(id(entry), None)
+        positions = self.by_key.get(entry_key(entry), [])
+        if position in positions:
+            positions.remove(position)
+        for declaration in self.dataset._declarations.values():
+            if declaration[1] > position:
+                declaration[1] -= 1
+
+
+def get_index(dataset):
+    """Returns the `EntryIndex` of a dataset, building it the first time."""
+    key = id(dataset)
+    if key in _indexes and _indexes[key][0] is dataset:
+        _indexes.move_to_end(key)
+        return _indexes[key][1]
+    index = EntryIndex(dataset)
+    _indexes[key] = (dataset, index)
+    while len(_indexes) > MAX_INDEXED_DATASETS:
+        _indexes.popitem(last=False)
+    return index
+
+
+def get_entry_index(dataset, obj):
+    """
+    Returns the position of `obj` in the entries of the dataset, as `ta.get_entry_index`.
+
+    The position is found around its last known position in the index of the dataset.
+
+    Raises
+    ------
+    ValueError:
+        If neither `obj` nor an entry equal to it is in the dataset.
+    """
+    position = get_index(dataset).get(obj)
+    if position is None:
+        raise ValueError(f"{type(obj).__name__} is not an entry of the dataset")
+    return position
+
+
+def replace_entry(dataset, old_entry, new_entry):
+    """Replaces the entry `old_entry` (or an entry equal to it) by `new_entry`."""
+    get_index(dataset).replace(get_entry_index(dataset, old_entry), new_entry)
+
+
+def delete_read_object(dataset, obj):
+    """
+    Removes the entry `obj` (or an entry equal to it), as `ta.delete_read_object`.
+
+    The positions of the read objects in `dataset._declarations` are updated, as by
+    `delete_entry`.
+    """
+    get_index(dataset).delete(get_entry_index(dataset, obj))
+
+
+def delete_entry(dataset, position):
+    """Removes the entry at `position`."""
+    get_index(dataset).delete(position)
+
+
+def add_read_object(dataset, obj):
+    """
+    Adds an entry with `ta.add_read_object`.
+
+    The insertion position is chosen by trioapi, near the end of the entries: it is searched
+    from the last entry.
+    """
+    ta.add_read_object(dataset, obj)
+    entries = dataset.entries
+    for position in range(len(entries) - 1, -1, -1):
+        if entries[position] is obj:
+            get_index(dataset).add(position)
+            return
@@ -0,0 +1,224 @@
+import functools
+import json
+import os
+import re
+import sys
+import tempfile
+from importlib import resources
+from pathlib import Path
+from typing import NamedTuple
+
+from .dataset_io import cache_dir
+
+# Version of the layout of the index file, to be increased when ExampleInfo changes
+INDEX_VERSION = 2
+
+# Maximum length of the summary taken from the first comment of a dataset
+SUMMARY_LENGTH = 120
+
+_DIMENSION = re.compile(r"^\s*dimension\s+(\d+)", re.IGNORECASE | re.MULTILINE)
+_PROBLEM = re.compile(r"^\s*(pb_\w+)\s+\w+\s*$", re.IGNORECASE | re.MULTILINE)
+_COMMENT = re.compile(r"#(.*?)#|/\*(.*?)\*/", re.DOTALL)
+
+
+class ExampleInfo(NamedTuple):
+    """
+    Metadata of an example dataset of trioapi.data.
+
+    name: str
+        Name of the example, the stem of its file.
+
+    size: int
+        Size of the file in bytes.
+
+    dimension: int or None
+        Dimension declared by the dataset.
+
+    problems: list
+        Types of the problems declared by the dataset.
+
+    summary: str
+        Beginning of the first comment of the dataset.
+    """
+
+    name: str
+    size: int
+    dimension: int | None
+    problems: list
+    summary: str
+
+    def label(self):
+        """Text displayed for the example in the dataset select."""
+        details = [f"{self.dimension}D"] if self.dimension else []
+        details += self.problems
+        return f"{self.name} ({', '.join(details)})" if details else self.name
+
+    def matches(self, words):
+        """Return True if every word of the search is found in the metadata."""
+        text = " ".join(
+            [self.name, self.summary, f"{self.dimension}d", *self.problems]
+        ).lower()
+        return all(word in text for word in words)
+
+
+def examples_dir():
+    """Returns the directory of the example datasets of trioapi."""
+    return Path(resources.files("trioapi.data"))
+
+
+def scan_example(path):
+    """
+    Extracts the metadata of a dataset file without parsing it.
+
+    Only a few regular expressions are applied to the text, which is much faster than the
+    TRUST parser and good enough to describe and search the examples.
+    """
+    text = path.read_text(errors="replace")
+    dimension = _DIMENSION.search(text)
+    comment = _COMMENT.search(text)
+    summary = ""
+    if comment is not None:
+        summary = " ".join((comment.group(1) or comment.group(2) or "").split())
+    return ExampleInfo(
+        name=path.stem,
+        size=path.stat().st_size,
+        dimension=int(dimension.group(1)) if dimension else None,
+        problems=sorted({match.group(1) for match in _PROBLEM.finditer(text)}),
+        summary=summary[:SUMMARY_LENGTH],
+    )
+
+
+def build_index(directory):
+    """
+    Scans every .data file of `directory`.
+
+    Returns
+    -------
+    list:
+        The `ExampleInfo` of each example, sorted by name.
+    """
+    return sorted(
+        (
+            scan_example(path)
+            for path in directory.iterdir()
+            if path.is_file() and path.suffix == ".data"
+        ),
+        key=lambda info: info.name,
+    )
+
+
+def directory_state(directory):
+    """
+    Returns the name, modification time and size of each .data file of `directory`.
+
+    An example edited in place does not change the modification time of its directory,
+    the index is thus checked against the state of every file.
+    """
+    state = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".data") and entry.is_file():
+            stat = entry.stat()
+            state.append([entry.name, stat.st_mtime_ns, stat.st_size])
+    return sorted(state)
+
+
+def index_path():
+    """Returns the path of the generated index of the examples."""
+    return cache_dir("examples") / "index.json"
+
+
+def write_index(examples, directory, path):
+    # The index is only valid for the state of the directory it was built from
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = {
+        "version": INDEX_VERSION,
+        "directory": str(directory),
+        "files": directory_state(directory),
+        "examples": [info._asdict() for info in examples],
+    }
+    # Each process writes its own temporary file, several kernels may index at the same time
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, suffix=".tmp", delete=False
+    ) as file:
+        try:
+            file.write(json.dumps(content))
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+    os.replace(file.name, path)
+
+
+def read_index(directory, path):
+    # Returns None if the index is missing or was built from another state of the directory
+    try:
+        content = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if (
+        content.get("version") != INDEX_VERSION
+        or content.get("directory") != str(directory)
+        or content.get("files") != directory_state(directory)
+    ):
+        return None
+    return [ExampleInfo(**info) for info in content["examples"]]
+
+
+@functools.cache
+def get_index():
+    """
+    Returns the metadata of all the examples of trioapi.data.
+
+    The index file is loaded once per process. It is generated again when the examples
+    directory or one of its files was modified since it was written.
+    """
+    directory = examples_dir()
+    path = index_path()
+    examples = read_index(directory, path)
+    if examples is None:
+        examples = build_index(directory)
+        try:
+            write_index(examples, directory, path)
+        except OSError:
+            pass
+    return tuple(examples)
+
+
+def search(query="", offset=0, limit=None):
+    """
+    Searches the examples whose metadata contains every word of `query`.
+
+    ----------
+    Parameters
+
+    query: str
+        Words searched in the name, summary, dimension ("2d") and problem types.
+
+    offset: int
+        Number of matching examples skipped.
+
+    limit: int, optional
+        Maximum number of examples returned.
+
+    Returns
+    -------
+    tuple:
+        The matching `ExampleInfo` and the total number of matches.
+    """
+    words = (query or "").lower().split()
+    matches = [info for info in get_index() if info.matches(words)]
+    end = None if limit is None else offset + limit
+    return matches[offset:end], len(matches)
+
+
+def main():
+    """Generates the index of the examples and prints where it was written."""
+    get_index.cache_clear()
+    directory = examples_dir()
+    examples = build_index(directory)
+    write_index(examples, directory, index_path())
+    print(f"{len(examples)} examples indexed in {index_path()}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+import argparse
+import json
+import re
+import subprocess
+import sys
+from typing import NamedTuple
+
+# Modules imported when a kernel displays the GUI
+DEFAULT_MODULES = ("triogui.ui.voila_main",)
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+class ImportTime(NamedTuple):
+    """
+    Import time of a module, as reported by `python -X importtime`.
+
+    module: str
+        Name of the module.
+
+    self_us: int
+        Time spent executing the module itself, in microseconds.
+
+    cumulative_us: int
+        Time including the imports of the module, in microseconds.
+
+    depth: int
+        Nesting level of the import, 0 for the imported module.
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def measure(module):
+    """
+    Imports `module` in a new interpreter and returns the import time of every module loaded.
+
+    Returns
+    -------
+    list:
+        The `ImportTime` of each module, in the order they finished loading.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{process.stderr}")
+    times = []
+    for line in process.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is not None:
+            self_us, cumulative_us, indent, name = match.groups()
+            times.append(
+                ImportTime(name, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return times
+
+
+def import_total(module, times):
+    """
+    Returns the time in microseconds taken by `import module`, including its parent packages
+    but not the modules loaded at the interpreter startup.
+    """
+    parts = module.split(".")
+    names = {".".join(parts[: i + 1]) for i in range(len(parts))}
+    return sum(t.cumulative_us for t in times if t.depth == 0 and t.module in names)
+
+
+def report(times, top=20, prefix=None):
+    """
+    Returns the lines of a report of the slowest modules by cumulative time.
+
+    ----------
+    Parameters
+
+    times: list
+        The `ImportTime` returned by `measure`.
+
+    top: int
+        Number of modules listed.
+
+    prefix: str, optional
+        Only list the modules whose name starts with `prefix`, e.g. "triogui".
+    """
+    selected = [t for t in times if prefix is None or t.module.startswith(prefix)]
+    selected.sort(key=lambda t: t.cumulative_us, reverse=True)
+    lines = [f"{'cumulative (ms)':>16} {'self (ms)':>10}  module"]
+    for t in selected[:top]:
+        lines.append(
+            f"{t.cumulative_us / 1000:>16.1f} {t.self_us / 1000:>10.1f}  {t.module}"
+        )
+    return lines
+
+
+def main(argv=None):
+    """
+    Prints the import cost of the GUI modules, and fails if it exceeds the given budget.
+    """
+    parser = argparse.ArgumentParser(description="Import time report of triogui.")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES))
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--prefix", help="only list the modules starting with it")
+    parser.add_argument("--json", help="file where the measurements are written")
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="exit with an error if a module takes longer than this to import",
+    )
+    args = parser.parse_args(argv)
+
+    status = 0
+    results = {}
+    for module in args.modules:
+        times = measure(module)
+        results[module] = [t._asdict() for t in times]
+        total = import_total(module, times) / 1000
+        print(f"{module}: {total:.1f} ms")
+        print("\n".join(report(times, args.top, args.prefix)))
+        print()
+        if args.max_ms is not None and total > args.max_ms:
+            print(f"{module} exceeds the budget of {args.max_ms:.1f} ms")
+            status = 1
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
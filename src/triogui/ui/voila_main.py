@@ -1,14 +1,91 @@
+import argparse
+import os
+
 from triogui.ui.widgets.main_app import MainApp
 
+# Defaults of the launcher, which can be overridden by environment variables
+DEFAULT_PORT = 8866
+DEFAULT_POOL_SIZE = 2
+# Idle timeout without a pool. The kernels waiting in the pool are idle and would be culled
+# and started again in a loop, the idle kernels are thus not culled by default with a pool
+DEFAULT_IDLE_TIMEOUT = 3600
+
+
+def warm_up():
+    """
+    Loads in the kernel what the first user interactions need: the subclass indexes of the
+    home page and the index of the example datasets.
+    """
+    from triogui.examples import get_index
+    from triogui.ui.widgets import schema
+
+    schema.warm_up()
+    get_index()
+
 
 def main():
+    warm_up()
     main_app = MainApp()
     return main_app.get_app()
 
 
-def voila():
+def voila_command(args):
+    """
+    Returns the voila command line of the launcher.
+
+    With a pool of preheated kernels, voila executes the notebook in advance for the next
+    users, so the imports, the warm up and the construction of MainApp are already done
+    when a page is opened. Culling applies to the pooled kernels too, an idle timeout of 0
+    disables it.
+    """
     import pathlib
-    import subprocess
 
     main_path = pathlib.Path(__file__).parent / ".." / "main.ipynb"
-    subprocess.run(["voila", str(main_path.resolve())])
+    command = [
+        "voila",
+        str(main_path.resolve()),
+        f"--port={args.port}",
+    ]
+    if args.idle_timeout > 0:
+        command += [
+            f"--MappingKernelManager.cull_idle_timeout={args.idle_timeout}",
+            f"--MappingKernelManager.cull_interval={min(args.idle_timeout, 300)}",
+        ]
+    if args.pool_size > 0:
+        command += ["--preheat_kernel=True", f"--pool_size={args.pool_size}"]
+    return command
+
+
+def voila(argv=None):
+    import subprocess
+
+    parser = argparse.ArgumentParser(
+        prog="triogui", description="Launch the TrioCFD GUI with voila."
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=int(os.environ.get("TRIOGUI_PORT", DEFAULT_PORT)),
+        help="port of the server (TRIOGUI_PORT)",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=int(os.environ.get("TRIOGUI_POOL_SIZE", DEFAULT_POOL_SIZE)),
+        help="number of preheated kernels waiting for a user, 0 to disable (TRIOGUI_POOL_SIZE)",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=int,
+        default=os.environ.get("TRIOGUI_IDLE_TIMEOUT"),
+        help=(
+            "seconds after which an idle kernel is shut down, 0 to disable. It applies to the "
+            f"pooled kernels too: disabled by default with a pool, {DEFAULT_IDLE_TIMEOUT} "
+            "otherwise (TRIOGUI_IDLE_TIMEOUT)"
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.idle_timeout is None:
+        args.idle_timeout = 0 if args.pool_size > 0 else DEFAULT_IDLE_TIMEOUT
+
+    subprocess.run(voila_command(args))
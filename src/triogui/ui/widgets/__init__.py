@@ -1,23 +1,30 @@
-from .home import HomeWidget
-from .object import ObjectWidget
-from .select_widget import SelectWidget
-from .bool_widget import BooleanWidget
-from .dropdown_widget import DropdownWidget
-from .float_widget import FloatWidget
-from .int_widget import IntWidget
-from .list_widget import ListWidget
-from .str_widget import StrWidget
-from .main_app import MainApp
+import importlib
 
-__all__ = [
-    "HomeWidget",
-    "ObjectWidget",
-    "SelectWidget",
-    "BooleanWidget",
-    "DropdownWidget",
-    "FloatWidget",
-    "IntWidget",
-    "ListWidget",
-    "StrWidget",
-    "MainApp",
-]
+# Module defining each public widget, imported when the widget is first accessed
+_modules = {
+    "HomeWidget": ".home",
+    "ObjectWidget": ".object",
+    "SelectWidget": ".select_widget",
+    "BooleanWidget": ".bool_widget",
+    "DropdownWidget": ".dropdown_widget",
+    "FloatWidget": ".float_widget",
+    "IntWidget": ".int_widget",
+    "ListWidget": ".list_widget",
+    "StrWidget": ".str_widget",
+    "MainApp": ".main_app",
+    "CommTraceWidget": ".comm_trace_widget",
+}
+
+__all__ = list(_modules)
+
+
+def __getattr__(name):
+    if name not in _modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_modules[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
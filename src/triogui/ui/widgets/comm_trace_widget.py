@@ -0,0 +1,125 @@
+import asyncio
+
+import ipyvuetify as v
+
+from ...comm_trace import trace
+
+# Delay in seconds between two refreshes of the displayed tables
+REFRESH_DELAY = 2
+
+ACTION_HEADERS = [
+    {"text": "Action", "value": "action"},
+    {"text": "Runs", "value": "runs"},
+    {"text": "Seconds", "value": "seconds"},
+    {"text": "Messages", "value": "messages"},
+    {"text": "Bytes", "value": "bytes"},
+    {"text": "New models", "value": "models"},
+]
+
+WIDGET_HEADERS = [
+    {"text": "Action", "value": "action"},
+    {"text": "Widget", "value": "widget"},
+    {"text": "Messages", "value": "messages"},
+    {"text": "Bytes", "value": "bytes"},
+    {"text": "New models", "value": "models"},
+]
+
+
+class CommTraceWidget:
+    def __init__(self):
+        """
+        Debug tab displaying the messages sent to the browser, by user action and widget class.
+
+        The tables are refreshed every REFRESH_DELAY seconds while the tab is displayed. The
+        messages sent by the tab itself are not accounted.
+        """
+        self.handle = None
+
+        self.actions_table = v.DataTable(
+            headers=ACTION_HEADERS,
+            items=[],
+            dense=True,
+            disable_pagination=True,
+            hide_default_footer=True,
+        )
+        self.widgets_table = v.DataTable(
+            headers=WIDGET_HEADERS,
+            items=[],
+            dense=True,
+            items_per_page=20,
+        )
+
+        self.refresh_button = v.Btn(children=["Refresh"], class_="ma-2")
+        self.reset_button = v.Btn(children=["Reset"], class_="ma-2")
+        self.export_button = v.Btn(children=["Export JSON"], class_="ma-2")
+        self.export_status = v.Html(tag="span", children=[])
+
+        self.refresh_button.on_event("click", lambda *args: self.refresh())
+        self.reset_button.on_event("click", self.reset)
+        self.export_button.on_event("click", self.export)
+
+        self.main = [
+            v.Container(
+                fluid=True,
+                children=[
+                    v.Row(
+                        align="center",
+                        children=[
+                            self.refresh_button,
+                            self.reset_button,
+                            self.export_button,
+                            self.export_status,
+                        ],
+                    ),
+                    v.Html(tag="h3", children=["By action"]),
+                    self.actions_table,
+                    v.Html(tag="h3", children=["By action and widget"]),
+                    self.widgets_table,
+                ],
+            )
+        ]
+
+    def refresh(self):
+        """Displays the current statistics of the trace."""
+        with trace.pause():
+            totals = trace.totals()
+            for total in totals:
+                total["seconds"] = round(total["seconds"], 3)
+            self.actions_table.items = totals
+            self.widgets_table.items = trace.rows()
+
+    def reset(self, widget, event, data):
+        trace.reset()
+        self.refresh()
+
+    def export(self, widget, event, data):
+        with trace.pause():
+            try:
+                path = trace.export()
+            except OSError as error:
+                self.export_status.children = [f"Export failed: {error}"]
+            else:
+                self.export_status.children = [f"Exported to {path}"]
+
+    def show(self):
+        """
+        Refreshes the tables and keeps them updated until `hide` is called.
+        """
+        self.refresh()
+        if self.handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self.handle = loop.call_later(REFRESH_DELAY, self.tick)
+
+    def tick(self):
+        self.handle = None
+        self.show()
+
+    def hide(self):
+        """Stops the refresh of the tables."""
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
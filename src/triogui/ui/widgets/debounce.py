@@ -0,0 +1,76 @@
+import asyncio
+import os
+
+# Delay in milliseconds without typing after which an edited field is committed
+DEBOUNCE_MS = int(os.environ.get("TRIOGUI_DEBOUNCE_MS", 400))
+
+
+class Debouncer:
+    def __init__(self, widget, callback, delay=None):
+        """
+        Commits the edits of a text field once the user stops typing or leaves the field.
+
+        ----------
+        Parameters
+
+        widget: v.TextField
+            The observed field.
+
+        callback: Callable
+            Called with the change of v_model, once per burst of keystrokes. Its "old" value is
+            the one before the burst and its "new" value the last one.
+
+        delay: int, optional
+            Delay in milliseconds, DEBOUNCE_MS by default.
+
+        Outside of a running event loop the changes are committed immediately.
+        """
+        self.widget = widget
+        self.callback = callback
+        self.delay = DEBOUNCE_MS if delay is None else delay
+        self.pending = None
+        self.handle = None
+
+        widget.observe(self.on_change, "v_model")
+        widget.on_event("blur", self.flush)
+
+    def on_change(self, change):
+        if self.pending is None:
+            self.pending = dict(change)
+        else:
+            self.pending["new"] = change["new"]
+
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or self.delay <= 0:
+            self.flush()
+        else:
+            self.handle = loop.call_later(self.delay / 1000, self.flush)
+
+    def flush(self, *args):
+        """Commits the pending change, if any."""
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        if self.pending is None:
+            return
+        change, self.pending = self.pending, None
+        if change["old"] != change["new"]:
+            self.callback(change)
+
+    def cancel(self):
+        """Drops the pending change, called when the field is removed."""
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        self.pending = None
+
+
+def observe_debounced(widget, callback, delay=None):
+    """Calls `callback` with the changes of v_model of `widget`, debounced by `Debouncer`."""
+    return Debouncer(widget, callback, delay)
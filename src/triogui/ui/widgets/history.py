@@ -0,0 +1,284 @@
+import collections
+import contextlib
+import operator
+
+from .object import get_nested_attr, set_nested_attr
+
+# Maximum number of changes kept for each edited object
+MAX_UNDO_DEPTH = 100
+
+
+class ItemIndex:
+    def __init__(self, value):
+        """
+        Index of a displayed list item, used in the key paths of the widgets editing it.
+
+        ----------
+        Parameters
+
+        value: int
+            The current position of the item in its list.
+
+        The widgets of an item keep a reference to this object rather than a plain int, so that
+        the position can be updated in place when items are inserted or removed before it.
+        """
+        self.value = value
+
+    def __index__(self):
+        return self.value
+
+    def __repr__(self):
+        return f"ItemIndex({self.value})"
+
+
+def freeze_path(key_path):
+    """Return `key_path` as a tuple, with the current value of each `ItemIndex`."""
+    return tuple(
+        attr if isinstance(attr, str) else operator.index(attr) for attr in key_path
+    )
+
+
+class Change:
+    # Kind of the change applied when a change is reverted
+    INVERSE_KIND = {"set": "set", "insert": "remove", "remove": "insert"}
+
+    def __init__(self, key_path, old_value, new_value, kind="set"):
+        """
+        A single modification of an edited object.
+
+        ----------
+        Parameters
+
+        key_path: list
+            Path of the modified attribute from the edited object. For "insert" and "remove"
+            changes, the last element is the index of the item in its list.
+
+        old_value: any
+            Value before the change (None for an "insert").
+
+        new_value: any
+            Value after the change (None for a "remove").
+
+        kind: str
+            "set" to replace a value, "insert" or "remove" to add or delete a list item.
+        """
+        self.key_path = list(freeze_path(key_path))
+        self.old_value = old_value
+        self.new_value = new_value
+        self.kind = kind
+
+    def inverse(self):
+        """Return the change reverting this one."""
+        return Change(
+            self.key_path,
+            self.new_value,
+            self.old_value,
+            Change.INVERSE_KIND[self.kind],
+        )
+
+
+class WidgetRegistry:
+    def __init__(self):
+        """
+        Registry binding key paths of an edited object to the widgets displaying them.
+
+        Each key path is associated with a handler called with the reverted `Change` when an undo
+        touches it. Handlers of simple fields update the value of their input, handlers of nested
+        objects and lists rebuild only their own content.
+        """
+        self.handlers = {}
+
+    def register(self, key_path, handler):
+        """Bind `handler` to `key_path`, replacing any previous handler."""
+        self.handlers[freeze_path(key_path)] = handler
+
+    def get(self, key_path):
+        """Return the handler bound to `key_path`, None if there is none."""
+        return self.handlers.get(freeze_path(key_path))
+
+    def unregister_children(self, key_path):
+        """Forget the handlers of every key path strictly below `key_path`."""
+        prefix = freeze_path(key_path)
+        depth = len(prefix)
+        for path in [
+            path
+            for path in self.handlers
+            if len(path) > depth and path[:depth] == prefix
+        ]:
+            del self.handlers[path]
+
+    def clear(self):
+        self.handlers.clear()
+
+    def shift_items(self, key_path, index, offset):
+        """
+        Move the handlers of the items of the list at `key_path` after an insertion or a removal.
+
+        The handlers of the items at positions `index` and above are moved by `offset`.
+        For a removal, the handlers of the removed item must be unregistered beforehand.
+        """
+        prefix = freeze_path(key_path)
+        depth = len(prefix)
+        moved = {
+            path: handler
+            for path, handler in self.handlers.items()
+            if len(path) > depth and path[:depth] == prefix and path[depth] >= index
+        }
+        for path in moved:
+            del self.handlers[path]
+        for path, handler in moved.items():
+            self.handlers[
+                path[:depth] + (path[depth] + offset,) + path[depth + 1 :]
+            ] = handler
+
+    def unregister(self, key_path):
+        """Forget the handlers of `key_path` and of every key path below it."""
+        self.unregister_children(key_path)
+        self.handlers.pop(freeze_path(key_path), None)
+
+    def refresh(self, change):
+        """
+        Update the widgets bound to the key path touched by `change`.
+
+        The handler of the deepest registered key path containing the change is called.
+        List insertions and removals are handled by the widget of the list itself.
+
+        Returns
+        -------
+        bool:
+            False if no widget is bound to the key path or one of its parents.
+        """
+        path = freeze_path(change.key_path)
+        if change.kind != "set":
+            path = path[:-1]
+        for depth in range(len(path), -1, -1):
+            handler = self.handlers.get(path[:depth])
+            if handler is not None:
+                handler(change)
+                return True
+        return False
+
+
+class ChangeHistory:
+    def __init__(self, read_object, max_depth=MAX_UNDO_DEPTH):
+        """
+        Undo history of an edited object, stored as a list of patches.
+
+        ----------
+        Parameters
+
+        read_object: Pydantic object
+            The object modified through the history.
+
+        max_depth: int
+            Maximum number of changes kept, the oldest ones are forgotten first.
+
+        Every modification goes through `set_value`, `insert_item` or `remove_item`, which apply it
+        to `read_object` and record only the touched key path with its old and new values.
+        Undoing a change costs the size of the patch, whatever the size of the object.
+        The widgets editing `read_object` register themselves in `widgets` to be patched on undo.
+        """
+        self.read_object = read_object
+        self.changes = collections.deque(maxlen=max_depth)
+        self.widgets = WidgetRegistry()
+        self.is_replaying = False
+
+    def __len__(self):
+        return len(self.changes)
+
+    @contextlib.contextmanager
+    def replaying(self):
+        """
+        Context in which widgets are updated after an undo.
+
+        The callbacks fired by these updates must not record new changes.
+        """
+        self.is_replaying = True
+        try:
+            yield
+        finally:
+            self.is_replaying = False
+
+    def set_value(self, key_path, value):
+        """
+        Set the attribute at `key_path` to `value` and record the change.
+
+        Intermediate attributes which are None are instantiated, the recorded change is then
+        the creation of the first missing one.
+        """
+        if value is None or self.is_replaying:
+            return None
+
+        obj = self.read_object
+        for depth, attr in enumerate(key_path[:-1]):
+            child = getattr(obj, attr) if isinstance(attr, str) else obj[attr]
+            if child is None:
+                set_nested_attr(self.read_object, key_path, value)
+                created_path = key_path[: depth + 1]
+                return self.record(
+                    Change(
+                        created_path,
+                        None,
+                        get_nested_attr(self.read_object, created_path),
+                    )
+                )
+            obj = child
+
+        last = key_path[-1]
+        old_value = getattr(obj, last) if isinstance(last, str) else obj[last]
+        # Blur events are fired even if the field was not modified
+        if isinstance(value, (str, int, float, bool)) and old_value == value:
+            return None
+
+        set_nested_attr(self.read_object, key_path, value)
+        return self.record(Change(key_path, old_value, value))
+
+    def insert_item(self, key_path, index, item):
+        """Insert `item` at `index` in the list at `key_path` and record the change."""
+        if self.is_replaying:
+            return None
+        change = Change(list(key_path) + [index], None, item, "insert")
+        self.apply(change)
+        return self.record(change)
+
+    def remove_item(self, key_path, index):
+        """Remove the item at `index` from the list at `key_path` and record the change."""
+        if self.is_replaying:
+            return None
+        item = get_nested_attr(self.read_object, key_path)[index]
+        change = Change(list(key_path) + [index], item, None, "remove")
+        self.apply(change)
+        return self.record(change)
+
+    def record(self, change):
+        """Append an already applied change to the history."""
+        self.changes.append(change)
+        return change
+
+    def apply(self, change):
+        """Apply a change to the edited object without recording it."""
+        parent = get_nested_attr(self.read_object, change.key_path[:-1])
+        last = change.key_path[-1]
+        if change.kind == "insert":
+            parent.insert(last, change.new_value)
+        elif change.kind == "remove":
+            parent.pop(last)
+        elif isinstance(last, str):
+            setattr(parent, last, change.new_value)
+        else:
+            parent[last] = change.new_value
+
+    def undo(self):
+        """
+        Revert the last recorded change.
+
+        Returns
+        -------
+        Change or None:
+            The change applied to revert the object, None if the history is empty.
+        """
+        if not self.changes:
+            return None
+        reverse = self.changes.pop().inverse()
+        self.apply(reverse)
+        return reverse
@@ -1,26 +1,202 @@
+import importlib
 import ipyvuetify as v
 import ipywidgets as w
-from ipyfilechooser import FileChooser
-from importlib import resources
 import trioapi as ta
-import pyperclip
-from .object_management import (
-    problem_widget,
-    scheme_widget,
-    dimension_widget,
-    domain_widget,
-    discretization_widget,
-    partition_widget,
-    scatter_widget,
-    mailler_widget,
-    mesh_widget,
-    solve_widget,
-    associate_widget,
-    discretize_widget,
-    coupled_problem_widget,
-    ecriture_lecture_special_widget,
-)
-from trustify.trust_parser import TRUSTParser, TRUSTStream
+from pathlib import Path
+from ... import comm_trace
+from ...dataset_view import extractor, get_view
+from ...dataset_io import ParseJob, dataset_text, load_example, write_dataset
+from ...examples import search
+from .panel_list import PanelList
+
+# Number of examples added to the dataset select at a time
+DATASET_PAGE_SIZE = 50
+
+# Value of the item of the dataset select loading more examples
+LOAD_MORE = "__load_more__"
+
+
+def widget_class(module_name, class_name):
+    """Imports the object_management module `module_name` and returns its class `class_name`."""
+    module = importlib.import_module(f".object_management.{module_name}", __package__)
+    return getattr(module, class_name)
+
+
+def section_widget(module_name, class_name, **options):
+    """
+    Returns the builder of a section displaying the widget `class_name` of the
+    object_management module `module_name`.
+
+    The module is only imported when the section is first opened, the widget is built with
+    the data of the section, the dataset and `options`.
+    """
+
+    def build(data, dataset):
+        return widget_class(module_name, class_name)(data, dataset=dataset, **options)
+
+    return build
+
+
+def release_widget(widget):
+    """
+    Cancels the callbacks still pending in the panels of a section widget which is dropped.
+
+    The edits of its debounced fields would otherwise be committed after the section is bound
+    to another dataset, into the lists shared with this dataset.
+    """
+    for value in vars(widget).values():
+        if isinstance(value, PanelList):
+            value.reset([])
+
+
+def fingerprint(value):
+    """
+    Returns a comparable summary of the data displayed by a section.
+
+    Primitive values are compared by value and other objects of the dataset by identity:
+    a section holding the very same objects does not need to be rebuilt.
+    The objects must be alive when fingerprints are compared.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(fingerprint(item) for item in value)
+    return (type(value).__name__, id(value))
+
+
+def read_bindings(data, dataset):
+    """
+    Returns a comparable summary of the Read state of the objects named in `data`.
+
+    `data` is a list of [identifier, ...] items. A section editing these objects through the
+    Read keyword holds the objects read in the dataset, it must be rebuilt when one of them is
+    replaced or no longer read, even if the identifiers and types are the same.
+    """
+    bindings = []
+    for item in data:
+        declaration = dataset._declarations.get(item[0])
+        if declaration is None or declaration[1] <= 0:
+            bindings.append((item[0], False, None))
+        else:
+            bindings.append((item[0], True, id(dataset.get(item[0]))))
+    return tuple(bindings)
+
+
+def get_ecriture_lecture_special(dataset):
+    """Returns the type of the Ecriturelecturespecial keyword of the dataset, if any."""
+    for entry in dataset.entries:
+        if isinstance(entry, ta.trustify_gen_pyd.Ecriturelecturespecial):
+            return entry.type
+    return None
+
+
+class HomeSection:
+    def __init__(
+        self, title, attribute, extract, build, shared_list=None, bindings=None
+    ):
+        """
+        A section of the home page, displayed in an expansion panel.
+
+        ----------
+        Parameters
+
+        title: str
+            Title of the panel.
+
+        attribute: str
+            Name of the attribute of the HomeWidget holding the section widget.
+
+        extract: Callable
+            Function returning the data of the section from a dataset.
+
+        build: Callable
+            Function creating the section widget from the data and the dataset.
+
+        shared_list: list, optional
+            List shared with other widgets, kept filled with the data of the section.
+
+        bindings: Callable, optional
+            Function returning a comparable summary of the objects of the dataset held by the
+            widget beyond its data, from the data and the dataset, see `read_bindings`.
+
+        The data of the section is extracted at each dataset change, and the widget is
+        rebuilt only if the fingerprint of this data (and of its bindings) differs from the
+        displayed one.
+        """
+        self.attribute = attribute
+        self.extract = extract
+        self.build = build
+        self.shared_list = shared_list
+        self.bindings = bindings
+
+        self.dataset = None
+        self.data = None
+        self.widget = None
+
+        self.container = v.Container(children=[])
+        self.panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[title]),
+                v.ExpansionPanelContent(children=[self.container]),
+            ]
+        )
+
+    def displayed_data(self):
+        """Returns the current data of the displayed widget, including the user edits."""
+        if self.shared_list is not None:
+            return self.shared_list
+        return self.extract(self.dataset)
+
+    def state(self, data, dataset):
+        """Returns the summary of `data` of `dataset` compared to decide a rebuild."""
+        if self.bindings is None:
+            return fingerprint(data)
+        return fingerprint(data), self.bindings(data, dataset)
+
+    def update(self, dataset):
+        """
+        Binds the section to a new dataset.
+
+        Returns
+        -------
+        bool:
+            True if the data of the section changed, the widget is then dropped
+            until the next call to `show`.
+        """
+        data = self.extract(dataset)
+        unchanged = self.dataset is not None and self.state(
+            data, dataset
+        ) == self.state(self.displayed_data(), self.dataset)
+        if unchanged and self.widget is not None:
+            self.dataset = dataset
+            self.widget.dataset = dataset
+            return False
+
+        if not unchanged and self.widget is not None:
+            release_widget(self.widget)
+            self.widget = None
+            self.container.children = []
+        if self.shared_list is not None:
+            self.shared_list[:] = data
+            data = self.shared_list
+        self.dataset = dataset
+        self.data = data
+        return not unchanged
+
+    def show(self):
+        """
+        Builds the section widget if needed.
+
+        Returns
+        -------
+        bool:
+            True if a new widget was built.
+        """
+        if self.widget is not None:
+            return False
+        self.widget = self.build(self.data, self.dataset)
+        self.container.children = self.widget.content
+        return True
 
 
 class HomeWidget:
@@ -64,21 +240,23 @@ class HomeWidget:
         self.dataset = self.original_dataset
 
         # Get already solved problems from the dataset
-        self.solve_list = ta.get_solved_problems(self.dataset)
-
-        # Load dataset file list from internal data folder
-        data_dir = resources.files("trioapi.data")
-        self.dataset_list = ["Create from scratch"] + [
-            f.stem for f in data_dir.iterdir() if f.is_file() and f.suffix == ".data"
-        ]
-
-        # Dataset selection dropdown
-        self.select = v.Select(
-            items=self.dataset_list,
+        self.solve_list = get_view(self.dataset).get("solved_problems")
+
+        # Dataset selection dropdown, filtered on the kernel side from the index of the
+        # examples of the internal data folder, and filled one page at a time
+        self.selected_dataset = "Create from scratch"
+        self.dataset_search = ""
+        self.dataset_count = DATASET_PAGE_SIZE
+        self.select = v.Autocomplete(
+            items=[],
             label="Dataset",
-            v_model="Create from scratch",
+            v_model=self.selected_dataset,
+            no_filter=True,
+            search_input=None,
         )
+        self.update_dataset_items()
         self.select.observe(self.on_select_change, "v_model")
+        self.select.observe(self.on_search_change, "search_input")
         self.on_select_change(None)
 
         # File upload widget for loading a dataset file
@@ -88,12 +266,31 @@ class HomeWidget:
         )
         self.upload.observe(self.on_upload_change, names="value")
 
+        # Progress of the parsing of an uploaded dataset, shown while it runs
+        self.parse_job = None
+        self.parse_label = ""
+        self.parse_status = v.Html(tag="div", children=[], class_="text-body-2")
+        self.parse_progress = v.ProgressLinear(indeterminate=True, color="primary")
+        self.parse_cancel_button = v.Btn(children=["Cancel"], small=True, text=True)
+        self.parse_cancel_button.on_event("click", self.cancel_upload)
+        self.parse_row = v.Row(children=[], align="center", class_="mb-4")
+
         # Button to copy the current dataset to clipboard
         self.copy_btn = v.Btn(children=["Copy in clipboard"])
         self.copy_btn.on_event("click", self.copy_jdd)
 
-        # File chooser and filename field for exporting the dataset
-        self.filefield = FileChooser(use_dir_icons=True, show_only_dirs=True)
+        # Size and duration of the last export
+        self.export_status = v.Html(tag="div", children=[], class_="text-body-2 mt-2")
+
+        # Filename field and file chooser for exporting the dataset, the chooser (and
+        # ipyfilechooser) is only loaded when the user asks for it
+        self.filefield = None
+        self.choose_directory_button = v.Btn(children=["Choose a directory"])
+        self.choose_directory_button.on_event("click", self.show_file_chooser)
+        self.filefield_container = v.Container(
+            children=[self.choose_directory_button],
+            style_="max-width: 100%; overflow-x: auto;",
+        )
         self.file_name = v.TextField(
             label="File name",
             v_model=None,
@@ -106,231 +303,120 @@ class HomeWidget:
 
         # Button to confirm saving the dataset
         self.validate_button = v.Btn(children=["Validate"])
-        self.filefield.register_callback(self.write_data_directory)
-
-        # List of expandable panels for each dataset component
-        self.panels = []
-
-        # ----- Create and add widget panels for each dataset component -----
-
-        # Dimension panel
-        self.dim_widget = dimension_widget.DimensionWidget(2, self.dataset)
-        self.dim_content_container = v.Container(children=self.dim_widget.content)
-        self.dim_panel = v.ExpansionPanel(
-            children=[
-                v.ExpansionPanelHeader(children=["Dimension"]),
-                v.ExpansionPanelContent(children=[self.dim_content_container]),
-            ]
-        )
-        self.panels.append(self.dim_panel)
-
-        # Domains panel
-        self.dom_widget = domain_widget.DomainWidget([], self.dataset)
-        self.domain_content_container = v.Container(children=self.dom_widget.content)
-        self.domains_panel = v.ExpansionPanel(
-            children=[
-                v.ExpansionPanelHeader(children=["Domains"]),
-                v.ExpansionPanelContent(children=[self.domain_content_container]),
-            ]
-        )
-        self.panels.append(self.domains_panel)
-
-        # Mesh panel
-        self.mesh_widget = mesh_widget.MeshWidget([], self.dataset)
-        self.mesh_content_container = v.Container(children=self.mesh_widget.content)
-        self.panels.append(
-            v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=["Meshes"]),
-                    v.ExpansionPanelContent(children=[self.mesh_content_container]),
-                ]
-            )
-        )
-
-        # Partition panel
-        self.partition_widget = partition_widget.PartitionWidget([], self.dataset)
-        self.partition_content_container = v.Container(
-            children=self.partition_widget.content
-        )
-        self.panels.append(
-            v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=["Partitions"]),
-                    v.ExpansionPanelContent(
-                        children=[self.partition_content_container]
-                    ),
-                ]
-            )
-        )
-
-        # Scatter panel
-        self.scatter_widget = scatter_widget.ScatterWidget([], self.dataset)
-        self.scatter_content_container = v.Container(
-            children=self.scatter_widget.content
-        )
-        self.panels.append(
-            v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=["Scatters"]),
-                    v.ExpansionPanelContent(children=[self.scatter_content_container]),
-                ]
-            )
-        )
-
-        # Mailler panel
-        self.mailler_widget = mailler_widget.MaillerWidget([], self.dataset)
-        self.mailler_content_container = v.Container(
-            children=self.mailler_widget.content
-        )
-        self.panels.append(
-            v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=["Maillers"]),
-                    v.ExpansionPanelContent(children=[self.mailler_content_container]),
-                ]
-            )
-        )
-
-        # Discretization panel
-        self.dis_widget = discretization_widget.DiscretizationWidget([], self.dataset)
-        self.dis_content_container = v.Container(children=self.dis_widget.content)
-        self.panels.append(
-            v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=["Discretizations"]),
-                    v.ExpansionPanelContent(children=[self.dis_content_container]),
-                ]
-            )
-        )
-
-        # Problems panel
-        self.pb_widget = problem_widget.ProblemWidget(
-            self.pb_list,
-            pb_callback=self.pb_callback,
-            ds_callback=self.ds_callback,
-            dataset=self.dataset,
-        )
-        self.pb_content_container = v.Container(children=self.pb_widget.content)
-        self.problems_panel = v.ExpansionPanel(
-            children=[
-                v.ExpansionPanelHeader(children=["Problems"]),
-                v.ExpansionPanelContent(children=[self.pb_content_container]),
-            ]
-        )
-        self.panels.append(self.problems_panel)
-
-        # Schemes panel
-        self.sch_widget = scheme_widget.SchemeWidget(
-            self.sch_list,
-            sch_callback=self.sch_callback,
-            ds_callback=self.ds_callback,
-            dataset=self.dataset,
-        )
-        self.sch_content_container = v.Container(children=self.sch_widget.content)
-        self.panels.append(
-            v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=["Schemes"]),
-                    v.ExpansionPanelContent(children=[self.sch_content_container]),
-                ]
-            )
-        )
-
-        # Associations panel
-        self.associate_widget = associate_widget.AssociateWidget(
-            [], dataset=self.dataset
-        )
-        self.associate_content_container = v.Container(
-            children=self.associate_widget.content
-        )
-        self.panels.append(
-            v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=["Associations"]),
-                    v.ExpansionPanelContent(
-                        children=[self.associate_content_container]
-                    ),
-                ]
-            )
-        )
-
-        # Discretize panel
-        self.discretize_widget = discretize_widget.DiscretizeWidget(
-            [], dataset=self.dataset
-        )
-        self.discretize_content_container = v.Container(
-            children=self.discretize_widget.content
-        )
-        self.panels.append(
-            v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=["Discretize"]),
-                    v.ExpansionPanelContent(
-                        children=[self.discretize_content_container]
-                    ),
-                ]
-            )
-        )
-
-        # Solve panel
-        self.solve_widget = solve_widget.SolveWidget(
-            self.solve_list, dataset=self.dataset
-        )
-        self.solve_content_container = v.Container(children=self.solve_widget.content)
-        self.panels.append(
-            v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=["Solves"]),
-                    v.ExpansionPanelContent(children=[self.solve_content_container]),
-                ]
-            )
-        )
 
-        # Coupled Problems panel
-        self.coupled_problem_widget = coupled_problem_widget.CoupledProblemWidget(
-            [], dataset=self.dataset
-        )
-        self.coupled_problem_content_container = v.Container(
-            children=self.coupled_problem_widget.content
-        )
-        self.panels.append(
-            v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=["Coupled problems"]),
-                    v.ExpansionPanelContent(
-                        children=[self.coupled_problem_content_container]
-                    ),
-                ]
-            )
-        )
-
-        # Ecriture lecture special panel
-        self.ecriture_lecture_special_widget = (
-            ecriture_lecture_special_widget.EcritureLectureSpecialWidget(
-                dataset=self.dataset
-            )
-        )
-        self.ecriture_lecture_special_container = v.Container(
-            children=self.ecriture_lecture_special_widget.content
-        )
-        self.panels.append(
-            v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(
-                        children=[
-                            "Choose to write or not to write a .xyz file on the disk at the end of the calculation. (Ecriturelecturespecial keyword)"
-                        ]
-                    ),
-                    v.ExpansionPanelContent(
-                        children=[self.ecriture_lecture_special_container]
-                    ),
-                ]
-            )
-        )
+        # ----- Sections of the advanced configuration, one panel each -----
+        # A section widget is only built when its panel is opened, and rebuilt on a dataset
+        # change only if the data it displays changed
+        self.sections = [
+            HomeSection(
+                "Dimension",
+                "dim_widget",
+                extractor("dimension"),
+                section_widget("dimension_widget", "DimensionWidget"),
+            ),
+            HomeSection(
+                "Domains",
+                "dom_widget",
+                extractor("domain"),
+                section_widget("domain_widget", "DomainWidget"),
+            ),
+            HomeSection(
+                "Meshes",
+                "mesh_widget",
+                extractor("mesh"),
+                section_widget("mesh_widget", "MeshWidget"),
+            ),
+            HomeSection(
+                "Partitions",
+                "partition_widget",
+                extractor("partition"),
+                section_widget("partition_widget", "PartitionWidget"),
+            ),
+            HomeSection(
+                "Scatters",
+                "scatter_widget",
+                extractor("scatter"),
+                section_widget("scatter_widget", "ScatterWidget"),
+            ),
+            HomeSection(
+                "Maillers",
+                "mailler_widget",
+                extractor("maillage"),
+                section_widget("mailler_widget", "MaillerWidget"),
+            ),
+            HomeSection(
+                "Discretizations",
+                "dis_widget",
+                extractor("dis"),
+                section_widget("discretization_widget", "DiscretizationWidget"),
+                bindings=read_bindings,
+            ),
+            HomeSection(
+                "Problems",
+                "pb_widget",
+                extractor("read_pb"),
+                section_widget(
+                    "problem_widget",
+                    "ProblemWidget",
+                    pb_callback=self.pb_callback,
+                    ds_callback=self.ds_callback,
+                ),
+                shared_list=self.pb_list,
+            ),
+            HomeSection(
+                "Schemes",
+                "sch_widget",
+                extractor("read_sch"),
+                section_widget(
+                    "scheme_widget",
+                    "SchemeWidget",
+                    sch_callback=self.sch_callback,
+                    ds_callback=self.ds_callback,
+                ),
+                shared_list=self.sch_list,
+            ),
+            HomeSection(
+                "Associations",
+                "associate_widget",
+                extractor("associations"),
+                section_widget("associate_widget", "AssociateWidget"),
+            ),
+            HomeSection(
+                "Discretize",
+                "discretize_widget",
+                extractor("discretize"),
+                section_widget("discretize_widget", "DiscretizeWidget"),
+            ),
+            HomeSection(
+                "Solves",
+                "solve_widget",
+                extractor("solved_problems"),
+                section_widget("solve_widget", "SolveWidget"),
+                shared_list=self.solve_list,
+            ),
+            HomeSection(
+                "Coupled problems",
+                "coupled_problem_widget",
+                extractor("coupled_problems"),
+                section_widget("coupled_problem_widget", "CoupledProblemWidget"),
+            ),
+            HomeSection(
+                "Choose to write or not to write a .xyz file on the disk at the end of the calculation. (Ecriturelecturespecial keyword)",
+                "ecriture_lecture_special_widget",
+                get_ecriture_lecture_special,
+                lambda data, dataset: widget_class(
+                    "ecriture_lecture_special_widget", "EcritureLectureSpecialWidget"
+                )(dataset=dataset),
+            ),
+        ]
 
-        filefield_container = v.Container(
-            children=[self.filefield], style_="max-width: 100%; overflow-x: auto;"
+        # List of expandable panels for each dataset component
+        self.panels = [section.panel for section in self.sections]
+        self.sections_panels = v.ExpansionPanels(
+            children=self.panels, multiple=True, v_model=[]
         )
+        self.sections_panels.observe(self.on_panels_change, "v_model")
+        self.update_sections()
 
         # Main layout container, grouping all the UI elements
         self.main = [
@@ -379,6 +465,7 @@ class HomeWidget:
                                 align="center",
                                 class_="mb-4",
                             ),
+                            self.parse_row,
                         ],
                     ),
                     # Advanced dataset configuration
@@ -391,9 +478,7 @@ class HomeWidget:
                                 class_="text-h5 mb-4",
                             ),
                             v.Divider(class_="mb-4"),
-                            v.ExpansionPanels(
-                                children=self.panels, multiple=True, v_model=[]
-                            ),
+                            self.sections_panels,
                         ],
                     ),
                     # File management section
@@ -416,7 +501,7 @@ class HomeWidget:
                                                 class_="text-subtitle-1 font-weight-medium mb-2",
                                             ),
                                             self.file_name,
-                                            filefield_container,
+                                            self.filefield_container,
                                         ],
                                     ),
                                     v.Col(
@@ -428,6 +513,7 @@ class HomeWidget:
                                                 class_="text-subtitle-1 font-weight-medium mb-2",
                                             ),
                                             self.copy_btn,
+                                            self.export_status,
                                         ],
                                     ),
                                 ]
@@ -438,164 +524,243 @@ class HomeWidget:
             )
         ]
 
+    def update_dataset_items(self):
+        """
+        Fills the dataset select with the first examples matching the current search.
+
+        An item to load the next examples ends the list when there are more matches.
+        """
+        examples, count = search(self.dataset_search, limit=self.dataset_count)
+        items = [{"text": "Create from scratch", "value": "Create from scratch"}]
+        items += [{"text": info.label(), "value": info.name} for info in examples]
+        # The selected example must stay in the items to be displayed
+        if self.selected_dataset not in [item["value"] for item in items]:
+            items.append(
+                {"text": self.selected_dataset, "value": self.selected_dataset}
+            )
+        if count > len(examples):
+            items.append(
+                {
+                    "text": f"Show more ({count - len(examples)} remaining)",
+                    "value": LOAD_MORE,
+                }
+            )
+        self.select.items = items
+
+    def on_search_change(self, change):
+        """
+        Triggered when the user types in the dataset select, filters the examples.
+        """
+        search_input = change["new"] or ""
+        # Vuetify sets the search to the text of the selected item
+        if search_input == self.select_label():
+            search_input = ""
+        if search_input != self.dataset_search:
+            self.dataset_search = search_input
+            self.dataset_count = DATASET_PAGE_SIZE
+            self.update_dataset_items()
+
+    def select_label(self):
+        """Returns the text of the selected item of the dataset select."""
+        for item in self.select.items:
+            if item["value"] == self.selected_dataset:
+                return item["text"]
+        return self.selected_dataset
+
     def on_select_change(self, change):
         """
         Triggered when the user selects a different dataset from the dropdown.
 
         If 'Create from scratch' is selected, the widget reverts to the initial dataset.
-        Otherwise, the selected dataset is loaded from the internal storage via the Trio API.
+        Otherwise, the selected dataset is loaded from the internal storage via the Trio API,
+        or from the cache of parsed datasets if it was already loaded.
         The interface is then updated to reflect the contents of the new dataset.
         """
         if change:
             selected_dataset = change["new"]
+            if selected_dataset == LOAD_MORE:
+                # Not a dataset: the next page of examples is added to the items
+                self.dataset_count += DATASET_PAGE_SIZE
+                self.update_dataset_items()
+                self.select.v_model = self.selected_dataset
+                return
+            if selected_dataset is None or selected_dataset == self.selected_dataset:
+                return
+            self.selected_dataset = selected_dataset
             if selected_dataset == "Create from scratch":
                 self.dataset = self.original_dataset
             else:
-                self.dataset = ta.get_jdd(selected_dataset)
+                self.dataset = load_example(selected_dataset)
             self.update_dataset()
 
     def on_upload_change(self, inputs):
         """
         Triggered when a new dataset file is uploaded via the FileUpload widget.
 
-        The uploaded file is parsed using the TRUSTParser and TRUSTStream classes,
-        then used to create a new dataset object. The widget is refreshed accordingly.
+        The uploaded file is parsed on a worker thread, so that the interface stays responsive.
+        The widget is refreshed with the new dataset once the parsing is complete.
         """
+        if not self.upload.value:
+            return
         data_ex = self.upload.value[0].content.tobytes().decode("utf-8")
-        tp = TRUSTParser()
-        tp.tokenize(data_ex)
-        stream = TRUSTStream(tp)
-        dataset = ta.trustify_gen.Dataset_Parser.ReadFromTokens(stream)
+
+        # Only the last uploaded file is loaded
+        if self.parse_job is not None:
+            self.parse_job.cancel()
+        upload_name = self.upload.value[0].name
+        self.parse_label = f"{upload_name} ({len(data_ex.splitlines())} lines)"
+        self.show_parse_progress("Waiting")
+        self.parse_job = ParseJob(
+            data_ex,
+            on_done=self.on_upload_parsed,
+            on_error=self.on_upload_error,
+            on_progress=self.show_parse_progress,
+        ).start()
+
+    def on_upload_parsed(self, dataset):
+        """
+        Swaps in the dataset parsed from the uploaded file.
+        """
+        self.parse_job = None
+        self.parse_row.children = []
         self.dataset = dataset
         self.update_dataset()
 
-    def update_dataset(self):
+    def on_upload_error(self, error):
         """
-        Rebuilds all child widgets and UI panels based on the current dataset.
-
-        This method is responsible for:
-        - Re-initializing all sub-widgets with updated dataset content
-        - Refreshing problem and scheme lists
-        - Updating containers used by the expansion panels
-        - Triggering the main dataset callback
+        Reports a failure of the parsing of the uploaded file, the current dataset is kept.
         """
-        # Dimension management
-        self.dim_widget = dimension_widget.DimensionWidget(
-            ta.get_dimension(self.dataset), self.dataset
-        )
-        self.dim_content_container.children = self.dim_widget.content
-
-        # Domain management
-        self.dom_widget = domain_widget.DomainWidget(
-            ta.get_domain(self.dataset), self.dataset
-        )
-        self.domain_content_container.children = self.dom_widget.content
+        self.parse_job = None
+        self.parse_row.children = [
+            v.Alert(
+                children=[f"The dataset could not be parsed: {error}"],
+                type="error",
+                dense=True,
+                outlined=True,
+                class_="ma-2",
+            )
+        ]
 
-        # Mesh management
-        self.mesh_widget = mesh_widget.MeshWidget(
-            ta.get_mesh(self.dataset), self.dataset
-        )
-        self.mesh_content_container.children = self.mesh_widget.content
+    def show_parse_progress(self, step):
+        """
+        Displays the progress bar with the current step of the parsing.
+        """
+        self.parse_status.children = [f"Parsing {self.parse_label}: {step}"]
+        self.parse_row.children = [
+            v.Col(cols=10, children=[self.parse_status, self.parse_progress]),
+            v.Col(cols=2, children=[self.parse_cancel_button]),
+        ]
 
-        # Partition management
-        self.partition_widget = partition_widget.PartitionWidget(
-            ta.get_partition(self.dataset), self.dataset
-        )
-        self.partition_content_container.children = self.partition_widget.content
+    def cancel_upload(self, widget, event, data):
+        """
+        Cancels the parsing of the uploaded file, the current dataset is kept.
+        """
+        if self.parse_job is not None:
+            self.parse_job.cancel()
+            self.parse_job = None
+        self.parse_row.children = []
 
-        # Scatter management
-        self.scatter_widget = scatter_widget.ScatterWidget(
-            ta.get_scatter(self.dataset), self.dataset
-        )
-        self.scatter_content_container.children = self.scatter_widget.content
+    def on_panels_change(self, change):
+        """
+        Triggered when panels of the advanced configuration are opened or closed.
 
-        # Mailler (mesh generator) management
-        self.mailler_widget = mailler_widget.MaillerWidget(
-            ta.get_maillage(self.dataset), self.dataset
-        )
-        self.mailler_content_container.children = self.mailler_widget.content
+        The sections of the opened panels are built if they are not already.
+        """
+        with comm_trace.action("open section"):
+            for index in self.sections_panels.v_model or []:
+                self.show_section(self.sections[index])
 
-        # Discretization management
-        self.dis_widget = discretization_widget.DiscretizationWidget(
-            ta.get_dis(self.dataset), self.dataset
-        )
-        self.dis_content_container.children = self.dis_widget.content
-
-        # Problem management
-        self.pb_list.clear()
-        self.pb_list.extend(ta.get_read_pb(self.dataset))
-        self.pb_widget = problem_widget.ProblemWidget(
-            self.pb_list,
-            pb_callback=self.pb_callback,
-            ds_callback=self.ds_callback,
-            dataset=self.dataset,
-        )
-        self.pb_content_container.children = self.pb_widget.content
-
-        # Scheme management
-        self.sch_list.clear()
-        self.sch_list.extend(ta.get_read_sch(self.dataset))
-        self.sch_widget = scheme_widget.SchemeWidget(
-            self.sch_list,
-            sch_callback=self.sch_callback,
-            ds_callback=self.ds_callback,
-            dataset=self.dataset,
-        )
-        self.sch_content_container.children = self.sch_widget.content
+    def show_section(self, section):
+        """
+        Displays the widget of a section, building it if needed.
+        """
+        section.show()
+        setattr(self, section.attribute, section.widget)
 
-        # Association management
-        self.associate_widget = associate_widget.AssociateWidget(
-            ta.get_associations(self.dataset),
-            dataset=self.dataset,
-        )
-        self.associate_content_container.children = self.associate_widget.content
+    def update_sections(self):
+        """
+        Binds every section to the current dataset.
 
-        # Discretize management
-        self.discretize_widget = discretize_widget.DiscretizeWidget(
-            ta.get_discretize(self.dataset),
-            dataset=self.dataset,
-        )
-        self.discretize_content_container.children = self.discretize_widget.content
+        Only the sections whose data changed are rebuilt, at once if their panel is opened
+        or when it is opened otherwise.
 
-        # Solve management
-        self.solve_list.clear()
-        self.solve_list.extend(ta.get_solved_problems(self.dataset))
-        self.solve_widget = solve_widget.SolveWidget(
-            self.solve_list, dataset=self.dataset
-        )
-        self.solve_content_container.children = self.solve_widget.content
+        Returns
+        -------
+        set:
+            The attribute names of the changed sections.
+        """
+        # The data of the sections is extracted once from the views, and shared with MainApp.
+        # The data extracted before may predate the user edits, the views of the datasets
+        # displayed so far are dropped too.
+        for section in self.sections:
+            if section.dataset is not None:
+                get_view(section.dataset).invalidate()
+        get_view(self.dataset).invalidate()
+        opened = set(self.sections_panels.v_model or [])
+        changed = set()
+        for index, section in enumerate(self.sections):
+            if section.update(self.dataset):
+                changed.add(section.attribute)
+                if index in opened:
+                    section.show()
+            setattr(self, section.attribute, section.widget)
+        return changed
 
-        # Coupled problem management
-        self.coupled_problem_widget = coupled_problem_widget.CoupledProblemWidget(
-            ta.get_coupled_problems(self.dataset), dataset=self.dataset
-        )
-        self.coupled_problem_content_container.children = (
-            self.coupled_problem_widget.content
-        )
+    def update_dataset(self):
+        """
+        Updates the child widgets and UI panels based on the current dataset.
 
-        # EcritureLectureSpecial object management (to manage if xyz file is written or not)
-        self.ecriture_lecture_special_widget = (
-            ecriture_lecture_special_widget.EcritureLectureSpecialWidget(
-                dataset=self.dataset
-            )
-        )
-        self.ecriture_lecture_special_container.children = (
-            self.ecriture_lecture_special_widget.content
-        )
+        This method is responsible for:
+        - Rebuilding the sections whose content differs from the new dataset
+        - Refreshing problem and scheme lists
+        - Triggering the main dataset callback if the problems or schemes changed
+        """
+        with comm_trace.action("load dataset"):
+            changed = self.update_sections()
 
-        # Notify parent component of the dataset change
-        self.ds_callback(self.dataset)
+            # Notify parent component of the dataset change
+            if changed & {"pb_widget", "sch_widget"}:
+                self.ds_callback(self.dataset)
 
     def copy_jdd(self, widget, event, data):
         """
         Copies the current dataset to the system clipboard.
         """
-        newStream = self.dataset.toDatasetTokens()
-        s = "".join(newStream)
-        pyperclip.copy(s)
+        import pyperclip
+
+        text, report = dataset_text(self.dataset)
+        pyperclip.copy(text)
+        self.export_status.children = [f"Copied in clipboard: {report}"]
+
+    def show_file_chooser(self, widget, event, data):
+        """
+        Displays the file chooser of the export, building it the first time.
+        """
+        with comm_trace.action("open file chooser"):
+            if self.filefield is None:
+                from ipyfilechooser import FileChooser
+
+                self.filefield = FileChooser(use_dir_icons=True, show_only_dirs=True)
+                self.filefield.register_callback(self.write_data_directory)
+            self.filefield_container.children = [self.filefield]
 
     def write_data_directory(self, chooser):
         """
         Writes the current dataset to the selected directory and filename.
+
+        The dataset is streamed to the file, the size written and the time taken are reported.
         """
-        ta.write_data(self.dataset, self.file_name.v_model, chooser._selected_path)
+        file_name = self.file_name.v_model
+        if not file_name:
+            self.export_status.children = ["Enter a file name to export the dataset"]
+            return
+        if not file_name.endswith(".data"):
+            file_name += ".data"
+        try:
+            report = write_dataset(
+                self.dataset, Path(chooser._selected_path) / file_name
+            )
+        except OSError as error:
+            self.export_status.children = [f"The dataset could not be written: {error}"]
+        else:
+            self.export_status.children = [f"Exported: {report}"]
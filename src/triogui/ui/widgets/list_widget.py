@@ -1,11 +1,50 @@
 import ipyvuetify as v
-from .object import ObjectWidget
+from .history import ItemIndex
+from .object import ObjectWidget, expansion_panel, get_nested_attr
+
+
+class ListItem:
+    def __init__(self, index, panel, label, delete_button, duplicate_button):
+        """
+        The widgets of a displayed item of a ListWidget.
+
+        ----------
+        Parameters
+
+        index: ItemIndex
+            The position of the item, shared with the key paths of its editor and its buttons.
+
+        panel: v.ExpansionPanel
+            The panel of the item.
+
+        label: v.Col
+            The column of the header displaying the number of the item.
+
+        delete_button: v.Btn
+            Button deleting the item.
+
+        duplicate_button: v.Btn
+            Button duplicating the item.
+        """
+        self.index = index
+        self.panel = panel
+        self.label = label
+        self.delete_button = delete_button
+        self.duplicate_button = duplicate_button
+        # Set when the panel is no longer displayed, its editor must then not be built
+        self.removed = False
+
+    def move(self, offset):
+        """Shift the position of the item, its editor and buttons follow."""
+        self.index.value += offset
+        self.label.children = [f"Item {self.index.value + 1}"]
 
 
 class ListWidget:
-    def __init__(
-        self, current_object, expected_type, read_object, key_path, change_list
-    ):
+    # Number of items displayed at a time, the other ones are reached through the pagination
+    page_size = 20
+
+    def __init__(self, current_object, expected_type, read_object, key_path, history):
         """
         Creates a widget for editing lists of structured objects.
 
@@ -23,11 +62,13 @@ class ListWidget:
         key_path : list
             The nested path to the list inside the read_object.
 
-        change_list : list
-            The list of change states for undo/redo support.
+        history : ChangeHistory
+            The undo history of read_object, through which the list is modified.
 
         This widget is composer by a panel for each items of the list. It is possible to add an element to the list
-        and duplicate or delete each element. In the panel every field is displayed to modify the corresponding item
+        and duplicate or delete each element. In the panel every field is displayed to modify the corresponding item.
+        Only one page of `page_size` items is rendered at a time, the editor of an item is built when its panel
+        is expanded.
         """
 
         # UI container to hold the item panels
@@ -38,88 +79,261 @@ class ListWidget:
         self.expected_type = expected_type
         self.read_object = read_object
         self.key_path = key_path
-        self.change_list = change_list
+        self.history = history
 
-        # Store references to action buttons
-        self.delete_buttons = []
-        self.duplicate_buttons = []
+        # Widgets of the displayed items, and callbacks of their action buttons
+        self.displayed = []
+        self.on_delete = None
+        self.on_duplicate = None
+
+        # Index of the displayed page
+        self.page = 0
 
         # Button to add a new item to the list
         self.add_button = v.Btn(children=["Add a new item"])
 
+        # Item count, pagination and jump to an item
+        self.count_label = v.Html(tag="span", children=[], class_="mr-4")
+        self.pagination = v.Pagination(length=1, v_model=1, total_visible=7)
+        self.pagination.observe(self.change_page, "v_model")
+        self.jump_field = v.TextField(
+            label="Go to item",
+            type="number",
+            dense=True,
+            hide_details=True,
+            style_="max-width: 120px",
+        )
+        self.jump_field.on_event("change", self.jump_to_item)
+        self.toolbar = v.Row(
+            children=[self.count_label], align="center", no_gutters=True
+        )
+
         # Collapsible container that holds all item panels
         self.expand_panel = v.ExpansionPanels(children=[self.container])
 
-        # Main content: panels + add button
-        self.content = v.Content(children=[self.expand_panel, self.add_button])
+        # Main content: toolbar + panels + add button
+        self.content = v.Content(
+            children=[self.toolbar, self.expand_panel, self.add_button]
+        )
 
-        # Build the UI panels for all existing items
+        # Build the UI panels for the first items
         self.build_panels(self.current_object)
 
-    def build_panels(self, object_to_display):
+    @property
+    def delete_buttons(self):
+        return [item.delete_button for item in self.displayed]
+
+    @property
+    def duplicate_buttons(self):
+        return [item.duplicate_button for item in self.displayed]
+
+    def page_count(self):
+        """Returns the number of pages of the displayed list."""
+        return max(1, -(-len(self.current_object) // self.page_size))
+
+    def bind_item_buttons(self, on_delete, on_duplicate):
+        """
+        Sets the click callbacks of the delete and duplicate buttons of the items.
+
+        The buttons of the displayed items are bound at once, the ones of the items displayed
+        later when their page is built.
+        """
+        self.on_delete = on_delete
+        self.on_duplicate = on_duplicate
+        for button in self.delete_buttons:
+            button.on_event("click.stop", on_delete)
+        for button in self.duplicate_buttons:
+            button.on_event("click.stop", on_duplicate)
+
+    def change_page(self, change):
+        """
+        Triggered when the user selects a page, renders its items.
+        """
+        page = (change["new"] or 1) - 1
+        if page != self.page:
+            self.page = page
+            self.build_panels(get_nested_attr(self.read_object, self.key_path))
+
+    def jump_to_item(self, widget, event, data):
+        """
+        Displays the page of the item whose number was entered.
+        """
+        try:
+            index = int(data) - 1
+        except (TypeError, ValueError):
+            return
+        self.show_item(index)
+
+    def show_item(self, index):
+        """
+        Displays the page containing the item at `index` (clamped to the list bounds).
         """
-        Build the list of expansion panels, one per item in the list.
+        items = get_nested_attr(self.read_object, self.key_path)
+        index = min(max(index, 0), max(len(items) - 1, 0))
+        self.page = index // self.page_size
+        self.build_panels(items)
+
+    def update_toolbar(self):
+        """
+        Updates the item count and the pagination, which are only shown for long lists.
+        """
+        start = self.page * self.page_size
+        end = start + len(self.displayed)
+        size = len(self.current_object)
+        self.count_label.children = [
+            f"{size} items"
+            if end - start == size
+            else f"Items {start + 1}-{end} of {size}"
+        ]
+        self.pagination.length = self.page_count()
+        self.pagination.v_model = self.page + 1
+        self.toolbar.children = (
+            [self.count_label, self.pagination, self.jump_field]
+            if self.page_count() > 1
+            else [self.count_label]
+        )
+
+    def create_item(self, index):
+        """
+        Creates the widgets of the item at `index`.
 
         Each item includes:
         - A header with its index and action buttons
-        - A panel with editable fields rendered via ObjectWidget
-        """
-        # Reset UI
-        self.container.children = []
-        self.delete_buttons = []
-        self.duplicate_buttons = []
-
-        for i, item in enumerate(object_to_display):
-            # Store current container state to append to
-            current_container = self.container.children
-
-            # Create delete button for item
-            delete_button = v.Btn(
-                icon=True,
-                small=True,
-                color="red",
-                children=[v.Icon(children=["mdi-delete"])],
-            )
-            delete_button.kwargs = {"index": i}
-            self.delete_buttons.append(delete_button)
-
-            # Create duplicate button for item
-            duplicate_button = v.Btn(
-                icon=True,
-                small=True,
-                color="blue",
-                children=[v.Icon(children=["mdi-content-copy"])],
+        - A panel with editable fields rendered via ObjectWidget, built when expanded
+        """
+        item_index = ItemIndex(index)
+
+        # Create delete button for item
+        delete_button = v.Btn(
+            icon=True,
+            small=True,
+            color="red",
+            children=[v.Icon(children=["mdi-delete"])],
+        )
+        delete_button.kwargs = {"index": item_index}
+
+        # Create duplicate button for item
+        duplicate_button = v.Btn(
+            icon=True,
+            small=True,
+            color="blue",
+            children=[v.Icon(children=["mdi-content-copy"])],
+        )
+        duplicate_button.kwargs = {"index": item_index}
+
+        # The buttons sit in the header of the panel, their clicks must not expand it
+        if self.on_delete is not None:
+            delete_button.on_event("click.stop", self.on_delete)
+        if self.on_duplicate is not None:
+            duplicate_button.on_event("click.stop", self.on_duplicate)
+
+        def build_editor():
+            # A removed item has no value at its index anymore, and the key path would
+            # register the handlers of another item
+            if item.removed:
+                return v.Html(tag="div", children=[])
+            return ObjectWidget.show_widget(
+                get_nested_attr(self.read_object, self.key_path + [item_index]),
+                (self.expected_type, False),
+                self.read_object,
+                self.key_path + [item_index],
+                self.history,
             )
-            duplicate_button.kwargs = {"index": i}
-            self.duplicate_buttons.append(duplicate_button)
 
-            # Wrap item content in expandable panel
-            new_panel = v.ExpansionPanel(
+        # Wrap item content in expandable panel, the item editor is built on expand.
+        # Its key path holds the ItemIndex, so it stays valid when the item moves.
+        label = v.Col(children=[f"Item {index + 1}"], cols=8)
+        item = ListItem(item_index, None, label, delete_button, duplicate_button)
+        item.panel = expansion_panel(
+            v.Row(
                 children=[
-                    v.ExpansionPanelHeader(
-                        children=[
-                            v.Row(
-                                children=[
-                                    v.Col(children=[f"Item {i + 1}"], cols=8),
-                                    v.Col(children=[duplicate_button], cols=2),
-                                    v.Col(children=[delete_button], cols=2),
-                                ]
-                            )
-                        ]
-                    ),
-                    v.ExpansionPanelContent(
-                        children=[
-                            ObjectWidget.show_widget(
-                                item,
-                                (self.expected_type, False),
-                                self.read_object,
-                                self.key_path + [i],
-                                self.change_list,
-                            )
-                        ]
-                    ),
+                    label,
+                    v.Col(children=[duplicate_button], cols=2),
+                    v.Col(children=[delete_button], cols=2),
                 ]
-            )
+            ),
+            build_editor,
+        )
+        return item
+
+    def build_panels(self, object_to_display):
+        """
+        Build the list of expansion panels of the displayed page, one per item.
+        """
+        self.current_object = object_to_display
+
+        # Reset UI, widgets of the items of the previous page are no longer displayed
+        self.history.widgets.unregister_children(self.key_path)
+        for item in self.displayed:
+            item.removed = True
+
+        # Keep the page in the bounds of the list, which may have shrunk
+        self.page = min(self.page, self.page_count() - 1)
+        start = self.page * self.page_size
+        end = min(start + self.page_size, len(object_to_display))
+
+        self.displayed = [self.create_item(i) for i in range(start, end)]
+
+        # Add the panels of the page to the container at once
+        self.container.children = [item.panel for item in self.displayed]
+        self.update_toolbar()
+
+    def insert_item(self, index, reveal=False):
+        """
+        Displays an item inserted in the list at `index`, without rebuilding the other items.
+
+        The items displayed after it are renumbered in place. If `reveal` is True and the item
+        is not on the displayed page, its page is displayed instead.
+        """
+        self.current_object = get_nested_attr(self.read_object, self.key_path)
+        self.history.widgets.shift_items(self.key_path, index, 1)
+        start = self.page * self.page_size
+
+        if index < start or (reveal and index >= start + self.page_size):
+            # The displayed page is shifted or left
+            self.show_item(index if reveal else start)
+            return
+
+        if index < start + self.page_size:
+            position = index - start
+            for item in self.displayed[position:]:
+                item.move(1)
+            self.displayed.insert(position, self.create_item(index))
+            # The last item moves to the next page
+            if len(self.displayed) > self.page_size:
+                removed = self.displayed.pop()
+                removed.removed = True
+                self.history.widgets.unregister(self.key_path + [removed.index])
+            self.container.children = [item.panel for item in self.displayed]
+        self.update_toolbar()
+
+    def remove_item(self, index):
+        """
+        Removes the panel of the item removed from the list at `index`.
+
+        The items displayed after it are renumbered in place and the first item of the next
+        page, if any, takes the freed place.
+        """
+        self.current_object = get_nested_attr(self.read_object, self.key_path)
+        self.history.widgets.unregister(self.key_path + [index])
+        self.history.widgets.shift_items(self.key_path, index + 1, -1)
+        start = self.page * self.page_size
+
+        if index < start or not self.displayed:
+            self.build_panels(self.current_object)
+            return
 
-            # Add the panel to the container
-            self.container.children = current_container + [new_panel]
+        if index < start + len(self.displayed):
+            position = index - start
+            self.displayed.pop(position).removed = True
+            for item in self.displayed[position:]:
+                item.move(-1)
+            end = start + len(self.displayed)
+            if end < min(start + self.page_size, len(self.current_object)):
+                self.displayed.append(self.create_item(end))
+            if not self.displayed:
+                # The page is now empty, the previous one is displayed
+                self.build_panels(self.current_object)
+                return
+            self.container.children = [item.panel for item in self.displayed]
+        self.update_toolbar()
@@ -1,11 +1,72 @@
+import asyncio
+
 import ipyvuetify as v
 import triogui.ui.widgets as w  # noqa: F403
 import trioapi as ta
+from ... import comm_trace
+from ...dataset_view import get_view
+
+
+class TabController:
+    def __init__(self, read_object, on_rebuild):
+        """
+        Controller of the tab of a problem or scheme.
+
+        The ObjectWidget of the tab is built on first use. The controller owns the single
+        click handler of its Cancel button, which is bound once per built widget and not
+        re-wired by the menu updates.
+
+        ----------
+        Parameters
+
+        read_object: Pydantic object
+            The object edited in the tab.
+
+        on_rebuild: Callable
+            Called with the controller when its widget was replaced, to refresh the display.
+        """
+        self.read_object = read_object
+        self.on_rebuild = on_rebuild
+        self.widget = None
+
+    def get(self):
+        """Returns the ObjectWidget of the tab, building it the first time."""
+        if self.widget is None:
+            self.set_widget(w.ObjectWidget(self.read_object))
+        return self.widget
 
-from .object import ObjectWidget
+    def set_widget(self, obj_widget):
+        self.widget = obj_widget
+        obj_widget.cancel_button.on_event("click", self.cancel)
+
+    def set_object(self, read_object):
+        """
+        Edits another object in the tab, its widget is built when displayed.
+        """
+        self.read_object = read_object
+        self.widget = None
+        self.on_rebuild(self)
+
+    def cancel(self, widget, event, data):
+        """
+        Triggered by the Cancel button, undoes the last change of the object.
+        """
+        with comm_trace.action("undo"):
+            # Undo the last change and patch in place the widgets bound to its key path
+            if not self.widget.undo():
+                # No displayed widget is bound to it, recreate the widget with restored state
+                self.set_widget(w.ObjectWidget(self.read_object, self.widget.history))
+                self.on_rebuild(self)
+
+    @property
+    def main(self):
+        return self.get().main
 
 
 class MainApp:
+    # When True, the tab following the selected one is built once the selected one is displayed
+    prefetch = False
+
     def __init__(self):
         """
         Main entry point of the GUI application.
@@ -16,7 +77,13 @@ class MainApp:
         - Display of Problems and Schemes
         - Object editing
         - Undo functionality for changes
+
+        With TRIOGUI_COMM_TRACE set, the messages sent to the browser are accounted by user
+        action and displayed in an additional "Comm traffic" tab.
         """
+        if comm_trace.ENABLED:
+            comm_trace.install()
+
         # Initialize tab titles and content widgets
         self.tab_titles = ["Home"]
         self.tab_widgets = []  # One widget per tab
@@ -25,6 +92,14 @@ class MainApp:
         self.pb_list = []
         self.sch_list = []
 
+        # (object, TabController) by id of the edited object, reused across menu updates
+        self.widget_cache = {}
+
+        # (title, widget) of the tabs displayed after the problems and schemes
+        self.extra_tabs = []
+        if comm_trace.trace.installed:
+            self.extra_tabs.append(("Comm traffic", w.CommTraceWidget()))
+
         # Create the horizontal tab bar
         self.tab = v.Tabs(
             v_model=0,  # Active tab index
@@ -33,7 +108,7 @@ class MainApp:
             slider_size=4,
             align_with_title=True,
             show_arrows=True,
-            children=[v.Tab(children=[k]) for k in self.tab_titles],
+            children=self.tab_bar(),
         )
 
         # Create the HomeWidget and add it as the first (main) tab
@@ -65,10 +140,39 @@ class MainApp:
         """
         Triggered when the user changes tabs.
 
-        Displays the corresponding widget content for the selected tab.
+        Displays the corresponding widget content for the selected tab. The ObjectWidget of a
+        problem or scheme is built the first time its tab is selected.
         """
-        widget = self.tab_widgets[self.tab.v_model]
-        self.content.children = widget.main
+        with comm_trace.action("change tab"):
+            extras = [extra for _, extra in self.extra_tabs]
+            widget = (self.tab_widgets + extras)[self.tab.v_model]
+            self.content.children = widget.main
+            # The extra tabs are only refreshed while they are displayed
+            for extra in extras:
+                if extra is widget:
+                    extra.show()
+                else:
+                    extra.hide()
+            if self.prefetch:
+                self.prefetch_tab(self.tab.v_model + 1)
+
+    def prefetch_tab(self, index):
+        """
+        Schedules the construction of the widget of the tab at `index` on the event loop.
+
+        The construction runs after the current message is handled, so the selected tab is
+        displayed first. Nothing is done outside of a running event loop.
+        """
+        if not 0 <= index < len(self.tab_widgets):
+            return
+        tab = self.tab_widgets[index]
+        if not isinstance(tab, TabController) or tab.widget is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.call_soon(tab.get)
 
     def update_menu_pb(
         self, index, modified_object, already_created, original_identifier, dataset
@@ -102,9 +206,7 @@ class MainApp:
                 )
             else:
                 # Object type changed
-                self.tab_widgets[index + 1] = ObjectWidget(
-                    self.pb_list[index][1], [self.pb_list[index][1]]
-                )
+                self.replace_tab_object(index + 1, self.pb_list[index][1])
                 ta.change_read_object(
                     dataset, original_identifier, "obj", self.pb_list[index][1]
                 )
@@ -113,16 +215,12 @@ class MainApp:
             self.tab_titles.insert(index + 1, self.pb_list[index][0])
             self.tab_widgets.insert(
                 index + 1,
-                ObjectWidget(self.pb_list[index][1], [self.pb_list[index][1]]),
+                self.get_object_tab(self.pb_list[index][1]),
             )
             ta.add_object(dataset, self.pb_list[index][1], self.pb_list[index][0])
 
         # Refresh the tab display
-        self.tab.children = [v.Tab(children=[k]) for k in self.tab_titles]
-
-        # Add undo functionality to each object widget
-        for i, obj_widget in enumerate(self.tab_widgets[1:], 1):
-            self.setup_cancel_buttons(i, obj_widget, dataset.get(self.tab_titles[i]))
+        self.update_tab_bar()
 
     def update_menu_sch(
         self, index, modified_object, already_created, original_identifier, dataset
@@ -158,9 +256,7 @@ class MainApp:
                     dataset, original_identifier, "identifier", self.sch_list[index][0]
                 )
             else:
-                self.tab_widgets[tab_index + 1] = ObjectWidget(
-                    self.sch_list[index][1], [self.sch_list[index][1]]
-                )
+                self.replace_tab_object(tab_index + 1, self.sch_list[index][1])
                 ta.change_read_object(
                     dataset, original_identifier, "obj", self.sch_list[index][1]
                 )
@@ -168,14 +264,11 @@ class MainApp:
             self.tab_titles.insert(tab_index + 1, self.sch_list[index][0])
             self.tab_widgets.insert(
                 tab_index + 1,
-                ObjectWidget(self.sch_list[index][1], [self.sch_list[index][1]]),
+                self.get_object_tab(self.sch_list[index][1]),
             )
             ta.add_object(dataset, self.sch_list[index][1], self.sch_list[index][0])
 
-        self.tab.children = [v.Tab(children=[k]) for k in self.tab_titles]
-
-        for i, obj_widget in enumerate(self.tab_widgets[1:], 1):
-            self.setup_cancel_buttons(i, obj_widget, dataset.get(self.tab_titles[i]))
+        self.update_tab_bar()
 
     def get_nbr_pb(self):
         """
@@ -196,57 +289,80 @@ class MainApp:
         dataset : Dataset
             The new dataset to load into the UI.
         """
-        read_objects = [pb[0] for pb in ta.get_read_pb(dataset)] + [
-            sch[0] for sch in ta.get_read_sch(dataset)
+        # The problems and schemes were extracted by the home page when loading the dataset,
+        # the view is invalidated by the widgets deleting one of them
+        view = get_view(dataset)
+        read_objects = [pb[0] for pb in view.get("read_pb")] + [
+            sch[0] for sch in view.get("read_sch")
         ]
         self.tab_titles = self.tab_titles[:1] + read_objects
 
-        # Create ObjectWidgets for each problem and scheme
-        widgets = [
-            w.ObjectWidget(dataset.get(i), [dataset.get(i)]) for i in read_objects
-        ]
+        # Reuse the tabs of the problems and schemes already displayed, the other ones are
+        # built when selected
+        widgets = [self.get_object_tab(dataset.get(i)) for i in read_objects]
         self.tab_widgets = self.tab_widgets[:1] + widgets
 
         # Update the tab bar
-        self.tab.children = [v.Tab(children=[k]) for k in self.tab_titles]
+        self.update_tab_bar()
 
-        # Add cancel buttons for each editable object
-        for i, obj_widget in enumerate(self.tab_widgets[1:], 1):
-            self.setup_cancel_buttons(i, obj_widget, dataset.get(self.tab_titles[i]))
+    def tab_bar(self):
+        """Returns the tabs of the tab bar, one per title and extra tab."""
+        titles = self.tab_titles + [title for title, _ in self.extra_tabs]
+        return [v.Tab(children=[k]) for k in titles]
 
-    def setup_cancel_buttons(self, index, obj_widget, original):
+    def update_tab_bar(self):
         """
-        Adds undo behavior to a given ObjectWidget via the Cancel button.
-
-        Parameters
-        ----------
-        index : int
-            Tab index for the widget.
-
-        obj_widget : ObjectWidget
-            The current editable object widget.
+        Displays the current tab titles and drops the cached tabs which are no longer used.
+        """
+        self.tab.children = self.tab_bar()
+        self.prune_widget_cache()
 
-        original : object
-            The original object instance tied to the dataset.
+    def get_object_tab(self, read_object):
         """
+        Returns the tab editing `read_object`, creating its placeholder the first time.
 
-        def cancel(widget, event, data):
-            # Undo the last change if there's a history
-            if len(obj_widget.change_list) > 1:
-                obj_widget.change_list.pop()
-                restored = obj_widget.change_list[-1]
+        The tabs are cached by identity of the object: the edits made in a widget are
+        already displayed by it, while an object replaced in the dataset (type change, new
+        dataset) is a new object and gets a new tab.
 
-                # Replace object attributes to revert state
-                original.__dict__.clear()
-                original.__dict__.update(restored.__dict__)
+        Parameters
+        ----------
+        read_object : object
+            A problem or scheme of the dataset.
+        """
+        cached = self.widget_cache.get(id(read_object))
+        if cached is not None and cached[0] is read_object:
+            return cached[1]
+        tab = TabController(read_object, self.refresh_tab)
+        self.widget_cache[id(read_object)] = (read_object, tab)
+        return tab
+
+    def replace_tab_object(self, index, read_object):
+        """
+        Updates in place the tab at `index` to edit `read_object`, after a type change.
+        """
+        tab = self.tab_widgets[index]
+        self.widget_cache.pop(id(tab.read_object), None)
+        self.widget_cache[id(read_object)] = (read_object, tab)
+        tab.set_object(read_object)
 
-                # Recreate the widget with restored state
-                new_obj_widget = w.ObjectWidget(original, obj_widget.change_list)
-                self.setup_cancel_buttons(index, new_obj_widget, original)
-                self.tab_widgets[index] = new_obj_widget
-                self.content.children = new_obj_widget.main
+    def refresh_tab(self, tab):
+        """
+        Displays again the widget of `tab` if it is the selected tab.
+        """
+        if tab in self.tab_widgets[self.tab.v_model : self.tab.v_model + 1]:
+            self.content.children = tab.main
 
-        obj_widget.cancel_button.on_event("click", cancel)
+    def prune_widget_cache(self):
+        """
+        Drops the cached tabs which are no longer displayed.
+        """
+        displayed = {id(tab) for tab in self.tab_widgets}
+        self.widget_cache = {
+            key: (obj, tab)
+            for key, (obj, tab) in self.widget_cache.items()
+            if id(tab) in displayed
+        }
 
     def get_app(self):
         """Return the created app"""
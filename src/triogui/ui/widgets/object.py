@@ -1,9 +1,13 @@
 import ipyvuetify as v
 import trioapi as ta
 import inspect
-from typing import get_origin, get_args, Literal, Union
+from typing import get_args
 import copy
+import functools
+import operator
+from ... import comm_trace
 from . import (
+    schema,
     str_widget,
     dropdown_widget,
     float_widget,
@@ -22,7 +26,7 @@ def set_nested_attr(obj, attr_list, value):
         The root object from which the nested attribute access begins.
 
     attr_list: list
-        A list of attribute names (str) or indices (int) indicating the path to the nested attribute.
+        A list of attribute names (str) or indices (int or ItemIndex) indicating the path to the nested attribute.
 
     value: any
         The new value to assign to the final nested attribute.
@@ -41,13 +45,13 @@ def set_nested_attr(obj, attr_list, value):
                             obj, attr, get_args(obj.model_fields[attr].annotation)[0]()
                         )
                 obj = getattr(obj, attr)
-            elif isinstance(attr, int):
+            else:
                 obj = obj[attr]
 
         # Set the final attribute (by name or index)
         if isinstance(attr_list[-1], str):
             setattr(obj, attr_list[-1], value)
-        elif isinstance(attr_list[-1], int):
+        else:
             obj[attr_list[-1]] = value
 
 
@@ -63,7 +67,7 @@ def get_nested_attr(obj, attr_list):
         The root object from which the nested attribute access begins.
 
     attr_list: list
-        A list of attribute names (str) or indices (int) indicating the path to the nested attribute.
+        A list of attribute names (str) or indices (int or ItemIndex) indicating the path to the nested attribute.
 
     Returns
     -------
@@ -73,13 +77,106 @@ def get_nested_attr(obj, attr_list):
     for attr in attr_list:
         if isinstance(attr, str):
             obj = getattr(obj, attr)
-        elif isinstance(attr, int):
+        else:
             obj = obj[attr]
     return obj
 
 
+def expansion_panel(header_content, build_content):
+    """
+    Creates an expansion panel whose content is built the first time it is expanded.
+
+    Parameters
+    ----------
+    header_content: widget
+        The widget displayed in the header of the panel.
+
+    build_content: Callable
+        Function without argument returning the widget to display inside the panel.
+
+    Returns
+    -------
+    v.ExpansionPanel:
+        The panel, with an empty content until the user opens it when `ObjectWidget.lazy` is True.
+    """
+    content = v.ExpansionPanelContent(children=[])
+    header = v.ExpansionPanelHeader(children=[header_content])
+
+    if not ObjectWidget.lazy:
+        content.children = [build_content()]
+    else:
+
+        def expand(widget, event, data):
+            # Only the first click builds the subtree, the following ones just toggle the panel
+            if not content.children:
+                with comm_trace.action("expand panel"):
+                    content.children = [build_content()]
+
+        header.on_event("click", expand)
+
+    return v.ExpansionPanel(children=[header, content])
+
+
+@functools.cache
+def status_icon(optional):
+    """
+    Returns the indicator of an optional or required field.
+
+    The two indicators are created once and shared by the headers of every field.
+    """
+    if optional:
+        return v.Icon(
+            children=["mdi-minus-circle-outline"],
+            color="green",
+            attributes={"title": "This field is optional"},
+        )
+    return v.Icon(
+        children=["mdi-alert-circle-outline"],
+        color="orange",
+        attributes={"title": "This field is required"},
+    )
+
+
+def field_header(field, with_status=False):
+    """
+    Creates the header of a field: its name and an icon showing its documentation on hover.
+
+    Parameters
+    ----------
+    field: FieldDescriptor
+        The described field.
+
+    with_status: bool
+        If True, the shared optional/required indicator is appended.
+
+    Returns
+    -------
+    v.Row:
+        The header. The description and synonyms are a plain attribute of the icon, displayed
+        by the browser, instead of a tree of tooltip widgets.
+    """
+    help_text = "\n".join(
+        ["Description :", f"{field.description}", "Synonyms :"]
+        + [f"- {synonym}" for synonym in field.synonyms]
+    )
+    children = [
+        v.Html(tag="span", children=[field.name], class_="mr-2"),
+        v.Icon(
+            children=["mdi-information-outline"],
+            color="blue",
+            attributes={"title": help_text},
+        ),
+    ]
+    if with_status:
+        children.append(status_icon(field.optional))
+    return v.Row(children=children, align="center", no_gutters=True)
+
+
 class ObjectWidget:
-    def __init__(self, read_object, change_list):
+    # When True, nested panels are rendered only when the user expands them
+    lazy = True
+
+    def __init__(self, read_object, history=None):
         """
         Widget definition to interactively modify objects in the dataset.
 
@@ -89,108 +186,34 @@ class ObjectWidget:
         read_object: Pydantic object
             The object being modified. Its attributes will be rendered as editable UI fields.
 
-        change_list: list
-            A list tracking the history of changes made to `read_object`. Each change appends a deep copy.
+        history: ChangeHistory, optional
+            The undo history of `read_object`, a new one is created if not given.
         """
+        from .history import ChangeHistory
 
         # Store internal state
         self.read_object = read_object
-        self.change_list = change_list
+        self.history = history if history is not None else ChangeHistory(read_object)
+
+        # Key path -> widget registry, filled by show_widget and used to patch widgets on undo
+        self.registry = self.history.widgets
+        self.registry.clear()
 
         # UI containers
         self.panels = []  # List of expansion panels (for nested objects)
         self.container = []  # List of flat UI cards (for basic types)
 
-        # Tooltip for optional fields
-        self.optional_tooltip = v.Tooltip(
-            bottom=True,
-            v_slots=[
-                {
-                    "name": "activator",
-                    "variable": "tooltip",
-                    "children": v.Icon(
-                        children=["mdi-minus-circle-outline"],
-                        color="green",
-                        v_on="tooltip.on",
-                    ),
-                }
-            ],
-            children=["This field is optional"],
-        )
-
-        # Tooltip for required field
-        self.required_tooltip = v.Tooltip(
-            bottom=True,
-            v_slots=[
-                {
-                    "name": "activator",
-                    "variable": "tooltip",
-                    "children": v.Icon(
-                        children=["mdi-alert-circle-outline"],
-                        color="orange",
-                        v_on="tooltip.on",
-                    ),
-                }
-            ],
-            children=["This field is required"],
-        )
-
         # Loop through the fields of the object to build the widget
-        for key, value in read_object.model_fields.items():
-            # Create a tooltip showing description and synonyms
-            tooltip = v.Tooltip(
-                bottom=True,
-                v_slots=[
-                    {
-                        "name": "activator",
-                        "variable": "tooltip",
-                        "children": v.Icon(
-                            children=["mdi-information-outline"],
-                            color="blue",
-                            v_on="tooltip.on",
-                        ),
-                    }
-                ],
-                children=[
-                    v.Html(
-                        tag="div",
-                        children=[
-                            v.Html(tag="div", children=["Description :"]),
-                            v.Html(tag="div", children=[f"{value.description}"]),
-                            v.Html(tag="div", children=["Synonyms :"]),
-                            *[
-                                v.Html(tag="div", children=[f"- {synonym}"])
-                                for synonym in read_object._synonyms[key]
-                            ],
-                        ],
-                    )
-                ],
-            )
-
+        for field in schema.get_fields(type(read_object)):
+            key = field.name
             # Header for each attribute (field name + info icon)
-            header_content = v.Row(
-                children=[v.Html(tag="span", children=[key], class_="mr-2"), tooltip],
-                align="center",
-                no_gutters=True,
-            )
+            header_content = field_header(field, with_status=field.inline)
 
             # Determine expected type (basic type or nested structure)
-            expected_type = ta.extract_true_type(value)
+            expected_type = field.expected_type
 
             # Handle simple types directly (rendered as cards)
-            if (
-                expected_type[0] in [str, float, bool, int]
-                or get_origin(expected_type[0]) is Literal
-            ):
-                # Verify if the attribute is declared with an Optional
-                if get_origin(value.annotation) is Union:
-                    header_content.children = header_content.children + [
-                        self.optional_tooltip
-                    ]
-                else:
-                    header_content.children = header_content.children + [
-                        self.required_tooltip
-                    ]
+            if field.inline:
                 self.container.append(
                     v.Card(
                         children=[
@@ -208,7 +231,7 @@ class ObjectWidget:
                                                 expected_type,
                                                 self.read_object,
                                                 [key],
-                                                self.change_list,
+                                                self.history,
                                             )
                                         ],
                                         cols=9,
@@ -228,21 +251,18 @@ class ObjectWidget:
 
             # Handle nested types using expansion panels
             else:
-                panel_content = [
-                    ObjectWidget.show_widget(
-                        getattr(read_object, key),
-                        expected_type,
-                        self.read_object,
-                        [key],
-                        self.change_list,
-                    )
-                ]
                 self.panels.append(
-                    v.ExpansionPanel(
-                        children=[
-                            v.ExpansionPanelHeader(children=[header_content]),
-                            v.ExpansionPanelContent(children=panel_content),
-                        ]
+                    expansion_panel(
+                        header_content,
+                        lambda key=key, expected_type=expected_type: (
+                            ObjectWidget.show_widget(
+                                getattr(self.read_object, key),
+                                expected_type,
+                                self.read_object,
+                                [key],
+                                self.history,
+                            )
+                        ),
                     )
                 )
 
@@ -265,13 +285,28 @@ class ObjectWidget:
         # Store root layout
         self.main = [self.layout]
 
+    def undo(self):
+        """
+        Reverts the last change of the history and updates only the widgets bound to its key path.
+
+        Returns
+        -------
+        bool:
+            False if no displayed widget could be patched, the whole widget must then be rebuilt.
+        """
+        change = self.history.undo()
+        if change is None:
+            return True
+        with self.history.replaying():
+            return self.registry.refresh(change)
+
     @staticmethod
     def show_widget(
         current_object,
         expected_type,
         read_object,
         key_path,
-        change_list,
+        history,
         already_selected=False,
     ):
         """
@@ -279,7 +314,7 @@ class ObjectWidget:
 
         This method dynamically generates input widgets for simple types (str, int, bool, etc.),
         expansion panels for nested objects, and custom widgets for lists and Literal types.
-        It updates the `read_object` and appends changes to `change_list`.
+        It updates the `read_object` and records changes in `history`.
 
         Parameters
         ----------
@@ -295,44 +330,71 @@ class ObjectWidget:
         key_path : list
             A list of attribute names/indexes tracing the path from the top-level object to the current one.
 
-        change_list : list
-            A list storing all previous states of the object to allow undoing changes.
+        history : ChangeHistory
+            The undo history of `read_object`, through which every modification is applied.
 
         already_selected : bool, optional
             Used to avoid infinite recursion when rendering polymorphic types via dropdowns.
         """
 
+        def register_rebuild(holder):
+            # On undo, the content of holder is rendered again from the restored value
+            def refresh(change):
+                history.widgets.unregister_children(key_path)
+                history.widgets.register(key_path, refresh)
+                holder.children = [
+                    ObjectWidget.show_widget(
+                        get_nested_attr(read_object, key_path),
+                        expected_type,
+                        read_object,
+                        key_path,
+                        history,
+                        already_selected,
+                    )
+                ]
+
+            history.widgets.register(key_path, refresh)
+
+        def register_field(field):
+            # On undo, only the value of the input is updated
+            history.widgets.register(
+                key_path,
+                lambda change: setattr(
+                    field, "v_model", get_nested_attr(read_object, key_path)
+                ),
+            )
+
+        # The widget is chosen from the kind of the type, shared with the field descriptors.
+        # An actual list instance is always edited as a list.
+        kind = schema.widget_kind(*expected_type)
+        if isinstance(current_object, list):
+            kind = "list"
+
         # Handle nested Pydantic objects (not lists)
-        if (
-            hasattr(expected_type[0], "model_fields")
-            and not expected_type[1]
-            and not isinstance(current_object, list)
-        ):
+        if kind in ("select", "object"):
             # If polymorphic object (multiple subclasses), render a selector widget
-            if (
-                ta.get_subclass(expected_type[0].__name__) != []
-                and not already_selected
-            ):
+            if kind == "select" and not already_selected:
                 from .select_widget import SelectWidget
 
                 current_path = key_path
                 selectw = SelectWidget(
-                    current_object, expected_type[0], read_object, key_path, change_list
+                    current_object, expected_type[0], read_object, key_path, history
                 )
 
                 # Callback when dropdown selection changes
                 def change_select(event, skip_append=False):
                     if not skip_append:
-                        change_list.insert(-1, copy.deepcopy(read_object))
-                        set_nested_attr(
-                            read_object,
+                        history.set_value(
                             current_path,
                             ta.trustify_gen_pyd.__dict__[selectw.select.v_model](),
                         )
+                        # The widget of the new type registered itself on the same key path
+                        register_rebuild(selectw.content)
 
                 # Observe value changes and initialize selection
                 selectw.select.observe(change_select, "v_model")
                 change_select(None, skip_append=True)
+                register_rebuild(selectw.content)
                 return selectw.content
 
             # If the object is already initialized, render widgets for its fields
@@ -341,99 +403,15 @@ class ObjectWidget:
                 container = []
 
                 # Loop through each attribute in the object
-                for key, value in current_object.model_fields.items():
-                    # Build a tooltip for help info
-                    tooltip = v.Tooltip(
-                        bottom=True,
-                        v_slots=[
-                            {
-                                "name": "activator",
-                                "variable": "tooltip",
-                                "children": v.Icon(
-                                    children=["mdi-information-outline"],
-                                    color="blue",
-                                    v_on="tooltip.on",
-                                ),
-                            }
-                        ],
-                        children=[
-                            v.Html(
-                                tag="div",
-                                children=[
-                                    v.Html(tag="div", children=["Description :"]),
-                                    v.Html(
-                                        tag="div", children=[f"{value.description}"]
-                                    ),
-                                    v.Html(tag="div", children=["Synonyms :"]),
-                                    *[
-                                        v.Html(tag="div", children=[f"- {synonym}"])
-                                        for synonym in current_object._synonyms[key]
-                                    ],
-                                ],
-                            ),
-                        ],
-                    )
+                for field in schema.get_fields(type(current_object)):
+                    key = field.name
+                    # Header with the help info, and the status for inline fields
+                    header_content = field_header(field, with_status=field.inline)
 
-                    # Tooltip for optional fields
-                    optional_tooltip = v.Tooltip(
-                        bottom=True,
-                        v_slots=[
-                            {
-                                "name": "activator",
-                                "variable": "tooltip",
-                                "children": v.Icon(
-                                    children=["mdi-minus-circle-outline"],
-                                    color="green",
-                                    v_on="tooltip.on",
-                                ),
-                            }
-                        ],
-                        children=["This field is optional"],
-                    )
-
-                    # Tooltip for required field
-                    required_tooltip = v.Tooltip(
-                        bottom=True,
-                        v_slots=[
-                            {
-                                "name": "activator",
-                                "variable": "tooltip",
-                                "children": v.Icon(
-                                    children=["mdi-alert-circle-outline"],
-                                    color="orange",
-                                    v_on="tooltip.on",
-                                ),
-                            }
-                        ],
-                        children=["This field is required"],
-                    )
-
-                    header_content = v.Row(
-                        children=[
-                            v.Html(tag="span", children=[key], class_="mr-2"),
-                            tooltip,
-                        ],
-                        align="center",
-                        no_gutters=True,
-                    )
-
-                    expected_type = ta.extract_true_type(value)
+                    field_type = field.expected_type
 
                     # If simple type, create inline card
-                    if (
-                        expected_type[0] in [str, float, bool, int]
-                        or get_origin(expected_type[0]) is Literal
-                    ):
-                        # Verify if the attribute is declared with an Optional
-                        if get_origin(value.annotation) is Union:
-                            header_content.children = header_content.children + [
-                                optional_tooltip
-                            ]
-                        else:
-                            header_content.children = header_content.children + [
-                                required_tooltip
-                            ]
-
+                    if field.inline:
                         container.append(
                             v.Card(
                                 children=[
@@ -448,10 +426,10 @@ class ObjectWidget:
                                                 children=[
                                                     ObjectWidget.show_widget(
                                                         getattr(current_object, key),
-                                                        expected_type,
+                                                        field_type,
                                                         read_object,
                                                         key_path + [key],
-                                                        change_list,
+                                                        history,
                                                     )
                                                 ],
                                                 cols=9,
@@ -474,28 +452,26 @@ class ObjectWidget:
                     # Otherwise, create expansion panel for nested attributes
                     else:
                         widget_list.append(
-                            v.ExpansionPanel(
-                                children=[
-                                    v.ExpansionPanelHeader(children=[header_content]),
-                                    v.ExpansionPanelContent(
-                                        children=[
-                                            ObjectWidget.show_widget(
-                                                getattr(current_object, key),
-                                                expected_type,
-                                                read_object,
-                                                key_path + [key],
-                                                change_list,
-                                            )
-                                        ]
-                                    ),
-                                ]
+                            expansion_panel(
+                                header_content,
+                                lambda key=key, field_type=field_type: (
+                                    ObjectWidget.show_widget(
+                                        getattr(current_object, key),
+                                        field_type,
+                                        read_object,
+                                        key_path + [key],
+                                        history,
+                                    )
+                                ),
                             )
                         )
 
                 expand_panel = v.ExpansionPanels(children=widget_list, multiple=True)
-                return v.Container(
+                object_container = v.Container(
                     children=[v.Container(children=container), expand_panel]
                 )
+                register_rebuild(object_container)
+                return object_container
 
             # If the object is None and has no subclasses, offer to initialize
             else:
@@ -509,200 +485,149 @@ class ObjectWidget:
                     new_object = expected_type[0]()
                     widget_list = []
 
-                    for key, value in new_object.model_fields.items():
-                        tooltip = v.Tooltip(
-                            bottom=True,
-                            v_slots=[
-                                {
-                                    "name": "activator",
-                                    "variable": "tooltip",
-                                    "children": v.Icon(
-                                        children=["mdi-information-outline"],
-                                        color="blue",
-                                        v_on="tooltip.on",
-                                    ),
-                                }
-                            ],
-                            children=[
-                                v.Html(
-                                    tag="div",
-                                    children=[
-                                        v.Html(tag="div", children=["Description :"]),
-                                        v.Html(
-                                            tag="div", children=[f"{value.description}"]
-                                        ),
-                                        v.Html(tag="div", children=["Synonyms :"]),
-                                        *[
-                                            v.Html(tag="div", children=[f"- {synonym}"])
-                                            for synonym in new_object._synonyms[key]
-                                        ],
-                                    ],
-                                ),
-                            ],
-                        )
-
-                        header_content = v.Row(
-                            children=[
-                                v.Html(tag="span", children=[key], class_="mr-2"),
-                                tooltip,
-                            ],
-                            align="center",
-                            no_gutters=True,
-                        )
+                    for field in schema.get_fields(type(new_object)):
+                        key = field.name
+                        header_content = field_header(field)
 
                         widget_list.append(
-                            v.ExpansionPanel(
-                                children=[
-                                    v.ExpansionPanelHeader(children=[header_content]),
-                                    v.ExpansionPanelContent(
-                                        children=[
-                                            ObjectWidget.show_widget(
-                                                getattr(new_object, key),
-                                                ta.extract_true_type(value),
-                                                read_object,
-                                                key_path + [key],
-                                                change_list,
-                                            )
-                                        ]
-                                    ),
-                                ]
+                            expansion_panel(
+                                header_content,
+                                lambda key=key, field=field: ObjectWidget.show_widget(
+                                    getattr(new_object, key),
+                                    field.expected_type,
+                                    read_object,
+                                    key_path + [key],
+                                    history,
+                                ),
                             )
                         )
 
                     panel.children = widget_list
-                    change_list.insert(-1, copy.deepcopy(read_object))
-                    set_nested_attr(read_object, key_path, new_object)
+                    history.set_value(key_path, new_object)
 
                 panel.children = [initialize]
                 initialize.on_event("click", initialize_object)
-                return v.Container(children=[panel])
+                object_container = v.Container(children=[panel])
+                register_rebuild(object_container)
+                return object_container
 
         # If the field is a list (expected_type[1] is True) or an actual list instance
-        elif (
-            expected_type[1] or isinstance(current_object, list)
-        ) and current_object is not None:
+        elif kind == "list" and current_object is not None:
             from .list_widget import ListWidget
 
             current_path = key_path
 
             # Create a custom widget for list handling
             listw = ListWidget(
-                current_object, expected_type[0], read_object, key_path, change_list
+                current_object, expected_type[0], read_object, key_path, history
             )
 
-            # Callback to delete an item from the list
+            # Callback to delete an item from the list, only its panel is removed
+            @comm_trace.traced("delete list item")
             def delete_list(widget, event, data):
-                updated_object = get_nested_attr(read_object, key_path)
-                index = widget.kwargs["index"]
-                updated_object.pop(index)
-
-                set_nested_attr(read_object, key_path, updated_object)
-                change_list.insert(-1, copy.deepcopy(read_object))
+                index = operator.index(widget.kwargs["index"])
+                history.remove_item(key_path, index)
+                listw.remove_item(index)
 
-                listw.build_panels(updated_object)
-                for btn in listw.delete_buttons:
-                    btn.on_event("click", delete_list)
-                for btn in listw.duplicate_buttons:
-                    btn.on_event("click", duplicate_list)
-
-            # Callback to add a new (empty) item to the list
+            # Callback to add a new (empty) item to the list, and display it
+            @comm_trace.traced("add list item")
             def add_list(widget, event, data):
                 updated_object = get_nested_attr(read_object, key_path)
-                updated_object.append(copy.deepcopy(expected_type[0]()))
-                set_nested_attr(read_object, key_path, updated_object)
-                change_list.insert(-1, copy.deepcopy(read_object))
-
-                listw.build_panels(updated_object)
-                for btn in listw.delete_buttons:
-                    btn.on_event("click", delete_list)
-                for btn in listw.duplicate_buttons:
-                    btn.on_event("click", duplicate_list)
+                history.insert_item(key_path, len(updated_object), expected_type[0]())
+                listw.insert_item(len(updated_object) - 1, reveal=True)
 
-            # Callback to duplicate an item in the list
+            # Callback to duplicate an item in the list, and display the copy
+            @comm_trace.traced("duplicate list item")
             def duplicate_list(widget, event, data):
                 updated_object = get_nested_attr(read_object, key_path)
                 index = widget.kwargs["index"]
-                updated_object.append(copy.deepcopy(updated_object[index]))
-                set_nested_attr(read_object, key_path, updated_object)
-                change_list.insert(-1, copy.deepcopy(read_object))
-
-                listw.build_panels(updated_object)
-                for btn in listw.delete_buttons:
-                    btn.on_event("click", delete_list)
-                for btn in listw.duplicate_buttons:
-                    btn.on_event("click", duplicate_list)
+                history.insert_item(
+                    key_path,
+                    len(updated_object),
+                    copy.deepcopy(updated_object[index]),
+                )
+                listw.insert_item(len(updated_object) - 1, reveal=True)
 
             # Register events on buttons
-            for i in listw.delete_buttons:
-                i.on_event("click", delete_list)
-            for i in listw.duplicate_buttons:
-                i.on_event("click", duplicate_list)
-
+            listw.bind_item_buttons(delete_list, duplicate_list)
             listw.add_button.on_event("click", add_list)
 
+            # On undo, only the panel of an item added or removed is updated, a replaced list
+            # is rendered again
+            register_rebuild(listw.content)
+            refresh_content = history.widgets.get(key_path)
+
+            def refresh_list(change):
+                if change.kind == "insert":
+                    listw.insert_item(change.key_path[-1])
+                elif change.kind == "remove":
+                    listw.remove_item(change.key_path[-1])
+                else:
+                    refresh_content(change)
+
+            history.widgets.register(key_path, refresh_list)
+
             return listw.content
 
         # Handle primitive types (non-nested attributes)
-        elif expected_type[0] is str:
+        elif kind == "str":
             strw = str_widget.StrWidget(current_object)
 
             def change_str(widget, event, data):
-                change_list.insert(-1, copy.deepcopy(read_object))
-                set_nested_attr(read_object, key_path, strw.text_str.v_model)
+                history.set_value(key_path, strw.text_str.v_model)
 
             strw.text_str.on_event("blur", change_str)
+            register_field(strw.text_str)
             return strw.content
 
-        elif get_origin(expected_type[0]) is Literal:
+        elif kind == "literal":
             dropdownw = dropdown_widget.DropdownWidget(
-                list(get_args(expected_type[0])), current_object
+                schema.literal_choices(expected_type[0]), current_object
             )
 
             def change_literal(event, skip_append=False):
                 if not skip_append:
-                    change_list.insert(-1, copy.deepcopy(read_object))
-                    set_nested_attr(read_object, key_path, dropdownw.dropdown.v_model)
+                    history.set_value(key_path, dropdownw.dropdown.v_model)
 
             dropdownw.dropdown.observe(change_literal, "v_model")
             change_literal(None, skip_append=True)
+            register_field(dropdownw.dropdown)
             return dropdownw.content
 
-        elif expected_type[0] is float:
+        elif kind == "float":
             floatw = float_widget.FloatWidget(current_object)
 
             def change_float(widget, event, data):
-                change_list.insert(-1, copy.deepcopy(read_object))
-                set_nested_attr(
-                    read_object, key_path, float(floatw.float_field.v_model)
-                )
+                history.set_value(key_path, float(floatw.float_field.v_model))
 
             floatw.float_field.on_event("blur", change_float)
+            register_field(floatw.float_field)
             return floatw.content
 
-        elif expected_type[0] is bool:
+        elif kind == "bool":
             boolw = bool_widget.BooleanWidget(current_object)
 
             def change_bool(event, skip_append=False):
                 if not skip_append:
-                    change_list.insert(-1, copy.deepcopy(read_object))
-                    set_nested_attr(read_object, key_path, boolw.switch.v_model)
+                    history.set_value(key_path, boolw.switch.v_model)
 
             boolw.switch.observe(change_bool, "v_model")
             change_bool(None, skip_append=True)
+            register_field(boolw.switch)
             return boolw.content
 
-        elif expected_type[0] is int:
+        elif kind == "int":
             intw = int_widget.IntWidget(current_object)
 
             def change_int(widget, event, data):
-                change_list.insert(-1, copy.deepcopy(read_object))
-                set_nested_attr(read_object, key_path, int(intw.number_input.v_model))
+                history.set_value(key_path, int(intw.number_input.v_model))
 
             intw.number_input.on_event("blur", change_int)
+            register_field(intw.number_input)
             return intw.content
 
         # If the list is uninitialized (None), offer an "Initialize" button
-        elif current_object is None and expected_type[1]:
+        elif kind == "list":
             container = v.Container(children=[])
             initialize = v.Btn(
                 color="red",
@@ -710,21 +635,21 @@ class ObjectWidget:
             )
 
             def initialize_object(widget, event, data):
-                new_object = expected_type[0]()
+                new_list = [expected_type[0]()]
                 widget = ObjectWidget.show_widget(
-                    [new_object],
+                    new_list,
                     expected_type,
                     read_object,
                     key_path,
-                    change_list,
+                    history,
                 )
 
                 container.children = [widget]
-                change_list.insert(-1, copy.deepcopy(read_object))
-                set_nested_attr(read_object, key_path, [new_object])
+                history.set_value(key_path, new_list)
 
             container.children = [initialize]
             initialize.on_event("click", initialize_object)
+            register_rebuild(container)
 
             return container
 
@@ -1,5 +1,8 @@
 import trioapi as ta
 import ipyvuetify as v
+from ..panel_list import PanelList
+from ....entry_index import add_read_object, delete_read_object, replace_entry
+from ..debounce import observe_debounced
 
 
 class AssociateWidget:
@@ -29,7 +32,7 @@ class AssociateWidget:
         self.btn_add_associate.on_event("click", self.add_associate)
 
         # Define expansion panels container
-        self.associate_panels = v.ExpansionPanels(
+        self.associate_panels = PanelList(
             v_model=[],
             multiple=True,
             children=[],
@@ -48,72 +51,88 @@ class AssociateWidget:
         """
         Refresh the list of panels based on the current list of associed objects identifiers.
         """
+        self.associate_panels.reset(
+            self.create_panel(associate) for associate in self.associate_list
+        )
 
-        # Reinitiliaze the panel
-        self.associate_panels.children = []
+    def create_panel(self, associate):
+        """
+        Creates the expansion panel of an association.
 
-        # Loop through each association in the list
-        for i, associate in enumerate(self.associate_list):
-            # First input field for the first object in the association
-            text_field_1 = v.TextField(
-                label="First object to associate",
-                v_model=associate[0] if associate[0] is not None else "",
-                placeholder="Enter first object name",
-            )
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.associate_panels.new_key()
 
-            # Second input field for the second object in the association
-            text_field_2 = v.TextField(
-                label="Second object to associate",
-                v_model=associate[1] if associate[1] is not None else "",
-                placeholder="Enter second object name",
-            )
+        # First input field for the first object in the association
+        text_field_1 = v.TextField(
+            label="First object to associate",
+            v_model=associate[0] if associate[0] is not None else "",
+            placeholder="Enter first object name",
+        )
 
-            # Delete button with trash icon
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            # On click, delete this association by index
-            btn_delete.on_event(
-                "click", lambda widget, event, data, idx=i: self.delete_associate(idx)
-            )
+        # Second input field for the second object in the association
+        text_field_2 = v.TextField(
+            label="Second object to associate",
+            v_model=associate[1] if associate[1] is not None else "",
+            placeholder="Enter second object name",
+        )
 
-            # Header content with label and delete button
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Association"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
+        # Delete button with trash icon
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
 
-            # Create the expansion panel with header and inputs
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    v.ExpansionPanelContent(children=[text_field_1, text_field_2]),
-                ]
-            )
+        # On click, delete this association by index
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_associate(
+                self.associate_panels.index(key)
+            ),
+        )
 
-            # Add the new panel to the panel list
-            self.associate_panels.children = self.associate_panels.children + [
-                new_panel
+        # Header content with label and delete button
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Association"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
+
+        # Create the expansion panel with header and inputs
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                v.ExpansionPanelContent(children=[text_field_1, text_field_2]),
             ]
+        )
 
-            # Observe changes to the first text field and update the dataset
-            text_field_1.observe(
-                lambda change, idx=i: self.change_associate_dataset(change, idx, 1),
-                "v_model",
-            )
+        # Observe changes to the first text field and update the dataset
+        debouncer = observe_debounced(
+            text_field_1,
+            lambda change: self.change_associate_dataset(
+                change, self.associate_panels.index(key), 1
+            ),
+        )
+        self.associate_panels.on_remove(key, debouncer.cancel)
+
+        # Observe changes to the second text field and update the dataset
+        debouncer = observe_debounced(
+            text_field_2,
+            lambda change: self.change_associate_dataset(
+                change, self.associate_panels.index(key), 2
+            ),
+        )
+        self.associate_panels.on_remove(key, debouncer.cancel)
 
-            # Observe changes to the second text field and update the dataset
-            text_field_2.observe(
-                lambda change, idx=i: self.change_associate_dataset(change, idx, 2),
-                "v_model",
-            )
+        return key, new_panel
 
     def change_associate_dataset(self, change, index=None, field_type=None):
         """
@@ -130,17 +149,17 @@ class AssociateWidget:
 
         # If the previous association was complete, update it in the dataset
         if None not in old_item:
-            entry_index = ta.get_entry_index(
+            replace_entry(
                 self.dataset,
                 ta.trustify_gen_pyd.Associate(objet_1=old_item[0], objet_2=old_item[1]),
-            )
-            self.dataset.entries[entry_index] = ta.trustify_gen_pyd.Associate(
-                objet_1=self.associate_list[index][0],
-                objet_2=self.associate_list[index][1],
+                ta.trustify_gen_pyd.Associate(
+                    objet_1=self.associate_list[index][0],
+                    objet_2=self.associate_list[index][1],
+                ),
             )
         # If the new association is now complete, add it to the dataset
         elif None not in self.associate_list[index]:
-            ta.add_read_object(
+            add_read_object(
                 self.dataset,
                 ta.trustify_gen_pyd.Associate(
                     objet_1=self.associate_list[index][0],
@@ -153,14 +172,14 @@ class AssociateWidget:
         Add a new empty association and refresh the UI
         """
         self.associate_list.append([None, None])
-        self.rebuild_panels()
+        self.associate_panels.append(*self.create_panel(self.associate_list[-1]))
 
     def delete_associate(self, index):
         """
         Delete an association by index and refresh the UI
         """
         if 0 <= index < len(self.associate_list):
-            ta.delete_read_object(
+            delete_read_object(
                 self.dataset,
                 ta.trustify_gen_pyd.Associate(
                     objet_1=self.associate_list[index][0],
@@ -168,4 +187,4 @@ class AssociateWidget:
                 ),
             )
             del self.associate_list[index]
-            self.rebuild_panels()
+            self.associate_panels.pop(index)
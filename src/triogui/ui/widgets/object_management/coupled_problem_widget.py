@@ -1,5 +1,7 @@
 import ipyvuetify as v
 import trioapi as ta
+from ..panel_list import PanelList
+from ..debounce import observe_debounced
 
 
 class CoupledProblemWidget:
@@ -30,7 +32,7 @@ class CoupledProblemWidget:
         self.btn_add_coupled_problem.on_event("click", self.add_coupled_problem)
 
         # Define expansion panels container
-        self.coupled_problem_panels = v.ExpansionPanels(
+        self.coupled_problem_panels = PanelList(
             v_model=[],
             multiple=True,
             children=[],
@@ -51,60 +53,73 @@ class CoupledProblemWidget:
         """
         Refresh the list of panels based on the current list of coupled problem identifiers.
         """
+        self.coupled_problem_panels.reset(
+            self.create_panel(coupled_problem)
+            for coupled_problem in self.coupled_problem_list
+        )
+
+    def create_panel(self, coupled_problem):
+        """
+        Creates the expansion panel of a coupled problem.
+
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.coupled_problem_panels.new_key()
 
-        # Clear existing panels
-        self.coupled_problem_panels.children = []
-
-        # Loop through each problem and build a corresponding panel
-        for i, coupled_problem in enumerate(self.coupled_problem_list):
-            # Text field to edit the identifier
-            new_name_coupled_problem = v.TextField(
-                label="Name of the coupled problem",
-                outlined=True,
-                v_model=coupled_problem,
-            )
-
-            # Delete button with trash icon
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            # Connect delete action to the button
-            btn_delete.on_event(
-                "click",
-                lambda widget, event, data, idx=i: self.delete_coupled_problem(idx),
-            )
-
-            # Header layout with title and delete button
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Coupled problem"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
-
-            # Assemble the expansion panel
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    v.ExpansionPanelContent(children=[new_name_coupled_problem]),
-                ]
-            )
-
-            # Add the new panel to the list
-            self.coupled_problem_panels.children = (
-                self.coupled_problem_panels.children + [new_panel]
-            )
-
-            # Observe changes in the text field to update the dataset accordingly
-            new_name_coupled_problem.observe(
-                lambda change, idx=i: self.update_dataset(change, idx),
-                "v_model",
-            )
+        # Text field to edit the identifier
+        new_name_coupled_problem = v.TextField(
+            label="Name of the coupled problem",
+            outlined=True,
+            v_model=coupled_problem,
+        )
+
+        # Delete button with trash icon
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
+
+        # Connect delete action to the button
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_coupled_problem(
+                self.coupled_problem_panels.index(key)
+            ),
+        )
+
+        # Header layout with title and delete button
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Coupled problem"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
+
+        # Assemble the expansion panel
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                v.ExpansionPanelContent(children=[new_name_coupled_problem]),
+            ]
+        )
+
+        # Observe changes in the text field to update the dataset accordingly
+        debouncer = observe_debounced(
+            new_name_coupled_problem,
+            lambda change: self.update_dataset(
+                change, self.coupled_problem_panels.index(key)
+            ),
+        )
+        self.coupled_problem_panels.on_remove(key, debouncer.cancel)
+
+        return key, new_panel
 
     def update_dataset(self, change, index):
         """
@@ -139,7 +154,9 @@ class CoupledProblemWidget:
         Add a new (empty) coupled problem entry and refresh the UI.
         """
         self.coupled_problem_list.append(None)
-        self.rebuild_panels()
+        self.coupled_problem_panels.append(
+            *self.create_panel(self.coupled_problem_list[-1])
+        )
 
     def delete_coupled_problem(self, index):
         """
@@ -153,4 +170,4 @@ class CoupledProblemWidget:
                 )
             # Remove from internal list and refresh
             del self.coupled_problem_list[index]
-            self.rebuild_panels()
+            self.coupled_problem_panels.pop(index)
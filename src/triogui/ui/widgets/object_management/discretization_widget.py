@@ -1,6 +1,10 @@
 import ipyvuetify as v
 import trioapi as ta
+from .. import schema
+from ..history import ChangeHistory
 from ..object import ObjectWidget
+from ..panel_list import PanelList
+from ....entry_index import add_read_object, delete_entry, get_entry_index
 
 
 class DiscretizationWidget:
@@ -27,18 +31,12 @@ class DiscretizationWidget:
         self.dataset = dataset
 
         # Prepare available discretization types with their documentation
-        self.dis_with_doc = []
-        self.doc_dict = {}
-        for dis in ta.get_subclass("Discretisation_base"):
-            dis_name = dis.__name__
-            dis_doc = dis.__doc__
-            self.dis_with_doc.append(
-                {"text": f"{dis_name} - {dis_doc}", "value": dis_name}
-            )
-            self.doc_dict[dis_name] = dis_doc
+        dis_index = schema.get_subclass_index("Discretisation_base")
+        self.dis_with_doc = dis_index.items
+        self.doc_dict = dis_index.docs
 
         # Create the expansion panel container
-        self.dis_panels = v.ExpansionPanels(
+        self.dis_panels = PanelList(
             v_model=[],
             multiple=True,
             children=[],
@@ -59,109 +57,114 @@ class DiscretizationWidget:
         """
         Refresh the list of expansion panels from the current discretization list.
         """
+        self.dis_panels.reset(self.create_panel(dis) for dis in self.dis_list)
 
-        # Clear the panel list
-        self.dis_panels.children = []
+    def create_panel(self, dis):
+        """
+        Creates the expansion panel of a discretization.
 
-        # Build each panel
-        for i, dis in enumerate(self.dis_list):
-            # Text field for the discretization name
-            new_name_dis = v.TextField(
-                label="Name of the discretization",
-                outlined=True,
-                v_model=dis[0],
-            )
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.dis_panels.new_key()
 
-            # Select dropdown for the discretization type
-            new_select_dis = v.Select(
-                items=self.dis_with_doc,
-                label="Type of the discretization",
-                v_model=dis[1].__name__ if dis[1] is not None else None,
-            )
+        # Text field for the discretization name
+        new_name_dis = v.TextField(
+            label="Name of the discretization",
+            outlined=True,
+            v_model=dis[0],
+        )
 
-            # Display the documentation for the selected type
-            doc_display = v.Alert(
-                children=["Select an element to see its documentation"]
-                if dis[1] is None
-                else [self.doc_dict.get(new_select_dis.v_model)],
-                type="info",
-                outlined=True,
-                class_="text-body-2 pa-2 mt-2",
-                style_="white-space: pre-wrap;",
-            )
+        # Select dropdown for the discretization type
+        new_select_dis = v.Select(
+            items=self.dis_with_doc,
+            label="Type of the discretization",
+            v_model=dis[1].__name__ if dis[1] is not None else None,
+        )
 
-            # Delete button to remove this discretization
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            btn_delete.on_event(
-                "click", lambda widget, event, data, idx=i: self.delete_dis(idx)
-            )
+        # Display the documentation for the selected type
+        doc_display = v.Alert(
+            children=["Select an element to see its documentation"]
+            if dis[1] is None
+            else [self.doc_dict.get(new_select_dis.v_model)],
+            type="info",
+            outlined=True,
+            class_="text-body-2 pa-2 mt-2",
+            style_="white-space: pre-wrap;",
+        )
 
-            # Header row with label and delete button
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Discretization"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
+        # Delete button to remove this discretization
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_dis(self.dis_panels.index(key)),
+        )
 
-            # Container for dynamic content (initially empty)
-            dynamic_content = v.Container(children=[])
+        # Header row with label and delete button
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Discretization"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
 
-            content_children = [
-                new_name_dis,
-                new_select_dis,
-                doc_display,
-                dynamic_content,
+        # Container for dynamic content (initially empty)
+        dynamic_content = v.Container(children=[])
+
+        content_children = [
+            new_name_dis,
+            new_select_dis,
+            doc_display,
+            dynamic_content,
+        ]
+
+        # Compose the panel with header and content
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                v.ExpansionPanelContent(children=content_children),
             ]
+        )
 
-            # Compose the panel with header and content
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    v.ExpansionPanelContent(children=content_children),
-                ]
-            )
-
-            # Verify to update the content if the dis is Vef
-            self.update_widget_for_vef(i, dynamic_content)
-
-            # Add the panel to the UI
-            self.dis_panels.children = self.dis_panels.children + [new_panel]
+        # Verify to update the content if the dis is Vef
+        self.update_widget_for_vef(dis, dynamic_content, key)
+
+        # Observe changes to name field and update dataset
+        new_name_dis.observe(
+            lambda change,
+            name=new_name_dis,
+            content=dynamic_content: self.update_dataset(
+                change, self.dis_panels.index(key), name, new_select_dis, content, key
+            ),
+            "v_model",
+        )
 
-            # Observe changes to name field and update dataset
-            new_name_dis.observe(
-                lambda change,
-                idx=i,
-                name=new_name_dis,
-                content=dynamic_content: self.update_dataset(
-                    change, idx, name, new_select_dis, content
-                ),
-                "v_model",
-            )
+        # Observe changes to type dropdown and update dataset
+        new_select_dis.observe(
+            lambda change,
+            select=new_select_dis,
+            content=dynamic_content: self.update_dataset(
+                change, self.dis_panels.index(key), new_name_dis, select, content, key
+            ),
+            "v_model",
+        )
 
-            # Observe changes to type dropdown and update dataset
-            new_select_dis.observe(
-                lambda change,
-                idx=i,
-                select=new_select_dis,
-                content=dynamic_content: self.update_dataset(
-                    change, idx, new_name_dis, select, content
-                ),
-                "v_model",
-            )
+        # Observe changes to dropdown and update documentation view
+        new_select_dis.observe(
+            lambda change, display=doc_display: self.update_doc(change, display),
+            "v_model",
+        )
 
-            # Observe changes to dropdown and update documentation view
-            new_select_dis.observe(
-                lambda change, display=doc_display: self.update_doc(change, display),
-                "v_model",
-            )
+        return key, new_panel
 
     def update_doc(self, change, display_widget):
         """
@@ -173,7 +176,7 @@ class DiscretizationWidget:
             display_widget.children = [doc_text]
 
     def update_dataset(
-        self, change, index, name_widget, select_widget, widget_container
+        self, change, index, name_widget, select_widget, widget_container, key
     ):
         """
         Update the dataset when a name or type field is changed.
@@ -213,7 +216,7 @@ class DiscretizationWidget:
                     if self.dataset._declarations[old_item[0]][1] > 0:
                         entry_index = self.dataset._declarations[old_item[0]][1]
                         # Delete in the dataset entries
-                        del self.dataset.entries[entry_index]
+                        delete_entry(self.dataset, entry_index)
                         self.dataset._declarations[old_item[0]][1] = -1
                     # Change for the declaration
                     ta.change_declaration_object(
@@ -234,37 +237,39 @@ class DiscretizationWidget:
                         self.dis_list[index][0],
                     )
             # Keep the widget for vef updated
-            self.update_widget_for_vef(index, widget_container)
+            self.update_widget_for_vef(self.dis_list[index], widget_container, key)
 
-    def update_widget_for_vef(self, index, widget_container):
+    def update_widget_for_vef(self, dis, widget_container, key):
         """
         Creates a widget specially for the Vef discretization to let the user modifies it if he wants to.
         It is the only discretization with the keyword read available
+
+        `dis` is the [identifier, type] item of the discretization and `key` the key of its panel.
         """
         # Empty the container
         widget_container.children = []
-        if (
-            self.dis_list[index][0] is not None
-            and self.dis_list[index][1] == ta.trustify_gen_pyd.Vef
-        ):
+        if dis[0] is not None and dis[1] == ta.trustify_gen_pyd.Vef:
             # Choose to change the discretization or not
             switch = v.Switch(
                 label="Modify this discretization using the Read keyword ?",
-                v_model=self.dataset._declarations[self.dis_list[index][0]][1] > 0,
+                v_model=self.dataset._declarations[dis[0]][1] > 0,
             )
             switch.observe(
-                lambda change: self.update_read_dis(change, index, widget_container),
+                lambda change: self.update_read_dis(
+                    change, self.dis_panels.index(key), widget_container, key
+                ),
                 "v_model",
             )
             widget_container.children = widget_container.children + [switch]
             # Create the widget if it is already modified in the dataset
-            if self.dataset._declarations[self.dis_list[index][0]][1] > 0:
+            if self.dataset._declarations[dis[0]][1] > 0:
+                read_dis = self.dataset.get(dis[0])
                 widget = ObjectWidget.show_widget(
-                    self.dataset.get(self.dis_list[index][0]),
-                    (self.dis_list[index][1], False),
-                    self.dataset.get(self.dis_list[index][0]),
-                    [],
+                    read_dis,
+                    (dis[1], False),
+                    read_dis,
                     [],
+                    ChangeHistory(read_dis),
                     True,
                 )
                 widget_container.children = widget_container.children + [widget]
@@ -274,7 +279,7 @@ class DiscretizationWidget:
         Add a new empty discretization to the list kand refresh the UI.
         """
         self.dis_list.append([None, None])
-        self.rebuild_panels()
+        self.dis_panels.append(*self.create_panel(self.dis_list[-1]))
 
     def delete_dis(self, index):
         """
@@ -288,9 +293,9 @@ class DiscretizationWidget:
                 else:
                     ta.delete_declaration_object(self.dataset, self.dis_list[index][0])
             del self.dis_list[index]
-            self.rebuild_panels()
+            self.dis_panels.pop(index)
 
-    def update_read_dis(self, change, index, widget_container):
+    def update_read_dis(self, change, index, widget_container, key):
         """
         Update the database by creating or deleting the Read keyword according to the switch changes.
         """
@@ -299,13 +304,13 @@ class DiscretizationWidget:
             read_dis = ta.trustify_gen_pyd.Read(
                 identifier=self.dis_list[index][0], obj=self.dis_list[index][1]()
             )
-            ta.add_read_object(self.dataset, read_dis)
-            entry_index = ta.get_entry_index(self.dataset, read_dis)
+            add_read_object(self.dataset, read_dis)
+            entry_index = get_entry_index(self.dataset, read_dis)
             self.dataset._declarations[self.dis_list[index][0]][1] = entry_index
         else:
             # Delete the Read keyword
             entry_index = self.dataset._declarations[self.dis_list[index][0]][1]
-            del self.dataset.entries[entry_index]
+            delete_entry(self.dataset, entry_index)
             self.dataset._declarations[self.dis_list[index][0]][1] = -1
         # Keep the widget updated
-        self.update_widget_for_vef(index, widget_container)
+        self.update_widget_for_vef(self.dis_list[index], widget_container, key)
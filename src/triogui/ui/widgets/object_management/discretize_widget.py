@@ -1,5 +1,8 @@
 import trioapi as ta
 import ipyvuetify as v
+from ..panel_list import PanelList
+from ....entry_index import add_read_object, delete_read_object, replace_entry
+from ..debounce import observe_debounced
 
 
 class DiscretizeWidget:
@@ -29,7 +32,7 @@ class DiscretizeWidget:
         self.btn_add_discretize.on_event("click", self.add_discretize)
 
         # Create the container for expansion panels
-        self.discretize_panels = v.ExpansionPanels(
+        self.discretize_panels = PanelList(
             v_model=[],
             multiple=True,
             children=[],
@@ -48,71 +51,86 @@ class DiscretizeWidget:
         """
         Rebuild the list of expansion panels based on the current discretization pairs.
         """
+        self.discretize_panels.reset(
+            self.create_panel(discretize) for discretize in self.discretize_list
+        )
 
-        # Clear existing panels
-        self.discretize_panels.children = []
+    def create_panel(self, discretize):
+        """
+        Creates the expansion panel of a discretize relation.
 
-        # Loop through each discretize entry
-        for i, discretize in enumerate(self.discretize_list):
-            # Text field for the problem name
-            pb_text_field = v.TextField(
-                label="Problem to discretize",
-                v_model=discretize[0] if discretize[0] is not None else "",
-                placeholder="Enter problem name",
-            )
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.discretize_panels.new_key()
 
-            # Text field for the discretization scheme
-            dis_text_field = v.TextField(
-                label="Corresponding scheme",
-                v_model=discretize[1] if discretize[1] is not None else "",
-                placeholder="Enter discretization scheme",
-            )
+        # Text field for the problem name
+        pb_text_field = v.TextField(
+            label="Problem to discretize",
+            v_model=discretize[0] if discretize[0] is not None else "",
+            placeholder="Enter problem name",
+        )
 
-            # Delete button to remove the entry
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            btn_delete.on_event(
-                "click", lambda widget, event, data, idx=i: self.delete_discretize(idx)
-            )
+        # Text field for the discretization scheme
+        dis_text_field = v.TextField(
+            label="Corresponding scheme",
+            v_model=discretize[1] if discretize[1] is not None else "",
+            placeholder="Enter discretization scheme",
+        )
 
-            # Header layout
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Discretization"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
+        # Delete button to remove the entry
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_discretize(
+                self.discretize_panels.index(key)
+            ),
+        )
 
-            # Create the expansion panel
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    v.ExpansionPanelContent(children=[pb_text_field, dis_text_field]),
-                ]
-            )
+        # Header layout
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Discretization"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
 
-            # Add the panel to the list
-            self.discretize_panels.children = self.discretize_panels.children + [
-                new_panel
+        # Create the expansion panel
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                v.ExpansionPanelContent(children=[pb_text_field, dis_text_field]),
             ]
+        )
 
-            # Observe changes in the problem name field
-            pb_text_field.observe(
-                lambda change, idx=i: self.change_discretize_dataset(change, idx, 1),
-                "v_model",
-            )
+        # Observe changes in the problem name field
+        debouncer = observe_debounced(
+            pb_text_field,
+            lambda change: self.change_discretize_dataset(
+                change, self.discretize_panels.index(key), 1
+            ),
+        )
+        self.discretize_panels.on_remove(key, debouncer.cancel)
+
+        # Observe changes in the discretization scheme field
+        debouncer = observe_debounced(
+            dis_text_field,
+            lambda change: self.change_discretize_dataset(
+                change, self.discretize_panels.index(key), 2
+            ),
+        )
+        self.discretize_panels.on_remove(key, debouncer.cancel)
 
-            # Observe changes in the discretization scheme field
-            dis_text_field.observe(
-                lambda change, idx=i: self.change_discretize_dataset(change, idx, 2),
-                "v_model",
-            )
+        return key, new_panel
 
     def change_discretize_dataset(self, change, index=None, field_type=None):
         """
@@ -131,21 +149,21 @@ class DiscretizeWidget:
 
         # If the original entry was complete, update it in the dataset
         if None not in old_item:
-            entry_index = ta.get_entry_index(
+            replace_entry(
                 self.dataset,
                 ta.trustify_gen_pyd.Discretize(
                     problem_name=old_item[0],
                     dis=old_item[1],
                 ),
-            )
-            self.dataset.entries[entry_index] = ta.trustify_gen_pyd.Discretize(
-                problem_name=self.discretize_list[index][0],
-                dis=self.discretize_list[index][1],
+                ta.trustify_gen_pyd.Discretize(
+                    problem_name=self.discretize_list[index][0],
+                    dis=self.discretize_list[index][1],
+                ),
             )
 
         # If the new entry is now complete, add it to the dataset
         elif None not in self.discretize_list[index]:
-            ta.add_read_object(
+            add_read_object(
                 self.dataset,
                 ta.trustify_gen_pyd.Discretize(
                     problem_name=self.discretize_list[index][0],
@@ -158,14 +176,14 @@ class DiscretizeWidget:
         Add a new empty discretization entry and refresh the UI.
         """
         self.discretize_list.append([None, None])
-        self.rebuild_panels()
+        self.discretize_panels.append(*self.create_panel(self.discretize_list[-1]))
 
     def delete_discretize(self, index):
         """
         Delete a discretization entry from both the internal list and the dataset.
         """
         if 0 <= index < len(self.discretize_list):
-            ta.delete_read_object(
+            delete_read_object(
                 self.dataset,
                 ta.trustify_gen_pyd.Discretize(
                     problem_name=self.discretize_list[index][0],
@@ -173,4 +191,4 @@ class DiscretizeWidget:
                 ),
             )
             del self.discretize_list[index]
-            self.rebuild_panels()
+            self.discretize_panels.pop(index)
@@ -1,5 +1,7 @@
 import ipyvuetify as v
 import trioapi as ta
+from ..panel_list import PanelList
+from ..debounce import observe_debounced
 
 
 class DomainWidget:
@@ -30,7 +32,7 @@ class DomainWidget:
         self.btn_add_dom.on_event("click", self.add_domain)
 
         # Create the container for domain expansion panels
-        self.dom_panels = v.ExpansionPanels(
+        self.dom_panels = PanelList(
             v_model=[],
             multiple=True,
             children=[],
@@ -46,54 +48,64 @@ class DomainWidget:
         """
         Refresh the expansion panels based on the current list of domains.
         """
-        self.dom_panels.children = []
-
-        # Iterate through each domain in the list
-        for i, dom in enumerate(self.dom_list):
-            # Text field to edit the domain identifier
-            new_name_dom = v.TextField(
-                label="Name of the domain",
-                outlined=True,
-                v_model=dom,
-            )
-
-            # Delete button
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            btn_delete.on_event(
-                "click", lambda widget, event, data, idx=i: self.delete_dom(idx)
-            )
-
-            # Header row with label and delete action
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Domain"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
-
-            # Build expansion panel for this domain
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    v.ExpansionPanelContent(children=[new_name_dom]),
-                ]
-            )
-
-            # Append panel to the list
-            self.dom_panels.children = self.dom_panels.children + [new_panel]
-
-            # Observe changes in the name field to sync with the dataset
-            new_name_dom.observe(
-                lambda change, idx=i: self.update_domain(change, idx),
-                "v_model",
-            )
+        self.dom_panels.reset(self.create_panel(dom) for dom in self.dom_list)
+
+    def create_panel(self, dom):
+        """
+        Creates the expansion panel of a domain.
+
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.dom_panels.new_key()
+
+        # Text field to edit the domain identifier
+        new_name_dom = v.TextField(
+            label="Name of the domain",
+            outlined=True,
+            v_model=dom,
+        )
+
+        # Delete button
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_dom(self.dom_panels.index(key)),
+        )
+
+        # Header row with label and delete action
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Domain"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
+
+        # Build expansion panel for this domain
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                v.ExpansionPanelContent(children=[new_name_dom]),
+            ]
+        )
+
+        # Observe changes in the name field to sync with the dataset
+        debouncer = observe_debounced(
+            new_name_dom,
+            lambda change: self.update_domain(change, self.dom_panels.index(key)),
+        )
+        self.dom_panels.on_remove(key, debouncer.cancel)
+
+        return key, new_panel
 
     def update_domain(self, change, index):
         """
@@ -127,7 +139,7 @@ class DomainWidget:
         Add a new (empty) domain entry and refresh the UI.
         """
         self.dom_list.append(None)
-        self.rebuild_panels()
+        self.dom_panels.append(*self.create_panel(self.dom_list[-1]))
 
     def delete_dom(self, index):
         """
@@ -142,4 +154,4 @@ class DomainWidget:
             del self.dom_list[index]
 
             # Refresh UI
-            self.rebuild_panels()
+            self.dom_panels.pop(index)
@@ -1,5 +1,6 @@
 import trioapi as ta
 import ipyvuetify as v
+from ....entry_index import add_read_object, delete_read_object, replace_entry
 
 
 class EcritureLectureSpecialWidget:
@@ -41,21 +42,19 @@ class EcritureLectureSpecialWidget:
         if not self.switch.v_model:
             # Add or change the value of the ecriturelecturespecial keyword
             if self.type is None:
-                ta.add_read_object(
+                add_read_object(
                     self.dataset, ta.trustify_gen_pyd.Ecriturelecturespecial(type="0")
                 )
                 self.type = "0"
             else:
-                index = ta.get_entry_index(
+                replace_entry(
                     self.dataset,
                     ta.trustify_gen_pyd.Ecriturelecturespecial(type=self.type),
-                )
-                self.dataset[index] = ta.trustify_gen_pyd.Ecriturelecturespecial(
-                    type="0"
+                    ta.trustify_gen_pyd.Ecriturelecturespecial(type="0"),
                 )
                 self.type = "0"
         # Delete the Ecriturelecturespecial keyword
         else:
-            ta.delete_read_object(
+            delete_read_object(
                 self.dataset, ta.trustify_gen_pyd.Ecriturelecturespecial(type=self.type)
             )
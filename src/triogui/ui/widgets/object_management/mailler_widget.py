@@ -1,6 +1,9 @@
 import ipyvuetify as v
 import trioapi as ta
+from ..history import ChangeHistory
 from ..object import ObjectWidget
+from ..panel_list import PanelList
+from ....entry_index import add_read_object, delete_read_object
 
 
 class MaillerWidget:
@@ -30,7 +33,7 @@ class MaillerWidget:
         self.btn_add_mailler.on_event("click", self.add_mailler)
 
         # Expansion panel container for all Mailler entries
-        self.mailler_panels = v.ExpansionPanels(
+        self.mailler_panels = PanelList(
             v_model=[],
             multiple=True,
             children=[],
@@ -49,48 +52,63 @@ class MaillerWidget:
         """
         Refresh the list of displayed Mailler expansion panels.
         """
-        self.mailler_panels.children = []
-
-        for i, mailler in enumerate(self.mailler_list):
-            # Delete button for the current mailler
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            btn_delete.on_event(
-                "click", lambda widget, event, data, idx=i: self.delete_mailler(idx)
-            )
-
-            # Header row with label and delete action
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Maille"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
-
-            # Panel content uses ObjectWidget to render the mailler fields
-            panel_content = ObjectWidget.show_widget(
-                mailler,
-                (ta.trustify_gen_pyd.Mailler, False),
-                mailler,
-                [],
-                [],
-            )
-
-            # Create the panel for this maille
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    v.ExpansionPanelContent(children=[panel_content]),
-                ]
-            )
-
-            self.mailler_panels.children = self.mailler_panels.children + [new_panel]
+        self.mailler_panels.reset(
+            self.create_panel(mailler) for mailler in self.mailler_list
+        )
+
+    def create_panel(self, mailler):
+        """
+        Creates the expansion panel of a mailler.
+
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.mailler_panels.new_key()
+
+        # Delete button for the current mailler
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_mailler(
+                self.mailler_panels.index(key)
+            ),
+        )
+
+        # Header row with label and delete action
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Maille"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
+
+        # Panel content uses ObjectWidget to render the mailler fields
+        panel_content = ObjectWidget.show_widget(
+            mailler,
+            (ta.trustify_gen_pyd.Mailler, False),
+            mailler,
+            [],
+            ChangeHistory(mailler),
+        )
+
+        # Create the panel for this maille
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                v.ExpansionPanelContent(children=[panel_content]),
+            ]
+        )
+
+        return key, new_panel
 
     def add_mailler(self, widget, event, data):
         """
@@ -98,8 +116,8 @@ class MaillerWidget:
         """
         new_maille = ta.trustify_gen_pyd.Mailler()
         self.mailler_list.append(new_maille)
-        ta.add_read_object(self.dataset, new_maille)
-        self.rebuild_panels()
+        add_read_object(self.dataset, new_maille)
+        self.mailler_panels.append(*self.create_panel(self.mailler_list[-1]))
 
     def delete_mailler(self, index):
         """
@@ -107,7 +125,7 @@ class MaillerWidget:
         """
         if 0 <= index < len(self.mailler_list):
             if self.mailler_list[index] is not None:
-                ta.delete_read_object(self.dataset, self.mailler_list[index])
+                delete_read_object(self.dataset, self.mailler_list[index])
 
             del self.mailler_list[index]
-            self.rebuild_panels()
+            self.mailler_panels.pop(index)
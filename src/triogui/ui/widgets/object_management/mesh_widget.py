@@ -1,6 +1,9 @@
 import ipyvuetify as v
 import trioapi as ta
+from ..history import ChangeHistory
 from ..object import ObjectWidget
+from ..panel_list import PanelList
+from ....entry_index import add_read_object, delete_read_object, replace_entry
 
 
 class MeshWidget:
@@ -26,7 +29,7 @@ class MeshWidget:
         self.dataset = dataset
 
         # Create container for all mesh panels
-        self.mesh_panels = v.ExpansionPanels(
+        self.mesh_panels = PanelList(
             v_model=[],
             multiple=True,
             children=[],
@@ -63,87 +66,97 @@ class MeshWidget:
         Rebuilds all mesh expansion panels, including selection dropdown,
         documentation, and mesh-specific fields.
         """
-        self.mesh_panels.children = []
-
-        for i, mesh in enumerate(self.mesh_list):
-            # Dropdown to select mesh type
-            new_select_type_mesh = v.Select(
-                items=self.mesh_with_doc,
-                label="Type of the mesh",
-                v_model=None,
-            )
+        self.mesh_panels.reset(self.create_panel(mesh) for mesh in self.mesh_list)
 
-            # Info box to display documentation of the selected mesh type
-            doc_display = v.Alert(
-                children=["Select an element to see its documentation"],
-                type="info",
-                outlined=True,
-                class_="text-body-2 pa-2 mt-2",
-                style_="white-space: pre-wrap;",
-            )
+    def create_panel(self, mesh):
+        """
+        Creates the expansion panel of a mesh.
 
-            # Pre-fill UI if mesh is already selected
-            if mesh is not None:
-                mesh_type_name = type(mesh).__name__
-                new_select_type_mesh.v_model = mesh_type_name
-                doc_display.children = [self.doc_dict.get(mesh_type_name)]
-                panel_content = [
-                    new_select_type_mesh,
-                    doc_display,
-                    ObjectWidget.show_widget(
-                        mesh, (type(mesh), False), mesh, [], [], True
-                    ),
-                ]
-            else:
-                panel_content = [new_select_type_mesh, doc_display]
-
-            # Delete button for the current mesh
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            btn_delete.on_event(
-                "click", lambda widget, event, data, idx=i: self.delete_mesh(idx)
-            )
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.mesh_panels.new_key()
 
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Mesh"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
+        # Dropdown to select mesh type
+        new_select_type_mesh = v.Select(
+            items=self.mesh_with_doc,
+            label="Type of the mesh",
+            v_model=None,
+        )
 
-            # Create expansion panel for this mesh
-            expansion_panel_content = v.ExpansionPanelContent(children=panel_content)
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    expansion_panel_content,
-                ]
-            )
+        # Info box to display documentation of the selected mesh type
+        doc_display = v.Alert(
+            children=["Select an element to see its documentation"],
+            type="info",
+            outlined=True,
+            class_="text-body-2 pa-2 mt-2",
+            style_="white-space: pre-wrap;",
+        )
 
-            # Event listener for mesh type selection to update the panel content
-            new_select_type_mesh.observe(
-                lambda change,
-                idx=i,
-                select=new_select_type_mesh,
-                content=expansion_panel_content: self.change_class(
-                    change, idx, select, content, doc_display
+        # Pre-fill UI if mesh is already selected
+        if mesh is not None:
+            mesh_type_name = type(mesh).__name__
+            new_select_type_mesh.v_model = mesh_type_name
+            doc_display.children = [self.doc_dict.get(mesh_type_name)]
+            panel_content = [
+                new_select_type_mesh,
+                doc_display,
+                ObjectWidget.show_widget(
+                    mesh, (type(mesh), False), mesh, [], ChangeHistory(mesh), True
                 ),
-                "v_model",
-            )
+            ]
+        else:
+            panel_content = [new_select_type_mesh, doc_display]
+
+        # Delete button for the current mesh
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_mesh(self.mesh_panels.index(key)),
+        )
 
-            # Event listener for doc update
-            new_select_type_mesh.observe(
-                lambda change, display=doc_display: self.update_doc(change, display),
-                "v_model",
-            )
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Mesh"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
+
+        # Create expansion panel for this mesh
+        expansion_panel_content = v.ExpansionPanelContent(children=panel_content)
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                expansion_panel_content,
+            ]
+        )
 
-            self.mesh_panels.children = self.mesh_panels.children + [new_panel]
+        # Event listener for mesh type selection to update the panel content
+        new_select_type_mesh.observe(
+            lambda change,
+            select=new_select_type_mesh,
+            content=expansion_panel_content: self.change_class(
+                change, self.mesh_panels.index(key), select, content, doc_display
+            ),
+            "v_model",
+        )
+
+        # Event listener for doc update
+        new_select_type_mesh.observe(
+            lambda change, display=doc_display: self.update_doc(change, display),
+            "v_model",
+        )
+
+        return key, new_panel
 
     def update_doc(self, change, display_widget):
         """
@@ -159,7 +172,7 @@ class MeshWidget:
         Add a new (empty) mesh entry to the list.
         """
         self.mesh_list.append(None)
-        self.rebuild_panels()
+        self.mesh_panels.append(*self.create_panel(self.mesh_list[-1]))
 
     def delete_mesh(self, index):
         """
@@ -167,9 +180,9 @@ class MeshWidget:
         """
         if 0 <= index < len(self.mesh_list):
             if self.mesh_list[index] is not None:
-                ta.delete_read_object(self.dataset, self.mesh_list[index])
+                delete_read_object(self.dataset, self.mesh_list[index])
             del self.mesh_list[index]
-            self.rebuild_panels()
+            self.mesh_panels.pop(index)
 
     def change_class(
         self, change, index, select_widget, expansion_panel_content, doc_display
@@ -186,10 +199,9 @@ class MeshWidget:
             self.mesh_list[index] = new_obj
 
             if old_obj is None:
-                ta.add_read_object(self.dataset, new_obj)
+                add_read_object(self.dataset, new_obj)
             else:
-                obj_index = ta.get_entry_index(self.dataset, old_obj)
-                self.dataset.entries[obj_index] = new_obj
+                replace_entry(self.dataset, old_obj, new_obj)
 
             # Display widget fields for the new mesh class
             widgets = ObjectWidget.show_widget(
@@ -197,7 +209,7 @@ class MeshWidget:
                 (type(new_obj), False),
                 new_obj,
                 [],
-                [],
+                ChangeHistory(new_obj),
                 True,
             )
 
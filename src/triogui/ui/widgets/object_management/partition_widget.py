@@ -1,6 +1,9 @@
 import ipyvuetify as v
 import trioapi as ta
+from ..history import ChangeHistory
 from ..object import ObjectWidget
+from ..panel_list import PanelList
+from ....entry_index import add_read_object, delete_read_object
 
 
 class PartitionWidget:
@@ -24,7 +27,7 @@ class PartitionWidget:
         self.dataset = dataset
 
         # Panel to hold all partition items
-        self.partition_panels = v.ExpansionPanels(
+        self.partition_panels = PanelList(
             v_model=[],
             multiple=True,
             children=[],
@@ -48,51 +51,64 @@ class PartitionWidget:
         """
         Reconstructs the UI panels for all current partitions.
         """
-        self.partition_panels.children = []
-
-        for i, partition in enumerate(self.partition_list):
-            # Delete button
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            btn_delete.on_event(
-                "click", lambda widget, event, data, idx=i: self.delete_partition(idx)
-            )
-
-            # Header content with title and delete button
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Partition"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
-
-            # Expansion panel for this Partition
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    v.ExpansionPanelContent(
-                        children=[
-                            ObjectWidget.show_widget(
-                                partition,
-                                (ta.trustify_gen_pyd.Partition, False),
-                                partition,
-                                [],
-                                [],
-                            )
-                        ]
-                    ),
-                ]
-            )
-
-            self.partition_panels.children = self.partition_panels.children + [
-                new_panel
+        self.partition_panels.reset(
+            self.create_panel(partition) for partition in self.partition_list
+        )
+
+    def create_panel(self, partition):
+        """
+        Creates the expansion panel of a partition.
+
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.partition_panels.new_key()
+
+        # Delete button
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_partition(
+                self.partition_panels.index(key)
+            ),
+        )
+
+        # Header content with title and delete button
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Partition"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
+
+        # Expansion panel for this Partition
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                v.ExpansionPanelContent(
+                    children=[
+                        ObjectWidget.show_widget(
+                            partition,
+                            (ta.trustify_gen_pyd.Partition, False),
+                            partition,
+                            [],
+                            ChangeHistory(partition),
+                        )
+                    ]
+                ),
             ]
+        )
+
+        return key, new_panel
 
     def add_partition(self, widget, event, data):
         """
@@ -100,8 +116,8 @@ class PartitionWidget:
         """
         new_partition = ta.trustify_gen_pyd.Partition()
         self.partition_list.append(new_partition)
-        ta.add_read_object(self.dataset, new_partition)
-        self.rebuild_panels()
+        add_read_object(self.dataset, new_partition)
+        self.partition_panels.append(*self.create_panel(self.partition_list[-1]))
 
     def delete_partition(self, index):
         """
@@ -110,6 +126,6 @@ class PartitionWidget:
         if 0 <= index < len(self.partition_list):
             partition_to_delete = self.partition_list[index]
             if partition_to_delete is not None:
-                ta.delete_read_object(self.dataset, partition_to_delete)
+                delete_read_object(self.dataset, partition_to_delete)
             del self.partition_list[index]
-            self.rebuild_panels()
+            self.partition_panels.pop(index)
@@ -1,5 +1,9 @@
 import ipyvuetify as v
 import trioapi as ta
+from .. import schema
+from ..panel_list import PanelList
+from ..debounce import observe_debounced
+from ....dataset_view import get_view
 
 
 class ProblemWidget:
@@ -33,16 +37,12 @@ class ProblemWidget:
         self.dataset = dataset
 
         # Build list of available problem types and associated docs
-        self.pb_with_doc = []
-        self.doc_dict = {}
-        for pb in ta.get_subclass("Pb_base"):
-            pb_name = pb.__name__
-            pb_doc = pb.__doc__
-            self.pb_with_doc.append({"text": f"{pb_name} - {pb_doc}", "value": pb_name})
-            self.doc_dict[pb_name] = pb_doc
+        pb_index = schema.get_subclass_index("Pb_base")
+        self.pb_with_doc = pb_index.items
+        self.doc_dict = pb_index.docs
 
         # UI container for all problem panels
-        self.pb_panels = v.ExpansionPanels(v_model=[], multiple=True, children=[])
+        self.pb_panels = PanelList(v_model=[], multiple=True, children=[])
 
         # Add button to create new problems
         self.btn_add_pb = v.Btn(children="Add a problem")
@@ -58,84 +58,96 @@ class ProblemWidget:
         Rebuilds the UI panels for all declared problems in pb_list.
         Each panel allows editing the name and type of the problem.
         """
-        self.pb_panels.children = []
-
-        for i, pb in enumerate(self.pb_list):
-            # Name field
-            new_name_pb = v.TextField(
-                label="Name of the problem",
-                outlined=True,
-                v_model=pb[0],
-            )
-
-            # Type selector
-            new_select_pb = v.Select(
-                items=self.pb_with_doc,
-                label="Type of the problem",
-                v_model=type(pb[1]).__name__ if pb[1] else None,
-            )
-
-            # Documentation viewer
-            doc_display = v.Alert(
-                children=["Select an element to see its documentation"]
-                if pb[1] is None
-                else [self.doc_dict.get(new_select_pb.v_model)],
-                type="info",
-                outlined=True,
-                class_="text-body-2 pa-2 mt-2",
-                style_="white-space: pre-wrap;",
-            )
-
-            # Delete button
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            btn_delete.on_event(
-                "click", lambda widget, event, data, idx=i: self.delete_pb(idx)
-            )
-
-            # Header layout
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Problem"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
-
-            # Full panel content
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    v.ExpansionPanelContent(
-                        children=[new_name_pb, new_select_pb, doc_display]
-                    ),
-                ]
-            )
-
-            self.pb_panels.children = self.pb_panels.children + [new_panel]
-
-            # Observers for user edits
-            new_name_pb.observe(
-                lambda change, idx=i, name=new_name_pb: self.update_menu(
-                    change, idx, name, new_select_pb
-                ),
-                "v_model",
-            )
-            new_select_pb.observe(
-                lambda change, idx=i, select=new_select_pb: self.update_menu(
-                    change, idx, new_name_pb, select
+        self.pb_panels.reset(self.create_panel(pb) for pb in self.pb_list)
+
+    def create_panel(self, pb):
+        """
+        Creates the expansion panel of a problem.
+
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.pb_panels.new_key()
+
+        # Name field
+        new_name_pb = v.TextField(
+            label="Name of the problem",
+            outlined=True,
+            v_model=pb[0],
+        )
+
+        # Type selector
+        new_select_pb = v.Select(
+            items=self.pb_with_doc,
+            label="Type of the problem",
+            v_model=type(pb[1]).__name__ if pb[1] else None,
+        )
+
+        # Documentation viewer
+        doc_display = v.Alert(
+            children=["Select an element to see its documentation"]
+            if pb[1] is None
+            else [self.doc_dict.get(new_select_pb.v_model)],
+            type="info",
+            outlined=True,
+            class_="text-body-2 pa-2 mt-2",
+            style_="white-space: pre-wrap;",
+        )
+
+        # Delete button
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_pb(self.pb_panels.index(key)),
+        )
+
+        # Header layout
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Problem"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
+
+        # Full panel content
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                v.ExpansionPanelContent(
+                    children=[new_name_pb, new_select_pb, doc_display]
                 ),
-                "v_model",
-            )
-            new_select_pb.observe(
-                lambda change, display=doc_display: self.update_doc(change, display),
-                "v_model",
-            )
+            ]
+        )
+
+        # Observers for user edits
+        debouncer = observe_debounced(
+            new_name_pb,
+            lambda change, name=new_name_pb: self.update_menu(
+                change, self.pb_panels.index(key), name, new_select_pb
+            ),
+        )
+        self.pb_panels.on_remove(key, debouncer.cancel)
+        new_select_pb.observe(
+            lambda change, select=new_select_pb: self.update_menu(
+                change, self.pb_panels.index(key), new_name_pb, select
+            ),
+            "v_model",
+        )
+        new_select_pb.observe(
+            lambda change, display=doc_display: self.update_doc(change, display),
+            "v_model",
+        )
+
+        return key, new_panel
 
     def update_doc(self, change, display_widget):
         """
@@ -180,7 +192,7 @@ class ProblemWidget:
         Adds a new empty problem entry to the list.
         """
         self.pb_list.append([None, None])
-        self.rebuild_panels()
+        self.pb_panels.append(*self.create_panel(self.pb_list[-1]))
 
     def delete_pb(self, index):
         """
@@ -190,5 +202,6 @@ class ProblemWidget:
             if self.pb_list[index][0] in self.dataset._declarations:
                 ta.delete_object(self.dataset, self.pb_list[index][0])
             del self.pb_list[index]
+            get_view(self.dataset).invalidate()
             self.ds_callback(self.dataset)  # Callback to update the menu of the app
-            self.rebuild_panels()
+            self.pb_panels.pop(index)
@@ -1,6 +1,9 @@
 import ipyvuetify as v
 import trioapi as ta
+from ..history import ChangeHistory
 from ..object import ObjectWidget
+from ..panel_list import PanelList
+from ....entry_index import add_read_object, delete_read_object
 
 
 class ScatterWidget:
@@ -24,7 +27,7 @@ class ScatterWidget:
         self.dataset = dataset
 
         # Container for scatter panels
-        self.scatter_panels = v.ExpansionPanels(
+        self.scatter_panels = PanelList(
             v_model=[],
             multiple=True,
             children=[],
@@ -47,49 +50,64 @@ class ScatterWidget:
         """
         Rebuilds all expansion panels for the current scatter list.
         """
-        self.scatter_panels.children = []
-
-        for i, scatter in enumerate(self.scatter_list):
-            # Delete button for each scatter item
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            btn_delete.on_event(
-                "click", lambda widget, event, data, idx=i: self.delete_scatter(idx)
-            )
-
-            # Header layout
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Scatter"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
-
-            # Scatter object editor panel using ObjectWidget.show_widget
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    v.ExpansionPanelContent(
-                        children=[
-                            ObjectWidget.show_widget(
-                                scatter,
-                                (ta.trustify_gen_pyd.Scatter, False),
-                                scatter,
-                                [],
-                                [],
-                            )
-                        ]
-                    ),
-                ]
-            )
-
-            self.scatter_panels.children = self.scatter_panels.children + [new_panel]
+        self.scatter_panels.reset(
+            self.create_panel(scatter) for scatter in self.scatter_list
+        )
+
+    def create_panel(self, scatter):
+        """
+        Creates the expansion panel of a scatter.
+
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.scatter_panels.new_key()
+
+        # Delete button for each scatter item
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_scatter(
+                self.scatter_panels.index(key)
+            ),
+        )
+
+        # Header layout
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Scatter"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
+
+        # Scatter object editor panel using ObjectWidget.show_widget
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                v.ExpansionPanelContent(
+                    children=[
+                        ObjectWidget.show_widget(
+                            scatter,
+                            (ta.trustify_gen_pyd.Scatter, False),
+                            scatter,
+                            [],
+                            ChangeHistory(scatter),
+                        )
+                    ]
+                ),
+            ]
+        )
+
+        return key, new_panel
 
     def add_scatter(self, widget, event, data):
         """
@@ -97,8 +115,8 @@ class ScatterWidget:
         """
         new_scatter = ta.trustify_gen_pyd.Scatter()
         self.scatter_list.append(new_scatter)
-        ta.add_read_object(self.dataset, new_scatter)
-        self.rebuild_panels()
+        add_read_object(self.dataset, new_scatter)
+        self.scatter_panels.append(*self.create_panel(self.scatter_list[-1]))
 
     def delete_scatter(self, index):
         """
@@ -106,6 +124,6 @@ class ScatterWidget:
         """
         if 0 <= index < len(self.scatter_list):
             if self.scatter_list[index] is not None:
-                ta.delete_read_object(self.dataset, self.scatter_list[index])
+                delete_read_object(self.dataset, self.scatter_list[index])
             del self.scatter_list[index]
-            self.rebuild_panels()
+            self.scatter_panels.pop(index)
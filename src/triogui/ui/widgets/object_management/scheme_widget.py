@@ -1,5 +1,9 @@
 import ipyvuetify as v
 import trioapi as ta
+from .. import schema
+from ..panel_list import PanelList
+from ..debounce import observe_debounced
+from ....dataset_view import get_view
 
 
 class SchemeWidget:
@@ -31,22 +35,16 @@ class SchemeWidget:
         self.dataset = dataset
 
         # UI: expansion panels for each scheme
-        self.sch_panels = v.ExpansionPanels(
+        self.sch_panels = PanelList(
             v_model=[],
             multiple=True,
             children=[],
         )
 
         # Build list of available scheme types and their docstrings
-        self.sch_with_doc = []
-        self.doc_dict = {}
-        for sch in ta.get_subclass("Schema_temps_base"):
-            sch_name = sch.__name__
-            sch_doc = sch.__doc__
-            self.sch_with_doc.append(
-                {"text": f"{sch_name} - {sch_doc}", "value": sch_name}
-            )
-            self.doc_dict[sch_name] = sch_doc
+        sch_index = schema.get_subclass_index("Schema_temps_base")
+        self.sch_with_doc = sch_index.items
+        self.doc_dict = sch_index.docs
 
         # Button to add a new scheme
         self.btn_add_sch = v.Btn(children="Add a scheme")
@@ -62,88 +60,100 @@ class SchemeWidget:
         """
         Clears and rebuilds the expansion panels for each scheme in the list.
         """
-        self.sch_panels.children = []
-
-        for i, sch in enumerate(self.sch_list):
-            # Input for scheme name
-            new_name_sch = v.TextField(
-                label="Name of the scheme",
-                outlined=True,
-                v_model=sch[0],
-            )
-
-            # Dropdown for selecting scheme type
-            new_select_sch = v.Select(
-                items=self.sch_with_doc,
-                label="Type of the scheme",
-                v_model=type(sch[1]).__name__,
-            )
-
-            # Documentation viewer
-            doc_display = v.Alert(
-                children=["Select an element to see its documentation"]
-                if sch[1] is None
-                else [self.doc_dict.get(new_select_sch.v_model)],
-                type="info",
-                outlined=True,
-                class_="text-body-2 pa-2 mt-2",
-                style_="white-space: pre-wrap;",
-            )
-
-            # Delete button
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            btn_delete.on_event(
-                "click", lambda widget, event, data, idx=i: self.delete_sch(idx)
-            )
-
-            # Panel header row
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Scheme"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
-
-            # Full panel with header and form content
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    v.ExpansionPanelContent(
-                        children=[
-                            new_name_sch,
-                            new_select_sch,
-                            doc_display,
-                        ]
-                    ),
-                ]
-            )
-
-            self.sch_panels.children = self.sch_panels.children + [new_panel]
-
-            # Observe name and type changes
-            new_name_sch.observe(
-                lambda change, idx=i, name=new_name_sch: self.update_menu(
-                    change, idx, name, new_select_sch
-                ),
-                "v_model",
-            )
-            new_select_sch.observe(
-                lambda change, idx=i, select=new_select_sch: self.update_menu(
-                    change, idx, new_name_sch, select
+        self.sch_panels.reset(self.create_panel(sch) for sch in self.sch_list)
+
+    def create_panel(self, sch):
+        """
+        Creates the expansion panel of a scheme.
+
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.sch_panels.new_key()
+
+        # Input for scheme name
+        new_name_sch = v.TextField(
+            label="Name of the scheme",
+            outlined=True,
+            v_model=sch[0],
+        )
+
+        # Dropdown for selecting scheme type
+        new_select_sch = v.Select(
+            items=self.sch_with_doc,
+            label="Type of the scheme",
+            v_model=type(sch[1]).__name__,
+        )
+
+        # Documentation viewer
+        doc_display = v.Alert(
+            children=["Select an element to see its documentation"]
+            if sch[1] is None
+            else [self.doc_dict.get(new_select_sch.v_model)],
+            type="info",
+            outlined=True,
+            class_="text-body-2 pa-2 mt-2",
+            style_="white-space: pre-wrap;",
+        )
+
+        # Delete button
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_sch(self.sch_panels.index(key)),
+        )
+
+        # Panel header row
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Scheme"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
+
+        # Full panel with header and form content
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                v.ExpansionPanelContent(
+                    children=[
+                        new_name_sch,
+                        new_select_sch,
+                        doc_display,
+                    ]
                 ),
-                "v_model",
-            )
-            new_select_sch.observe(
-                lambda change, display=doc_display: self.update_doc(change, display),
-                "v_model",
-            )
+            ]
+        )
+
+        # Observe name and type changes
+        debouncer = observe_debounced(
+            new_name_sch,
+            lambda change, name=new_name_sch: self.update_menu(
+                change, self.sch_panels.index(key), name, new_select_sch
+            ),
+        )
+        self.sch_panels.on_remove(key, debouncer.cancel)
+        new_select_sch.observe(
+            lambda change, select=new_select_sch: self.update_menu(
+                change, self.sch_panels.index(key), new_name_sch, select
+            ),
+            "v_model",
+        )
+        new_select_sch.observe(
+            lambda change, display=doc_display: self.update_doc(change, display),
+            "v_model",
+        )
+
+        return key, new_panel
 
     def update_doc(self, change, display_widget):
         """
@@ -184,7 +194,7 @@ class SchemeWidget:
         Adds a new empty scheme entry.
         """
         self.sch_list.append([None, None])
-        self.rebuild_panels()
+        self.sch_panels.append(*self.create_panel(self.sch_list[-1]))
 
     def delete_sch(self, index):
         """
@@ -194,5 +204,6 @@ class SchemeWidget:
             if self.sch_list[index][0] in self.dataset._declarations:
                 ta.delete_object(self.dataset, self.sch_list[index][0])
             del self.sch_list[index]
+            get_view(self.dataset).invalidate()
             self.ds_callback(self.dataset)  # Callback to update the menu of the app
-            self.rebuild_panels()
+            self.sch_panels.pop(index)
@@ -1,5 +1,8 @@
 import trioapi as ta
 import ipyvuetify as v
+from ..panel_list import PanelList
+from ....entry_index import delete_read_object
+from ..debounce import observe_debounced
 
 
 class SolveWidget:
@@ -22,7 +25,7 @@ class SolveWidget:
         self.dataset = dataset
 
         # UI: expansion panels for each solve entry
-        self.solve_panels = v.ExpansionPanels(
+        self.solve_panels = PanelList(
             v_model=[],
             multiple=True,
             children=[],
@@ -44,52 +47,68 @@ class SolveWidget:
         """
         Rebuilds the expansion panels based on the current solve_list.
         """
-        self.solve_panels.children = []
-
-        for i, solve_item in enumerate(self.solve_list):
-            # Text input for problem name to solve
-            text_field = v.TextField(
-                label="Problem to solve",
-                v_model=solve_item if solve_item is not None else "",
-                placeholder="Enter problem name to solve",
-            )
-
-            # Delete button for each solve entry
-            btn_delete = v.Btn(
-                children=[v.Icon(children="mdi-delete")],
-                icon=True,
-                color="red",
-                small=True,
-            )
-            btn_delete.on_event(
-                "click", lambda widget, event, data, idx=i: self.delete_solve(idx)
-            )
-
-            # Panel header with label and delete button
-            header_content = v.Row(
-                children=[
-                    v.Col(children=["Solve Problem"], cols=10),
-                    v.Col(children=[btn_delete], cols=2, class_="text-right"),
-                ],
-                no_gutters=True,
-                align="center",
-            )
-
-            # Create expansion panel with header and text input content
-            new_panel = v.ExpansionPanel(
-                children=[
-                    v.ExpansionPanelHeader(children=[header_content]),
-                    v.ExpansionPanelContent(children=[text_field]),
-                ]
-            )
-
-            self.solve_panels.children = self.solve_panels.children + [new_panel]
-
-            # Observe changes in the text field to update solve_list and dataset
-            text_field.observe(
-                lambda change, idx=i: self.change_solve_dataset(change, idx),
-                "v_model",
-            )
+        self.solve_panels.reset(
+            self.create_panel(solve_item) for solve_item in self.solve_list
+        )
+
+    def create_panel(self, solve_item):
+        """
+        Creates the expansion panel of a solve entry.
+
+        Returns
+        -------
+        tuple:
+            The key of the panel in the panel list and the panel.
+        """
+        key = self.solve_panels.new_key()
+
+        # Text input for problem name to solve
+        text_field = v.TextField(
+            label="Problem to solve",
+            v_model=solve_item if solve_item is not None else "",
+            placeholder="Enter problem name to solve",
+        )
+
+        # Delete button for each solve entry
+        btn_delete = v.Btn(
+            children=[v.Icon(children="mdi-delete")],
+            icon=True,
+            color="red",
+            small=True,
+        )
+        btn_delete.on_event(
+            "click",
+            lambda widget, event, data: self.delete_solve(self.solve_panels.index(key)),
+        )
+
+        # Panel header with label and delete button
+        header_content = v.Row(
+            children=[
+                v.Col(children=["Solve Problem"], cols=10),
+                v.Col(children=[btn_delete], cols=2, class_="text-right"),
+            ],
+            no_gutters=True,
+            align="center",
+        )
+
+        # Create expansion panel with header and text input content
+        new_panel = v.ExpansionPanel(
+            children=[
+                v.ExpansionPanelHeader(children=[header_content]),
+                v.ExpansionPanelContent(children=[text_field]),
+            ]
+        )
+
+        # Observe changes in the text field to update solve_list and dataset
+        debouncer = observe_debounced(
+            text_field,
+            lambda change: self.change_solve_dataset(
+                change, self.solve_panels.index(key)
+            ),
+        )
+        self.solve_panels.on_remove(key, debouncer.cancel)
+
+        return key, new_panel
 
     def change_solve_dataset(self, change, index=None):
         """
@@ -100,7 +119,7 @@ class SolveWidget:
 
         if old_item is not None:
             # Remove previous solve object from dataset
-            ta.delete_read_object(self.dataset, ta.trustify_gen_pyd.Solve(pb=old_item))
+            delete_read_object(self.dataset, ta.trustify_gen_pyd.Solve(pb=old_item))
 
         # Update solve list with new problem name or None
         self.solve_list[index] = new_value
@@ -114,7 +133,7 @@ class SolveWidget:
         Adds a new empty problem solve entry.
         """
         self.solve_list.append(None)
-        self.rebuild_panels()
+        self.solve_panels.append(*self.create_panel(self.solve_list[-1]))
 
     def delete_solve(self, index):
         """
@@ -122,8 +141,8 @@ class SolveWidget:
         """
         if 0 <= index < len(self.solve_list):
             if self.solve_list[index] is not None:
-                ta.delete_read_object(
+                delete_read_object(
                     self.dataset, ta.trustify_gen_pyd.Solve(pb=self.solve_list[index])
                 )
             del self.solve_list[index]
-            self.rebuild_panels()
+            self.solve_panels.pop(index)
@@ -0,0 +1,95 @@
+import itertools
+
+import ipyvuetify as v
+
+
+class PanelList(v.ExpansionPanels):
+    def __init__(self, **kwargs):
+        """
+        Expansion panels whose children are identified by a key.
+
+        Each modification of the panels (reset, append, extend, removal) is sent to the browser
+        in a single update of the children and of the opened panels, whatever the number of
+        panels. ipywidgets sends a list trait whole, so several panels should be added at once
+        with `extend` rather than one by one. Callbacks of a panel should refer to it by
+        its key, from `new_key`, and look up its current position with `index` when called, so
+        that they stay valid when other panels are added or removed. Callbacks which may still
+        run after their panel is removed, such as debounced edits, are cancelled through
+        `on_remove`.
+
+        ----------
+        Parameters
+
+        kwargs:
+            Arguments of v.ExpansionPanels.
+        """
+        super().__init__(**kwargs)
+        self.keys = []
+        self.key_counter = itertools.count()
+        self.removal_callbacks = {}
+
+    def new_key(self):
+        """Return a key not used by any panel of the list."""
+        return next(self.key_counter)
+
+    def on_remove(self, key, callback):
+        """Call `callback` without argument when the panel of `key` is removed."""
+        self.removal_callbacks.setdefault(key, []).append(callback)
+
+    def removed(self, key):
+        """Call the removal callbacks of the panel of `key`."""
+        for callback in self.removal_callbacks.pop(key, []):
+            callback()
+
+    def index(self, key):
+        """Return the current position of the panel of `key`."""
+        return self.keys.index(key)
+
+    def reset(self, keyed_panels):
+        """
+        Replace all the panels.
+
+        ----------
+        Parameters
+
+        keyed_panels: iterable
+            The (key, panel) pairs, in display order.
+        """
+        keyed_panels = list(keyed_panels)
+        for key in self.keys:
+            self.removed(key)
+        self.keys = [key for key, _ in keyed_panels]
+        with self.hold_sync():
+            self.children = [panel for _, panel in keyed_panels]
+            self.v_model = [] if self.multiple else None
+
+    def append(self, key, panel):
+        """Add a panel at the end of the list."""
+        self.extend([(key, panel)])
+
+    def extend(self, keyed_panels):
+        """Add the (key, panel) pairs of `keyed_panels` at the end of the list."""
+        keyed_panels = list(keyed_panels)
+        self.keys.extend(key for key, _ in keyed_panels)
+        self.children = [*self.children, *(panel for _, panel in keyed_panels)]
+
+    def pop(self, index):
+        """Remove the panel at `index` and return its key."""
+        key = self.keys.pop(index)
+        self.removed(key)
+        children = list(self.children)
+        del children[index]
+        # The panels after the removed one move up, and stay opened if they were
+        opened = self.v_model
+        if isinstance(opened, list):
+            opened = [i - (i > index) for i in opened if i != index]
+        elif isinstance(opened, int):
+            opened = None if opened == index else opened - (opened > index)
+        with self.hold_sync():
+            self.children = children
+            self.v_model = opened
+        return key
+
+    def remove(self, key):
+        """Remove the panel of `key`."""
+        self.pop(self.index(key))
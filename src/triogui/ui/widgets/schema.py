@@ -0,0 +1,188 @@
+import functools
+from typing import Literal, NamedTuple, Union, get_args, get_origin
+
+import trioapi as ta
+
+
+class FieldDescriptor(NamedTuple):
+    """
+    Precomputed metadata of a field of a pydantic class of the dataset.
+
+    name: str
+        Name of the attribute.
+
+    true_type: type
+        Type of the attribute (or of its items for a list) as given by `ta.extract_true_type`.
+
+    is_list: bool
+        True if the attribute is a list of `true_type`.
+
+    optional: bool
+        True if the attribute is declared with an Optional.
+
+    description: str
+        Description of the attribute.
+
+    synonyms: tuple
+        Synonyms of the attribute in the TRUST syntax.
+
+    kind: str
+        Kind of widget used to edit the attribute, see `widget_kind`.
+
+    inline: bool
+        True if the attribute is displayed in a card with its input rather than in an expansion panel.
+    """
+
+    name: str
+    true_type: type
+    is_list: bool
+    optional: bool
+    description: str
+    synonyms: tuple
+    kind: str
+    inline: bool
+
+    @property
+    def expected_type(self):
+        """Tuple (true type, is list) expected by `ObjectWidget.show_widget`."""
+        return (self.true_type, self.is_list)
+
+
+class SubclassIndex(NamedTuple):
+    """
+    Subclasses of a class of the dataset, ready to be displayed in a select.
+
+    classes: tuple
+        The subclasses, as returned by `ta.get_subclass`.
+
+    items: list
+        The {"text", "value"} items of a vuetify select, the text containing the docstring.
+
+    docs: dict
+        The docstring of each class, by class name.
+    """
+
+    classes: tuple
+    items: list
+    docs: dict
+
+
+def _build_index(classes):
+    return SubclassIndex(
+        classes=tuple(classes),
+        items=[
+            {"text": f"{cls.__name__} - {cls.__doc__}", "value": cls.__name__}
+            for cls in classes
+        ],
+        docs={cls.__name__: cls.__doc__ for cls in classes},
+    )
+
+
+@functools.cache
+def get_subclass_index(base_name):
+    """
+    Return the `SubclassIndex` of the subclasses of the class named `base_name`.
+
+    The class hierarchy is only scanned the first time, the index is then shared by every
+    widget proposing a choice between these subclasses. The items must not be modified.
+    """
+    return _build_index(ta.get_subclass(base_name))
+
+
+@functools.cache
+def get_select_index(model_class):
+    """
+    Return the `SubclassIndex` of the types proposed for a polymorphic attribute of type `model_class`.
+
+    These are its subclasses, preceded by the class itself if it has attributes.
+    """
+    classes = get_subclass_index(model_class.__name__).classes
+    if get_fields(model_class) != ():
+        classes = (model_class,) + classes
+    return _build_index(classes)
+
+
+def has_subclasses(model_class):
+    """Return True if the dataset defines subclasses of `model_class` (polymorphic field)."""
+    return get_subclass_index(model_class.__name__).classes != ()
+
+
+def warm_up(base_names=("Pb_base", "Schema_temps_base", "Discretisation_base")):
+    """Build the subclass indexes used by the home page before the first user needs them."""
+    for base_name in base_names:
+        get_subclass_index(base_name)
+
+
+@functools.cache
+def widget_kind(true_type, is_list):
+    """
+    Return the kind of widget used to edit a value of type `true_type`.
+
+    `ObjectWidget.show_widget` dispatches on it, it is computed once per type.
+
+    Returns
+    -------
+    str:
+        One of "str", "float", "int", "bool", "literal", "list", "select" (polymorphic object),
+        "object" (nested object) or "unknown".
+    """
+    if is_list:
+        return "list"
+    if get_origin(true_type) is Literal:
+        return "literal"
+    if true_type in (str, float, int, bool):
+        return true_type.__name__
+    if hasattr(true_type, "model_fields"):
+        return "select" if has_subclasses(true_type) else "object"
+    return "unknown"
+
+
+def _class_synonyms(model_class):
+    # Synonyms may be declared as a class variable or as a private attribute
+    private = getattr(model_class, "__private_attributes__", {})
+    if "_synonyms" in private:
+        return private["_synonyms"].get_default() or {}
+    return getattr(model_class, "_synonyms", {})
+
+
+@functools.cache
+def get_fields(model_class):
+    """
+    Return the descriptors of the fields of a pydantic class.
+
+    The result only depends on the class, it is computed once per process and shared by every
+    widget rendering an instance of it.
+
+    Parameters
+    ----------
+    model_class: type
+        The pydantic class.
+
+    Returns
+    -------
+    tuple:
+        The `FieldDescriptor` of each field, in declaration order.
+    """
+    synonyms = _class_synonyms(model_class)
+    fields = []
+    for name, info in model_class.model_fields.items():
+        true_type, is_list = ta.extract_true_type(info)
+        fields.append(
+            FieldDescriptor(
+                name=name,
+                true_type=true_type,
+                is_list=is_list,
+                optional=get_origin(info.annotation) is Union,
+                description=info.description,
+                synonyms=tuple(synonyms.get(name, ())),
+                kind=widget_kind(true_type, is_list),
+                inline=true_type in (str, float, bool, int)
+                or get_origin(true_type) is Literal,
+            )
+        )
+    return tuple(fields)
+
+
+def literal_choices(true_type):
+    """Return the list of values allowed by a Literal type."""
+    return list(get_args(true_type))
@@ -1,12 +1,11 @@
 import ipyvuetify as v
 import trioapi as ta
+from . import schema
 from .object import ObjectWidget
 
 
 class SelectWidget:
-    def __init__(
-        self, current_object, initial_type, read_object, key_path, change_list
-    ):
+    def __init__(self, current_object, initial_type, read_object, key_path, history):
         """
         Widget definition for Select Widget
 
@@ -25,8 +24,8 @@ class SelectWidget:
         key_path: list
             List representing the path of the current object from the initial read object
 
-        change_list: list
-            List of all states the read object has passed through
+        history: ChangeHistory
+            The undo history of the read object
 
         This widget is composed by a select to choose the type and then display widget for each attributes of the type
         """
@@ -35,40 +34,29 @@ class SelectWidget:
         self.current_object = current_object
         self.read_object = read_object
         self.key_path = key_path
-        self.change_list = change_list
+        self.history = history
         self.initial_type = initial_type
 
-        self.element_with_doc = []
-        self.doc_dict = {}
-        for element in ta.get_subclass(initial_type.__name__):
-            element_name = element.__name__
-            element_doc = element.__doc__
-            self.element_with_doc.append(
-                {"text": f"{element_name} - {element_doc}", "value": element_name}
-            )
-            self.doc_dict[element_name] = element_doc
+        # The base type can be selected itself if it has attributes
+        has_fields = schema.get_fields(initial_type) != ()
 
-        if initial_type.model_fields != {}:
-            self.element_with_doc = [
-                {
-                    "text": f"{initial_type.__name__} - {initial_type.__doc__}",
-                    "value": initial_type.__name__,
-                }
-            ] + self.element_with_doc
-            self.doc_dict[initial_type.__name__] = initial_type.__doc__
+        # Types available for the attribute, with their documentation
+        select_index = schema.get_select_index(initial_type)
+        self.element_with_doc = select_index.items
+        self.doc_dict = select_index.docs
 
         # We define the select with a v_model adapted
         self.select = v.Select(
             items=self.element_with_doc,
             label="Type of the attribute",
             v_model=type(current_object).__name__
-            if current_object is not None or initial_type.model_fields == {}
+            if current_object is not None or not has_fields
             else None,
         )
 
         self.doc_display = v.Alert(
             children=["Select an element to see its documentation"]
-            if current_object is None or initial_type.model_fields == {}
+            if current_object is None or not has_fields
             else [self.doc_dict[type(current_object).__name__]],
             type="info",
             outlined=True,
@@ -87,7 +75,7 @@ class SelectWidget:
                     (type(self.current_object), False),
                     self.read_object,
                     self.key_path,
-                    self.change_list,
+                    self.history,
                     True,
                 )
             ]
@@ -129,7 +117,7 @@ class SelectWidget:
                 (ta.trustify_gen_pyd.__dict__[selected], False),
                 self.read_object,
                 self.key_path,
-                self.change_list,
+                self.history,
                 True,
             )
             self.widget_container.children = [widgets]
@@ -0,0 +1,11 @@
+import pytest
+
+from triogui import batch
+
+
+@pytest.mark.parametrize("jobs", ["0", "-2", "two"])
+def test_invalid_job_count_is_rejected(jobs, capsys):
+    with pytest.raises(SystemExit) as error:
+        batch.main(["case.data", "-j", jobs])
+    assert error.value.code == 2
+    assert "--jobs" in capsys.readouterr().err
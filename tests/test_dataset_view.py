@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("trioapi")
+
+from triogui import dataset_view  # noqa: E402
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    calls = []
+
+    def get_read_pb(dataset):
+        calls.append(dataset)
+        return [[name, None] for name in dataset.entries]
+
+    monkeypatch.setitem(dataset_view.ROLES, "read_pb", get_read_pb)
+    return calls
+
+
+def test_role_is_extracted_once_and_copied(extractions):
+    dataset = SimpleNamespace(entries=["pb_1"])
+    view = dataset_view.get_view(dataset)
+
+    view.get("read_pb")[0][0] = "modified"
+    assert view.get("read_pb") == [["pb_1", None]]
+    assert len(extractions) == 1
+    assert dataset_view.get_view(dataset) is view
+
+
+def test_in_place_edit_is_read_after_invalidate(extractions):
+    dataset = SimpleNamespace(entries=["pb_1"])
+    view = dataset_view.get_view(dataset)
+    assert view.get("read_pb") == [["pb_1", None]]
+
+    dataset.entries.append("pb_2")
+    view.invalidate()
+    assert view.get("read_pb") == [["pb_1", None], ["pb_2", None]]
+    assert len(extractions) == 2
+
+
+def test_extractor_reads_the_view_of_the_dataset(extractions):
+    dataset = SimpleNamespace(entries=["pb_1"])
+    extract = dataset_view.extractor("read_pb")
+    assert extract(dataset) == extract(dataset) == [["pb_1", None]]
+    assert len(extractions) == 1
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+v = pytest.importorskip("ipyvuetify")
+
+from triogui.ui.widgets.debounce import observe_debounced  # noqa: E402
+from triogui.ui.widgets.panel_list import PanelList  # noqa: E402
+
+
+def type_in(field, *values):
+    for value in values:
+        field.v_model = value
+
+
+def test_changes_are_committed_immediately_without_event_loop():
+    field = v.TextField(v_model="a")
+    changes = []
+    observe_debounced(field, changes.append, delay=50)
+
+    type_in(field, "ab", "abc")
+
+    assert [(change["old"], change["new"]) for change in changes] == [
+        ("a", "ab"),
+        ("ab", "abc"),
+    ]
+
+
+def test_burst_is_committed_once():
+    async def edit():
+        field = v.TextField(v_model="a")
+        changes = []
+        observe_debounced(field, changes.append, delay=10)
+        type_in(field, "ab", "abc")
+        assert changes == []
+        await asyncio.sleep(0.05)
+        return changes
+
+    changes = asyncio.run(edit())
+    assert [(change["old"], change["new"]) for change in changes] == [("a", "abc")]
+
+
+def test_blur_commits_the_pending_change():
+    async def edit():
+        field = v.TextField(v_model="a")
+        changes = []
+        observe_debounced(field, changes.append, delay=1000)
+        type_in(field, "ab")
+        field.fire_event("blur")
+        return changes
+
+    changes = asyncio.run(edit())
+    assert [change["new"] for change in changes] == ["ab"]
+
+
+@pytest.mark.parametrize("remove", ["pop", "reset"])
+def test_pending_change_of_a_removed_panel_is_dropped(remove):
+    async def edit():
+        panels = PanelList(children=[])
+        key = panels.new_key()
+        field = v.TextField(v_model="a")
+        changes = []
+        debouncer = observe_debounced(
+            field, lambda change: changes.append(panels.index(key)), delay=10
+        )
+        panels.on_remove(key, debouncer.cancel)
+        panels.append(key, v.ExpansionPanel(children=[]))
+
+        type_in(field, "ab")
+        if remove == "pop":
+            panels.pop(0)
+        else:
+            panels.reset([])
+        await asyncio.sleep(0.05)
+        field.fire_event("blur")
+        return changes
+
+    assert asyncio.run(edit()) == []
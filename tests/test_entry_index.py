@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("trioapi")
+
+from pydantic import BaseModel  # noqa: E402
+
+from triogui import entry_index  # noqa: E402
+
+
+class Entry(BaseModel):
+    name: str
+
+
+def make_dataset(count):
+    entries = [Entry(name=f"entry_{position}") for position in range(count)]
+    # Each entry is read by a declaration holding its position
+    declarations = {
+        entry.name: [entry, position] for position, entry in enumerate(entries)
+    }
+    return SimpleNamespace(entries=entries, _declarations=declarations)
+
+
+def assert_indexed(dataset):
+    for position, entry in enumerate(dataset.entries):
+        assert entry_index.get_entry_index(dataset, entry) == position
+        assert entry_index.get_entry_index(dataset, entry.model_copy()) == position
+
+
+def test_lookup_after_delete():
+    dataset = make_dataset(10)
+    entry_index.get_index(dataset)
+
+    entry_index.delete_entry(dataset, 2)
+    entry_index.delete_read_object(dataset, Entry(name="entry_6"))
+
+    assert [entry.name for entry in dataset.entries] == [
+        f"entry_{position}" for position in (0, 1, 3, 4, 5, 7, 8, 9)
+    ]
+    assert_indexed(dataset)
+
+
+def test_delete_updates_the_positions_of_the_declarations():
+    by_position = make_dataset(5)
+    by_object = make_dataset(5)
+
+    entry_index.delete_entry(by_position, 1)
+    entry_index.delete_read_object(by_object, Entry(name="entry_1"))
+
+    for dataset in (by_position, by_object):
+        positions = {
+            name: declaration[1]
+            for name, declaration in dataset._declarations.items()
+            if name != "entry_1"
+        }
+        assert positions == {"entry_0": 0, "entry_2": 1, "entry_3": 2, "entry_4": 3}
+        for name, position in positions.items():
+            assert dataset.entries[position].name == name
+
+
+def test_lookup_after_replace():
+    dataset = make_dataset(5)
+    new_entry = Entry(name="new")
+
+    entry_index.replace_entry(dataset, Entry(name="entry_3"), new_entry)
+
+    assert dataset.entries[3] is new_entry
+    assert_indexed(dataset)
+    with pytest.raises(ValueError):
+        entry_index.get_entry_index(dataset, Entry(name="entry_3"))
+
+
+def test_lookup_after_add(monkeypatch):
+    dataset = make_dataset(5)
+    entry_index.get_index(dataset)
+
+    # trioapi inserts the read objects before the last entry
+    def add_read_object(dataset, obj):
+        dataset.entries.insert(len(dataset.entries) - 1, obj)
+
+    monkeypatch.setattr(
+        entry_index.ta, "add_read_object", add_read_object, raising=False
+    )
+    added = Entry(name="added")
+    entry_index.add_read_object(dataset, added)
+
+    assert entry_index.get_entry_index(dataset, added) == 4
+    assert_indexed(dataset)
+
+
+def test_lookup_after_untracked_changes():
+    dataset = make_dataset(5)
+    entry_index.get_index(dataset)
+
+    dataset.entries.insert(0, Entry(name="first"))
+    del dataset.entries[3]
+
+    assert_indexed(dataset)
+
+
+def test_lookup_after_many_deletes():
+    dataset = make_dataset(2 * entry_index.MAX_DRIFT + 10)
+    entry_index.get_index(dataset)
+
+    for _ in range(entry_index.MAX_DRIFT + 5):
+        entry_index.delete_entry(dataset, 0)
+
+    assert_indexed(dataset)
+
+
+def test_missing_entry():
+    dataset = make_dataset(3)
+    with pytest.raises(ValueError):
+        entry_index.delete_read_object(dataset, Entry(name="missing"))
+    assert len(dataset.entries) == 3
@@ -0,0 +1,66 @@
+import concurrent.futures
+import os
+
+import pytest
+
+pytest.importorskip("trioapi")
+
+from triogui import examples  # noqa: E402
+
+
+@pytest.fixture
+def directory(tmp_path):
+    directory = tmp_path / "data"
+    directory.mkdir()
+    (directory / "cavity.data").write_text(
+        "# Lid driven cavity #\ndimension 2\npb_hydraulique pb\n"
+    )
+    (directory / "notes.txt").write_text("not a dataset")
+    return directory
+
+
+def test_scan_example(directory):
+    (info,) = examples.build_index(directory)
+    assert info == examples.ExampleInfo(
+        name="cavity",
+        size=(directory / "cavity.data").stat().st_size,
+        dimension=2,
+        problems=["pb_hydraulique"],
+        summary="Lid driven cavity",
+    )
+    assert info.matches(["cavity", "2d"])
+    assert not info.matches(["3d"])
+
+
+def test_index_is_read_back(directory, tmp_path):
+    path = tmp_path / "cache" / "index.json"
+    index = examples.build_index(directory)
+    examples.write_index(index, directory, path)
+    assert examples.read_index(directory, path) == index
+    assert os.listdir(path.parent) == ["index.json"]
+
+
+def test_index_is_invalidated_by_an_edit_in_place(directory, tmp_path):
+    path = tmp_path / "cache" / "index.json"
+    examples.write_index(examples.build_index(directory), directory, path)
+
+    # Same size, the modification time of the directory is not changed
+    dataset = directory / "cavity.data"
+    stat = dataset.stat()
+    dataset.write_text(dataset.read_text().replace("dimension 2", "dimension 3"))
+    os.utime(dataset, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert examples.read_index(directory, path) is None
+
+
+def test_concurrent_writes(directory, tmp_path):
+    path = tmp_path / "cache" / "index.json"
+    index = examples.build_index(directory)
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        for future in [
+            executor.submit(examples.write_index, index, directory, path)
+            for _ in range(32)
+        ]:
+            future.result()
+    assert examples.read_index(directory, path) == index
+    assert os.listdir(path.parent) == ["index.json"]
@@ -0,0 +1,94 @@
+import pytest
+
+pytest.importorskip("ipyvuetify")
+pytest.importorskip("trioapi")
+
+from pydantic import BaseModel  # noqa: E402
+
+from triogui.ui.widgets.history import (  # noqa: E402
+    ChangeHistory,
+    ItemIndex,
+    WidgetRegistry,
+)
+
+
+class Item(BaseModel):
+    value: str = ""
+
+
+class Holder(BaseModel):
+    name: str = ""
+    items: list[Item] = []
+
+
+def test_undo_reverts_each_change():
+    holder = Holder(name="a", items=[Item(value="1")])
+    history = ChangeHistory(holder)
+
+    history.set_value(["name"], "b")
+    history.set_value(["items", 0, "value"], "2")
+    history.insert_item(["items"], 1, Item(value="3"))
+    history.remove_item(["items"], 0)
+    assert holder == Holder(name="b", items=[Item(value="3")])
+
+    changes = [history.undo() for _ in range(4)]
+    assert [change.kind for change in changes] == ["insert", "remove", "set", "set"]
+    assert holder == Holder(name="a", items=[Item(value="1")])
+    assert history.undo() is None
+
+
+def test_unchanged_values_are_not_recorded():
+    history = ChangeHistory(Holder(name="a"))
+    history.set_value(["name"], "a")
+    with history.replaying():
+        history.set_value(["name"], "b")
+    assert len(history) == 0
+
+
+def test_history_depth_is_bounded():
+    holder = Holder()
+    history = ChangeHistory(holder, max_depth=3)
+    for value in "abcde":
+        history.set_value(["name"], value)
+    while history.undo() is not None:
+        pass
+    assert holder.name == "b"
+
+
+def test_refresh_calls_the_deepest_registered_handler():
+    registry = WidgetRegistry()
+    called = []
+    registry.register(["items"], lambda change: called.append("items"))
+    registry.register(["items", 0], lambda change: called.append("item"))
+
+    history = ChangeHistory(Holder(items=[Item()]))
+    assert registry.refresh(history.set_value(["items", 0, "value"], "x"))
+    assert registry.refresh(history.insert_item(["items"], 1, Item()))
+    assert not registry.refresh(history.set_value(["name"], "x"))
+    assert called == ["item", "items"]
+
+
+def test_shift_items_follows_insertions_and_removals():
+    registry = WidgetRegistry()
+    handlers = {index: (lambda change: None) for index in range(3)}
+    for index, handler in handlers.items():
+        registry.register(["items", index, "value"], handler)
+
+    registry.unregister(["items", 1])
+    registry.shift_items(["items"], 2, -1)
+    assert registry.get(["items", 1, "value"]) is handlers[2]
+    assert registry.get(["items", 2, "value"]) is None
+
+    registry.shift_items(["items"], 0, 1)
+    assert registry.get(["items", 1, "value"]) is handlers[0]
+    assert registry.get(["items", 2, "value"]) is handlers[2]
+
+
+def test_item_index_is_read_when_the_path_is_used():
+    registry = WidgetRegistry()
+    index = ItemIndex(2)
+    handler = lambda change: None  # noqa: E731
+    registry.register(["items", index], handler)
+    index.value = 0
+    assert registry.get(["items", 2]) is handler
+    assert registry.get(["items", index]) is None
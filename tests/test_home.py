@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+v = pytest.importorskip("ipyvuetify")
+pytest.importorskip("trioapi")
+
+from triogui.ui.widgets.debounce import observe_debounced  # noqa: E402
+from triogui.ui.widgets.home import HomeSection  # noqa: E402
+from triogui.ui.widgets.panel_list import PanelList  # noqa: E402
+
+
+class NameWidget:
+    def __init__(self, names, dataset):
+        # A section widget editing the names of a shared list with debounced fields
+        self.names = names
+        self.dataset = dataset
+        self.panels = PanelList(children=[])
+        self.fields = []
+        for name in names:
+            key = self.panels.new_key()
+            field = v.TextField(v_model=name)
+            debouncer = observe_debounced(
+                field,
+                lambda change, key=key: self.rename(self.panels.index(key), change),
+                delay=10,
+            )
+            self.panels.on_remove(key, debouncer.cancel)
+            self.panels.append(key, v.ExpansionPanel(children=[]))
+            self.fields.append(field)
+        self.content = [self.panels]
+
+    def rename(self, index, change):
+        self.names[index] = change["new"]
+
+
+def test_pending_edit_is_not_committed_to_the_next_dataset():
+    async def load():
+        names = []
+        section = HomeSection(
+            "Names", "name_widget", lambda dataset: dataset, NameWidget, names
+        )
+        section.update(["pb_1"])
+        section.show()
+        section.widget.fields[0].v_model = "edited"
+
+        assert section.update(["pb_2"])
+        await asyncio.sleep(0.05)
+        return names
+
+    assert asyncio.run(load()) == ["pb_2"]
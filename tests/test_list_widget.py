@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip("ipyvuetify")
+pytest.importorskip("trioapi")
+
+from pydantic import BaseModel  # noqa: E402
+
+from triogui.ui.widgets.history import ChangeHistory  # noqa: E402
+from triogui.ui.widgets.object import ObjectWidget  # noqa: E402
+
+
+class Holder(BaseModel):
+    items: list[str]
+
+
+def item_panels(content):
+    toolbar, expand_panel, add_button = content.children
+    return expand_panel.children[0].children
+
+
+def text_field(panel):
+    header, body = panel.children
+    if not body.children:
+        header.fire_event("click")
+    return body.children[0].children[0]
+
+
+def test_delete_then_edit_next_item_then_undo():
+    holder = Holder(items=["1", "2", "3", "4", "5"])
+    history = ChangeHistory(holder)
+    content = ObjectWidget.show_widget(
+        holder.items, (str, True), holder, ["items"], history
+    )
+    panels = item_panels(content)
+    field = text_field(panels[4])
+
+    # Delete item 4, without the click.stop modifier the browser also clicks its header
+    removed = panels[3]
+    delete_button = removed.children[0].children[0].children[2].children[0]
+    delete_button.fire_event("click")
+    removed.children[0].fire_event("click")
+    assert holder.items == ["1", "2", "3", "5"]
+    assert item_panels(content)[3] is panels[4]
+
+    # Edit item 5, now at index 3
+    field.v_model = "edited"
+    field.fire_event("blur")
+    assert holder.items[3] == "edited"
+
+    change = history.undo()
+    with history.replaying():
+        assert history.widgets.refresh(change)
+    assert holder.items[3] == "5"
+    assert field.v_model == "5"
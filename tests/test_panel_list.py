@@ -0,0 +1,52 @@
+import pytest
+
+v = pytest.importorskip("ipyvuetify")
+
+from triogui.ui.widgets.panel_list import PanelList  # noqa: E402
+
+
+def make_panels(count):
+    panels = PanelList(v_model=[], multiple=True, children=[])
+    keyed_panels = [
+        (panels.new_key(), v.ExpansionPanel(children=[])) for _ in range(count)
+    ]
+    panels.reset(keyed_panels)
+    return panels, keyed_panels
+
+
+def test_keys_follow_the_panels():
+    panels, keyed_panels = make_panels(3)
+    added = [(panels.new_key(), v.ExpansionPanel(children=[])) for _ in range(2)]
+    panels.extend(added)
+
+    key, panel = keyed_panels[1]
+    panels.remove(key)
+
+    remaining = keyed_panels[:1] + keyed_panels[2:] + added
+    assert panels.children == [panel for _, panel in remaining]
+    for position, (key, _) in enumerate(remaining):
+        assert panels.index(key) == position
+
+
+def test_opened_panels_stay_opened_after_a_removal():
+    panels, keyed_panels = make_panels(4)
+    panels.v_model = [0, 1, 3]
+
+    panels.pop(1)
+
+    assert panels.v_model == [0, 2]
+
+
+def test_removal_callbacks():
+    panels, keyed_panels = make_panels(3)
+    removed = []
+    for key, _ in keyed_panels:
+        panels.on_remove(key, lambda key=key: removed.append(key))
+
+    panels.pop(0)
+    assert removed == [keyed_panels[0][0]]
+
+    panels.v_model = [0]
+    panels.reset([])
+    assert removed == [key for key, _ in keyed_panels]
+    assert panels.v_model == []
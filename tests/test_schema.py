@@ -0,0 +1,49 @@
+from typing import ClassVar, Literal, Optional
+
+import pytest
+
+pytest.importorskip("trioapi")
+
+from pydantic import BaseModel  # noqa: E402
+
+from triogui.ui.widgets import schema  # noqa: E402
+
+
+class Nested(BaseModel):
+    value: Optional[float] = None
+
+
+class Model(BaseModel):
+    _synonyms: ClassVar[dict] = {"name": ["nom"]}
+
+    name: str
+    flag: Optional[bool] = None
+    choice: Literal["a", "b"] = "a"
+    nested: Optional[Nested] = None
+    items: list[Nested] = []
+
+
+def test_field_descriptors():
+    fields = {field.name: field for field in schema.get_fields(Model)}
+
+    assert {name: field.kind for name, field in fields.items()} == {
+        "name": "str",
+        "flag": "bool",
+        "choice": "literal",
+        "nested": "object",
+        "items": "list",
+    }
+    assert [name for name, field in fields.items() if field.inline] == [
+        "name",
+        "flag",
+        "choice",
+    ]
+    assert not fields["name"].optional and fields["flag"].optional
+    assert fields["items"].expected_type == (Nested, True)
+    assert fields["name"].synonyms == ("nom",)
+
+
+def test_descriptors_are_shared_and_immutable():
+    assert schema.get_fields(Model) is schema.get_fields(Model)
+    for field in schema.get_fields(Model):
+        assert isinstance(field.synonyms, tuple)